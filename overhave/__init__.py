@@ -2,6 +2,8 @@
 from overhave.admin import OverhaveAdminApp, overhave_app
 from overhave.api import create_overhave_api as overhave_api
 from overhave.base_settings import AuthorizationStrategy as OverhaveAuthorizationStrategy
+from overhave.base_settings import DataBaseEntryPoint as OverhaveDBEntryPoint
+from overhave.base_settings import DataBasePoolProfile as OverhaveDBPoolProfile
 from overhave.base_settings import DataBaseSettings as OverhaveDBSettings
 from overhave.base_settings import LoggingSettings as OverhaveLoggingSettings
 from overhave.base_settings import OverhaveAuthorizationSettings
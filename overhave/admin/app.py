@@ -1,10 +1,12 @@
 import logging
+import mimetypes
 import typing
 from http import HTTPStatus
 from pathlib import Path
 
 import flask
 import werkzeug
+import werkzeug.exceptions
 
 from overhave import db
 from overhave.admin.flask import FlaskLoginManager, get_flask_admin, get_flask_app
@@ -45,6 +47,7 @@ def overhave_app(factory: IAdminFactory) -> OverhaveAdminApp:  # noqa: C901
     _prepare_factory(factory)
     flask_app = _resolved_app(factory=factory, template_dir=template_dir)
     flask_app.config["FILES_DIR"] = files_dir
+    factory.report_manager.start_reports_cache()
 
     @flask_app.teardown_request
     def remove_session(exception: BaseException | None) -> None:
@@ -65,7 +68,16 @@ def overhave_app(factory: IAdminFactory) -> OverhaveAdminApp:  # noqa: C901
                         flask.Response, flask.redirect(f"/reports/{request}", code=HTTPStatus.TEMPORARY_REDIRECT)
                     )
                 return flask.abort(HTTPStatus.NOT_FOUND)
-        return flask.send_from_directory(factory.context.file_settings.tmp_reports_dir, request)
+        factory.report_manager.touch_report(request)
+        try:
+            return flask.send_from_directory(factory.context.file_settings.tmp_reports_dir, request)
+        except werkzeug.exceptions.NotFound:
+            if not factory.report_manager.serves_from_s3:
+                raise
+        content = factory.report_manager.get_s3_report_file(request)
+        if content is None:
+            return flask.abort(HTTPStatus.NOT_FOUND)
+        return flask.Response(content, mimetype=mimetypes.guess_type(request)[0] or "application/octet-stream")
 
     @flask_app.route("/emulations/<path:url>")
     def go_to_emulation(url: str) -> werkzeug.Response:
@@ -3,10 +3,12 @@ from typing import Any
 import flask
 from flask import redirect, request, url_for
 from flask_login import current_user
-from wtforms import PasswordField
+from wtforms import Form, PasswordField
 
 from overhave import db
 from overhave.admin.views.base import ModelViewConfigured
+from overhave.factory import get_admin_factory
+from overhave.transport import RedisChannel
 
 
 class AccessModelView(ModelViewConfigured):
@@ -34,6 +36,19 @@ class UserView(AccessModelView):
     column_searchable_list = ("login",)
     form_excluded_columns = ("created_at",)
 
+    @staticmethod
+    def _publish_user_change(login: str) -> None:
+        # API caches authorized users, so it should know about changed and deleted ones
+        if not get_admin_factory().redis_producer.publish(RedisChannel.SYSTEM_USERS, login):
+            flask.flash("Problems with Redis service! API could use outdated user for a while.", category="error")
+
+    def after_model_change(self, form: Form, model: db.UserRole, is_created: bool) -> None:
+        if not is_created:
+            self._publish_user_change(model.login)
+
+    def after_model_delete(self, model: db.UserRole) -> None:
+        self._publish_user_change(model.login)
+
 
 class GroupView(AccessModelView):
     """View for application group access management."""
@@ -8,6 +8,7 @@ from typing import Any, Callable, cast
 import flask
 import werkzeug
 from flask_admin import expose
+from flask_admin.actions import action
 from flask_admin.model import InlineFormAdmin
 from flask_login import current_user
 from markupsafe import Markup
@@ -211,7 +212,32 @@ class FeatureView(ModelViewConfigured, FactoryViewUtilsMixin):
             raise ValidationError("Only feature author or administrator could delete feature!")
 
     @staticmethod
-    def _run_test(data: dict[str, Any], rendered: werkzeug.Response) -> werkzeug.Response:
+    def _start_test_runs(factory: IAdminFactory, test_run_ids: list[int]) -> bool:
+        if not factory.context.admin_settings.consumer_based:
+            proxy_manager = get_proxy_manager()
+            test_execution_factory = get_test_execution_factory()
+            proxy_manager.clear_factory()
+            proxy_manager.set_factory(test_execution_factory)
+            for test_run_id in test_run_ids:
+                factory.threadpool.apply_async(test_execution_factory.test_executor.execute_test, args=(test_run_id,))
+            return True
+        tasks = [TestRunTask(data=TestRunData(test_run_id=test_run_id)) for test_run_id in test_run_ids]
+        return all(factory.redis_producer.add_tasks(tasks))
+
+    @action("run", "Run", "Are you sure you want to run scenarios of selected features?")
+    def action_run(self, ids: list[str]) -> None:
+        factory = get_admin_factory()
+        scenario_ids = factory.scenario_storage.get_scenario_ids(feature_ids=[int(x) for x in ids])
+        test_run_ids = factory.test_run_storage.create_testruns_bulk(
+            scenario_ids=list(scenario_ids.values()), executed_by=current_user.login
+        )
+        if not self._start_test_runs(factory=factory, test_run_ids=test_run_ids):
+            flask.flash("Problems with Redis service! Some of TestRunTasks have not been sent.", category="error")
+            return
+        flask.flash(f"Started {len(test_run_ids)} test runs.")
+
+    @classmethod
+    def _run_test(cls, data: dict[str, Any], rendered: werkzeug.Response) -> werkzeug.Response:
         scenario_id = data.get(f"{_SCENARIO_PREFIX}-id")
         scenario_text = data.get(f"{_SCENARIO_PREFIX}-text")
         if not scenario_id or not scenario_text:
@@ -221,15 +247,7 @@ class FeatureView(ModelViewConfigured, FactoryViewUtilsMixin):
         with db.create_session() as session:
             scenario = factory.scenario_storage.scenario_model_by_id(session=session, scenario_id=int(scenario_id))
         test_run_id = factory.test_run_storage.create_testrun(scenario_id=scenario.id, executed_by=current_user.login)
-        if not factory.context.admin_settings.consumer_based:
-            proxy_manager = get_proxy_manager()
-            test_execution_factory = get_test_execution_factory()
-            proxy_manager.clear_factory()
-            proxy_manager.set_factory(test_execution_factory)
-            factory.threadpool.apply_async(get_test_execution_factory().test_executor.execute_test, args=(test_run_id,))
-        if factory.context.admin_settings.consumer_based and not factory.redis_producer.add_task(
-            TestRunTask(data=TestRunData(test_run_id=test_run_id))
-        ):
+        if not cls._start_test_runs(factory=factory, test_run_ids=[test_run_id]):
             flask.flash("Problems with Redis service! TestRunTask has not been sent.", category="error")
             return rendered
         logger.debug("Redirect to TestRun details view with test_run_id='%s'...", test_run_id)
@@ -1,7 +1,13 @@
+import logging
+from typing import Any
+
 import fastapi
+import redis
 
 from overhave.api.auth import get_authorized_user
+from overhave.api.deps import get_api_auth_settings, get_authorized_user_cache, get_redis_database
 from overhave.api.views import (
+    create_test_runs_bulk_handler,
     delete_testuser_handler,
     docs,
     emulation_run_list_handler,
@@ -18,6 +24,8 @@ from overhave.api.views import (
     testuser_list_handler,
     testuser_put_spec_handler,
 )
+from overhave.base_settings import DataBaseSettings
+from overhave.db import metadata
 from overhave.storage import (
     AuthToken,
     EmulationRunModel,
@@ -29,6 +37,8 @@ from overhave.storage import (
     TestUserSpecification,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def _get_tags_router() -> fastapi.APIRouter:
     tags_router = fastapi.APIRouter()
@@ -70,9 +80,13 @@ def _get_feature_router() -> fastapi.APIRouter:
         "/",
         get_features_handler,
         methods=["GET"],
-        response_model=list[FeatureModel],
+        response_model=list[FeatureModel] | list[dict[str, Any]],
         summary="Get list of Feature info",
-        description="Get list of feature info by `tag_id` or `tag_value`",
+        description=(
+            "Get list of feature info by `tag_id` or `tag_value` ordered by ID. Use `after_id` and `limit` for "
+            "keyset pagination and `fields` for projection of returned fields: when `fields` is set, "
+            "features contain only requested fields and `id`, other fields are omitted"
+        ),
     )
     return feature_router
 
@@ -95,6 +109,14 @@ def _get_testrun_router() -> fastapi.APIRouter:
         summary="Create TestRunTasks for Features by tag_value",
         description="Create TestRunTasks for Features by `tag_value`",
     )
+    test_run_router.add_api_route(
+        "/create/bulk",
+        create_test_runs_bulk_handler,
+        methods=["POST"],
+        response_model=list[str],
+        summary="Create TestRunTasks for Features by ids and tags",
+        description="Create TestRunTasks for Features by `feature_ids` and `tag_values` in one transaction",
+    )
     return test_run_router
 
 
@@ -169,8 +191,26 @@ def _get_auth_router() -> fastapi.APIRouter:
     return auth_router
 
 
+def _listen_system_users_changes() -> None:
+    if get_api_auth_settings().user_cache_max_size <= 0:
+        return
+    try:
+        get_authorized_user_cache().listen(get_redis_database())
+    except redis.exceptions.ConnectionError:
+        logger.exception("Could not listen system users changes, so authorized users will not be cached!")
+
+
+def _ensure_async_engine() -> None:
+    if metadata.has_async_engine:
+        return
+    logger.info("AsyncEngine is not bounded to MetaData, setting up it with default database settings...")
+    DataBaseSettings().setup_async_engine()
+
+
 def create_overhave_api() -> fastapi.FastAPI:
     app = fastapi.FastAPI()
+    app.add_event_handler("startup", _ensure_async_engine)
+    app.add_event_handler("startup", _listen_system_users_changes)
     auth_deps = (fastapi.Depends(get_authorized_user),)
 
     app.include_router(_get_tags_router(), dependencies=auth_deps, prefix="/feature/tags", tags=["feature_tags"])
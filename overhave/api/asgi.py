@@ -1,7 +1,9 @@
 from overhave.api.app import create_overhave_api
-from overhave.base_settings import DataBaseSettings, LoggingSettings
+from overhave.base_settings import DataBaseEntryPoint, DataBaseSettings, LoggingSettings
 
-DataBaseSettings().setup_engine()
+db_settings = DataBaseSettings()
+db_settings.setup_engine(DataBaseEntryPoint.API)
+db_settings.setup_async_engine()
 LoggingSettings().setup_logging()
 
 app = create_overhave_api()
@@ -0,0 +1,117 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+import walrus
+from redis.client import PubSub, PubSubWorkerThread
+from redis.exceptions import RedisError
+
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.storage import SystemUserModel
+from overhave.transport import RedisChannel
+
+logger = logging.getLogger(__name__)
+
+_LISTENER_SLEEP_SECONDS = 1.0
+
+
+class AuthorizedUserCache:
+    """Bounded in-process TTL cache of authorized system users by token subject.
+
+    Entries expire after ```ttl``` seconds, least recently used entries are evicted over ```max_size```.
+    Cache is cleared when any system user is changed or deleted, so users are cached only after
+    start of listening of these changes with :meth:`listen` and only while the subscription is alive.
+    Every clear increments :attr:`generation`, so users loaded before the clear are not cached by :meth:`put`.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        metric_container: BaseOverhaveMetricContainer,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._metric_container = metric_container
+        self._clock = clock
+        self._users: OrderedDict[str, tuple[float, SystemUserModel]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._listening = False
+        self._generation = 0
+        metric_container.track_api_auth_user_cache_size(self.__len__)
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    @property
+    def enabled(self) -> bool:
+        return self._listening and self._max_size > 0 and self._ttl > 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, login: str) -> SystemUserModel | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._users.get(login)
+            if entry is not None and entry[0] <= self._clock():
+                del self._users[login]
+                entry = None
+            if entry is not None:
+                self._users.move_to_end(login)
+        self._metric_container.request_api_auth_user_cache(hit=entry is not None)
+        if entry is None:
+            return None
+        return entry[1]
+
+    def put(self, user: SystemUserModel, generation: int) -> None:
+        """Cache user, which has been loaded after getting of :attr:`generation` equal to ```generation```."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._users[user.login] = (self._clock() + self._ttl, user)
+            self._users.move_to_end(user.login)
+            while len(self._users) > self._max_size:
+                self._users.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._users.clear()
+
+    def _on_system_user_change(self, message: dict[str, Any]) -> None:
+        logger.info("System user %s has been changed, clear cache of authorized users", message["data"])
+        self.clear()
+
+    def _on_listener_error(self, error: BaseException, pubsub: PubSub, thread: PubSubWorkerThread) -> None:
+        # changes could be missed during reconnection, so cached users are not trusted anymore
+        logger.warning("Error while listening of system users changes: %s", error)
+        self._listening = False
+        self.clear()
+        time.sleep(_LISTENER_SLEEP_SECONDS)
+        try:
+            # reconnection resubscribes to the channels, cache stays disabled until it succeeds
+            pubsub.ping()
+        except (RedisError, OSError):
+            logger.warning("Could not restore listening of system users changes, authorized users are not cached")
+            return
+        logger.info("Listening of system users changes has been restored")
+        self.clear()
+        self._listening = True
+
+    def listen(self, database: walrus.Database) -> PubSubWorkerThread:
+        """Start background listening of system users changes, which are published by admin."""
+        pubsub = database.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{RedisChannel.SYSTEM_USERS.value: self._on_system_user_change})
+        thread = pubsub.run_in_thread(
+            sleep_time=_LISTENER_SLEEP_SECONDS, daemon=True, exception_handler=self._on_listener_error
+        )
+        self._listening = True
+        return thread
@@ -5,9 +5,10 @@ from fastapi import security as fastapi_security
 from jose import JWTError
 
 from overhave import db
+from overhave.api.auth.cache import AuthorizedUserCache
 from overhave.api.auth.models import AUTH_HEADERS
 from overhave.api.auth.token import get_token_data
-from overhave.api.deps import get_api_auth_settings, get_system_user_storage
+from overhave.api.deps import get_api_auth_settings, get_authorized_user_cache, get_system_user_storage
 from overhave.api.settings import OverhaveApiAuthSettings
 from overhave.storage import ISystemUserStorage, SystemUserModel
 
@@ -18,6 +19,7 @@ def get_authorized_user(
     token: str = fastapi.Depends(oauth2_scheme),
     auth_settings: OverhaveApiAuthSettings = fastapi.Depends(get_api_auth_settings),
     storage: ISystemUserStorage = fastapi.Depends(get_system_user_storage),
+    user_cache: AuthorizedUserCache = fastapi.Depends(get_authorized_user_cache),
 ) -> SystemUserModel:
     creds_exception = fastapi.HTTPException(
         status_code=HTTPStatus.UNAUTHORIZED,
@@ -30,8 +32,14 @@ def get_authorized_user(
             raise creds_exception
     except JWTError:
         raise creds_exception
+    cached_user = user_cache.get(token_data.username)
+    if cached_user is not None:
+        return cached_user
+    generation = user_cache.generation
     with db.create_session() as session:
         user = storage.get_user_by_credits(session=session, login=token_data.username)
         if user is None:
             raise creds_exception
-        return SystemUserModel.model_validate(user)
+        user_model = SystemUserModel.model_validate(user)
+    user_cache.put(user_model, generation=generation)
+    return user_model
@@ -3,28 +3,28 @@ from pathlib import Path
 
 import walrus
 
+from overhave.api.auth.cache import AuthorizedUserCache
 from overhave.api.settings import OverhaveApiAuthSettings
-from overhave.entities import OverhaveEmulationSettings
 from overhave.metrics import get_common_metric_container
 from overhave.storage import (
+    AsyncEmulationStorage,
+    AsyncFeatureStorage,
+    AsyncFeatureTagStorage,
+    AsyncScenarioStorage,
+    AsyncTestRunStorage,
+    AsyncTestUserStorage,
     DraftStorage,
-    EmulationStorage,
-    FeatureStorage,
-    FeatureTagStorage,
     FeatureTypeStorage,
+    IAsyncEmulationStorage,
+    IAsyncFeatureStorage,
+    IAsyncFeatureTagStorage,
+    IAsyncScenarioStorage,
+    IAsyncTestRunStorage,
+    IAsyncTestUserStorage,
     IDraftStorage,
-    IEmulationStorage,
-    IFeatureStorage,
-    IFeatureTagStorage,
     IFeatureTypeStorage,
-    IScenarioStorage,
     ISystemUserStorage,
-    ITestRunStorage,
-    ITestUserStorage,
-    ScenarioStorage,
     SystemUserStorage,
-    TestRunStorage,
-    TestUserStorage,
 )
 from overhave.transport import EmulationTask, PublicationTask, RedisProducer, RedisStream, TestRunTask
 from overhave.transport.redis.deps import get_redis_settings, make_redis
@@ -46,43 +46,43 @@ def get_system_user_storage() -> ISystemUserStorage:
 
 
 @cache
-def get_feature_tag_storage() -> IFeatureTagStorage:
-    return FeatureTagStorage()
+def get_feature_type_storage() -> IFeatureTypeStorage:
+    return FeatureTypeStorage()
 
 
 @cache
-def get_scenario_storage() -> IScenarioStorage:
-    return ScenarioStorage()
+def get_draft_storage() -> IDraftStorage:
+    return DraftStorage()
 
 
 @cache
-def get_feature_type_storage() -> IFeatureTypeStorage:
-    return FeatureTypeStorage()
+def get_async_feature_tag_storage() -> IAsyncFeatureTagStorage:
+    return AsyncFeatureTagStorage()
 
 
 @cache
-def get_feature_storage() -> IFeatureStorage:
-    return FeatureStorage()
+def get_async_scenario_storage() -> IAsyncScenarioStorage:
+    return AsyncScenarioStorage()
 
 
 @cache
-def get_draft_storage() -> IDraftStorage:
-    return DraftStorage()
+def get_async_feature_storage() -> IAsyncFeatureStorage:
+    return AsyncFeatureStorage()
 
 
 @cache
-def get_test_user_storage() -> ITestUserStorage:
-    return TestUserStorage()
+def get_async_test_user_storage() -> IAsyncTestUserStorage:
+    return AsyncTestUserStorage()
 
 
 @cache
-def get_test_run_storage() -> ITestRunStorage:
-    return TestRunStorage()
+def get_async_test_run_storage() -> IAsyncTestRunStorage:
+    return AsyncTestRunStorage()
 
 
 @cache
-def get_emulation_storage() -> IEmulationStorage:
-    return EmulationStorage(OverhaveEmulationSettings())
+def get_async_emulation_storage() -> IAsyncEmulationStorage:
+    return AsyncEmulationStorage()
 
 
 @cache
@@ -103,3 +103,13 @@ def get_redis_producer() -> RedisProducer:
         database=get_redis_database(),
         metric_container=get_common_metric_container(),
     )
+
+
+@cache
+def get_authorized_user_cache() -> AuthorizedUserCache:
+    auth_settings = get_api_auth_settings()
+    return AuthorizedUserCache(
+        max_size=auth_settings.user_cache_max_size,
+        ttl=auth_settings.user_cache_ttl.total_seconds(),
+        metric_container=get_common_metric_container(),
+    )
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class TestRunsCreationRequest(BaseModel):
+    """Model for request of test runs creation by features IDs and tags."""
+
+    __test__ = False
+
+    feature_ids: list[int] = []
+    tag_values: list[str] = []
@@ -24,6 +24,10 @@ class OverhaveApiAuthSettings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
 
+    # Authorized users are cached by token subject, cache is disabled with zero size
+    user_cache_max_size: int = 1024
+    user_cache_ttl: timedelta = timedelta(minutes=1)
+
     @property
     def access_token_expire_timedelta(self) -> timedelta:
         return timedelta(minutes=self.access_token_expire_minutes)
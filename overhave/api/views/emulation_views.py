@@ -2,15 +2,15 @@ import logging
 
 import fastapi
 
-from overhave.api.deps import get_emulation_storage
-from overhave.storage import EmulationRunModel, IEmulationStorage
+from overhave.api.deps import get_async_emulation_storage
+from overhave.storage import EmulationRunModel, IAsyncEmulationStorage
 
 logger = logging.getLogger(__name__)
 
 
-def emulation_run_list_handler(
+async def emulation_run_list_handler(
     test_user_id: int,
-    emulation_storage: IEmulationStorage = fastapi.Depends(get_emulation_storage),
+    emulation_storage: IAsyncEmulationStorage = fastapi.Depends(get_async_emulation_storage),
 ) -> list[EmulationRunModel]:
     logger.info("Getting %s list with test_user_id=%s...", EmulationRunModel.__name__, test_user_id)
-    return emulation_storage.get_emulation_runs_by_test_user_id(test_user_id=test_user_id)
+    return await emulation_storage.get_emulation_runs_by_test_user_id(test_user_id=test_user_id)
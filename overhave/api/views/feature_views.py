@@ -1,28 +1,60 @@
 import logging
 from http import HTTPStatus
+from typing import Any
 
 import fastapi
+from fastapi.responses import JSONResponse
 
-from overhave.api.deps import get_feature_storage, get_feature_tag_storage
+from overhave.api.deps import get_async_feature_storage, get_async_feature_tag_storage
 from overhave.api.views.tags_views import tags_item_handler
-from overhave.storage import FeatureModel, IFeatureStorage, IFeatureTagStorage
+from overhave.storage import FeatureModel, IAsyncFeatureStorage, IAsyncFeatureTagStorage
 
 logger = logging.getLogger(__name__)
 
+FEATURES_MAX_LIMIT = 1000
 
-def get_features_handler(
-    tag_id: int | None = None,
-    tag_value: str | None = None,
-    feature_storage: IFeatureStorage = fastapi.Depends(get_feature_storage),
-    tag_storage: IFeatureTagStorage = fastapi.Depends(get_feature_tag_storage),
-) -> list[FeatureModel]:
+
+def _get_projection_fields(fields: str | None) -> set[str] | None:
+    if fields is None:
+        return None
+    field_names = {x.strip() for x in fields.split(",") if x.strip()}
+    unknown_fields = field_names.difference(FeatureModel.model_fields)
+    if unknown_fields:
+        raise fastapi.HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail=f"Unknown fields: {', '.join(sorted(unknown_fields))}"
+        )
+    # ID is always returned, because it is a cursor for the next page
+    return field_names | {"id"}
+
+
+async def _get_tag_id(tag_id: int | None, tag_value: str | None, tag_storage: IAsyncFeatureTagStorage) -> int:
     if tag_id is not None:
         logger.info("Getting %s by tag_id=%s...", FeatureModel.__name__, tag_id)
-        return feature_storage.get_features_by_tag(tag_id=tag_id)
+        return tag_id
     if tag_value is not None:
         logger.info("Getting %s by tag_value=%s...", FeatureModel.__name__, tag_value)
-        tag_model = tags_item_handler(value=tag_value, feature_tag_storage=tag_storage)
-        return feature_storage.get_features_by_tag(tag_id=tag_model.id)
+        tag_model = await tags_item_handler(value=tag_value, feature_tag_storage=tag_storage)
+        return tag_model.id
     raise fastapi.HTTPException(
         status_code=HTTPStatus.BAD_REQUEST, detail="'tag_id' or 'tag_value' query parameter should be set"
     )
+
+
+async def get_features_handler(
+    tag_id: int | None = None,
+    tag_value: str | None = None,
+    after_id: int | None = fastapi.Query(None, description="Return features with ID greater than `after_id`"),
+    limit: int | None = fastapi.Query(None, ge=1, le=FEATURES_MAX_LIMIT, description="Maximum count of features"),
+    fields: str | None = fastapi.Query(None, description="Comma-separated feature fields to return"),
+    feature_storage: IAsyncFeatureStorage = fastapi.Depends(get_async_feature_storage),
+    tag_storage: IAsyncFeatureTagStorage = fastapi.Depends(get_async_feature_tag_storage),
+) -> Any:
+    projection_fields = _get_projection_fields(fields)
+    features = await feature_storage.get_features_by_tag(
+        tag_id=await _get_tag_id(tag_id=tag_id, tag_value=tag_value, tag_storage=tag_storage),
+        after_id=after_id,
+        limit=limit,
+    )
+    if projection_fields is None:
+        return features
+    return JSONResponse([feature.model_dump(mode="json", include=projection_fields) for feature in features])
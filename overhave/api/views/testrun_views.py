@@ -1,24 +1,38 @@
+import logging
+from collections import defaultdict
 from http import HTTPStatus
 
 import fastapi
+from starlette.concurrency import run_in_threadpool
 
+from overhave.api.auth import get_authorized_user
 from overhave.api.deps import (
-    get_feature_storage,
-    get_feature_tag_storage,
+    get_async_feature_storage,
+    get_async_feature_tag_storage,
+    get_async_scenario_storage,
+    get_async_test_run_storage,
     get_redis_producer,
-    get_scenario_storage,
-    get_test_run_storage,
 )
+from overhave.api.models import TestRunsCreationRequest
 from overhave.api.views.tags_views import tags_item_handler
-from overhave.storage import IFeatureStorage, IFeatureTagStorage, IScenarioStorage, TestRunModel, TestRunStorage
+from overhave.storage import (
+    IAsyncFeatureStorage,
+    IAsyncFeatureTagStorage,
+    IAsyncScenarioStorage,
+    IAsyncTestRunStorage,
+    SystemUserModel,
+    TestRunModel,
+)
 from overhave.transport import RedisProducer, TestRunData, TestRunTask
 
+logger = logging.getLogger(__name__)
+
 
-def get_test_run_handler(
+async def get_test_run_handler(
     test_run_id: int,
-    test_run_storage: TestRunStorage = fastapi.Depends(get_test_run_storage),
+    test_run_storage: IAsyncTestRunStorage = fastapi.Depends(get_async_test_run_storage),
 ) -> TestRunModel:
-    test_run = test_run_storage.get_testrun_model(test_run_id)
+    test_run = await test_run_storage.get_testrun_model(test_run_id)
     if test_run is not None:
         return test_run
     raise fastapi.HTTPException(
@@ -26,24 +40,62 @@ def get_test_run_handler(
     )
 
 
-def run_tests_by_tag_handler(
+async def _send_test_run_tasks(redis_producer: RedisProducer, test_run_ids: list[int]) -> None:
+    tasks = [TestRunTask(data=TestRunData(test_run_id=x)) for x in test_run_ids]
+    results = await run_in_threadpool(redis_producer.add_tasks, tasks)
+    failed_ids = [test_run_id for test_run_id, result in zip(test_run_ids, results) if not result]
+    if failed_ids:
+        logger.error("TestRunTasks for test runs %s have not been sent!", failed_ids)
+
+
+async def run_tests_by_tag_handler(
     tag_value: str,
-    feature_storage: IFeatureStorage = fastapi.Depends(get_feature_storage),
-    tag_storage: IFeatureTagStorage = fastapi.Depends(get_feature_tag_storage),
-    scenario_storage: IScenarioStorage = fastapi.Depends(get_scenario_storage),
-    test_run_storage: TestRunStorage = fastapi.Depends(get_test_run_storage),
+    feature_storage: IAsyncFeatureStorage = fastapi.Depends(get_async_feature_storage),
+    tag_storage: IAsyncFeatureTagStorage = fastapi.Depends(get_async_feature_tag_storage),
+    scenario_storage: IAsyncScenarioStorage = fastapi.Depends(get_async_scenario_storage),
+    test_run_storage: IAsyncTestRunStorage = fastapi.Depends(get_async_test_run_storage),
     redis_producer: RedisProducer = fastapi.Depends(get_redis_producer),
 ) -> list[str]:
-    tag_model = tags_item_handler(value=tag_value, feature_tag_storage=tag_storage)
-    features = feature_storage.get_features_by_tag(tag_id=tag_model.id)
+    tag_model = await tags_item_handler(value=tag_value, feature_tag_storage=tag_storage)
+    features = await feature_storage.get_features_by_tag(tag_id=tag_model.id)
     if not features:
         raise fastapi.HTTPException(
             status_code=HTTPStatus.BAD_REQUEST, detail=f"Features with tag='{tag_value}' do not exist"
         )
-    test_run_ids: list[str] = []
+    scenario_ids = await scenario_storage.get_scenario_ids(feature_ids=[feature.id for feature in features])
+    scenario_ids_by_editor: dict[str, list[int]] = defaultdict(list)
     for feature in features:
-        scenario = scenario_storage.get_scenario_by_feature_id(feature.id)
-        test_run_id = test_run_storage.create_testrun(scenario_id=scenario.id, executed_by=feature.last_edited_by)
-        redis_producer.add_task(TestRunTask(data=TestRunData(test_run_id=test_run_id)))
-        test_run_ids.append(str(test_run_id))
-    return test_run_ids
+        if feature.id in scenario_ids:
+            scenario_ids_by_editor[feature.last_edited_by].append(scenario_ids[feature.id])
+    test_run_ids: list[int] = []
+    for executed_by, editor_scenario_ids in scenario_ids_by_editor.items():
+        test_run_ids.extend(
+            await test_run_storage.create_testruns_bulk(scenario_ids=editor_scenario_ids, executed_by=executed_by)
+        )
+    await _send_test_run_tasks(redis_producer=redis_producer, test_run_ids=test_run_ids)
+    return [str(x) for x in test_run_ids]
+
+
+async def create_test_runs_bulk_handler(
+    request: TestRunsCreationRequest,
+    user: SystemUserModel = fastapi.Depends(get_authorized_user),
+    scenario_storage: IAsyncScenarioStorage = fastapi.Depends(get_async_scenario_storage),
+    test_run_storage: IAsyncTestRunStorage = fastapi.Depends(get_async_test_run_storage),
+    redis_producer: RedisProducer = fastapi.Depends(get_redis_producer),
+) -> list[str]:
+    if not request.feature_ids and not request.tag_values:
+        raise fastapi.HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail="'feature_ids' or 'tag_values' should be specified!"
+        )
+    scenario_ids = await scenario_storage.get_scenario_ids(
+        feature_ids=request.feature_ids, tag_values=request.tag_values
+    )
+    if not scenario_ids:
+        raise fastapi.HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST, detail="Features with specified ids or tags do not exist"
+        )
+    test_run_ids = await test_run_storage.create_testruns_bulk(
+        scenario_ids=list(scenario_ids.values()), executed_by=user.login
+    )
+    await _send_test_run_tasks(redis_producer=redis_producer, test_run_ids=test_run_ids)
+    return [str(x) for x in test_run_ids]
@@ -1,11 +1,11 @@
 from overhave import OverhaveAdminApp, overhave_app
-from overhave.base_settings import DataBaseSettings, LoggingSettings
+from overhave.base_settings import DataBaseEntryPoint, DataBaseSettings, LoggingSettings
 from overhave.cli.group import overhave
 from overhave.factory import get_admin_factory
 
 
 def _get_admin_app() -> OverhaveAdminApp:
-    DataBaseSettings().setup_engine()
+    DataBaseSettings().setup_engine(DataBaseEntryPoint.ADMIN)
     LoggingSettings().setup_logging()
     return overhave_app(get_admin_factory())
 
@@ -1,13 +1,13 @@
 import typer
 
-from overhave.base_settings import DataBaseSettings, LoggingSettings
+from overhave.base_settings import DataBaseEntryPoint, DataBaseSettings, LoggingSettings
 from overhave.cli.group import overhave
 from overhave.factory import ConsumerFactory
 from overhave.transport import RedisStream
 
 
 def _run_consumer(stream: RedisStream) -> None:
-    DataBaseSettings().setup_engine()
+    DataBaseSettings().setup_engine(DataBaseEntryPoint.CONSUMER)
     LoggingSettings().setup_logging()
     ConsumerFactory(stream=stream).runner.run()
 
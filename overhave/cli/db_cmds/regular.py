@@ -6,7 +6,7 @@ from alembic.config import Config
 from sqlalchemy.exc import OperationalError
 
 from overhave import db
-from overhave.base_settings import DataBaseSettings
+from overhave.base_settings import DataBaseEntryPoint, DataBaseSettings
 
 
 def create_schema(config: Config) -> None:
@@ -40,7 +40,7 @@ def _ensure_database_exists(db_url: sqlalchemy.engine.URL) -> None:  # SQLAlchem
 
 def set_config_to_context(context: typer.Context, settings: DataBaseSettings) -> None:
     """Set Alembic config to Typer context for easy operations and migrations ability."""
-    settings.setup_engine()
+    settings.setup_engine(DataBaseEntryPoint.CLI)
     _ensure_database_exists(db.metadata.engine.url)
 
     config = Config()
@@ -49,23 +49,31 @@ def delete(
 def remove_files(
     name: str = typer.Option(..., "-n", "--name", help="Declared s3 bucket"),
     days: int = typer.Option(..., "-d", "--days", help="Remove all files in bucket older then specified days value"),
+    concurrency: int = typer.Option(4, "-c", "--concurrency", min=1, help="Number of parallel deletion requests"),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", is_flag=True, help="Only show summary of files, which would be removed"
+    ),
 ) -> None:
     """Remove s3 bucket files older than specified number of days."""
     _check_bucket_registered(name)
     manager = _get_s3_manager()
     target_date = get_current_time() - timedelta(days=days)
 
-    objects = manager.get_bucket_objects(name)
-    objects_to_delete = []
-    for obj in objects:
-        if not obj.modified_at < target_date:
-            continue
-        objects_to_delete.append(obj)
-    if not objects_to_delete:
+    objects_to_delete = (obj for obj in manager.iter_bucket_objects(name) if obj.modified_at < target_date)
+    if dry_run:
+        count, size = 0, 0
+        for obj in objects_to_delete:
+            count += 1
+            size += obj.size
+        typer.secho(f"Objects older then {days} days: {count}, total size: {size} bytes. Nothing removed (dry run).")
+        return
+    summary = manager.delete_objects_in_batches(bucket=name, objects=objects_to_delete, concurrency=concurrency)
+    if not summary.deleted and not summary.errors:
         typer.secho(f"No one object older than {days} days.")
         return
-    typer.secho(f"Objects older then {days} days: {[x.name for x in objects_to_delete]}")
-    manager.delete_bucket_objects(bucket=name, objects=objects_to_delete)
+    typer.secho(f"Removed objects older then {days} days: {summary.deleted}, total size: {summary.size} bytes.")
+    if summary.errors:
+        typer.secho(f"Could not remove {summary.errors} objects, see logs for details!", fg="red")
 
 
 @s3_app.command(short_help="Download file from s3 bucket")
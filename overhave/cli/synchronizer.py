@@ -1,6 +1,6 @@
 import typer
 
-from overhave.base_settings import DataBaseSettings, LoggingSettings
+from overhave.base_settings import DataBaseEntryPoint, DataBaseSettings, LoggingSettings
 from overhave.factory import get_synchronizer_factory
 from overhave.scenario import IFeatureValidator
 from overhave.synchronization import IOverhaveSynchronizer
@@ -9,7 +9,7 @@ sync_app = typer.Typer(short_help="Run Overhave features synchronization command
 
 
 def _create_synchronizer() -> IOverhaveSynchronizer:
-    DataBaseSettings().setup_engine()
+    DataBaseSettings().setup_engine(DataBaseEntryPoint.SYNC)
     LoggingSettings().setup_logging()
     return get_synchronizer_factory().synchronizer
 
@@ -20,8 +20,15 @@ def run(
         False, "-c", "--create-db-features", is_flag=True, help="Create features in database if necessary"
     ),
     pull_repository: bool = typer.Option(False, "-p", "--pull-repository", is_flag=True, help="Pull remote repository"),
+    incremental: bool = typer.Option(
+        False, "-i", "--incremental", is_flag=True, help="Synchronize only feature files changed since previous run"
+    ),
+    workers: int = typer.Option(1, "-w", "--workers", min=1, help="Number of processes for feature files parsing"),
+    batch_size: int = typer.Option(
+        None, "-b", "--batch-size", min=1, help="Write features to database with bulk queries by batches of this size"
+    ),
 ) -> None:
-    _create_synchronizer().synchronize(create_db_features, pull_repository)
+    _create_synchronizer().synchronize(create_db_features, pull_repository, incremental, workers, batch_size)
 
 
 def _create_validator() -> IFeatureValidator:
@@ -35,5 +42,6 @@ def validate_features(
         False, "-r", "--raise-if-nullable-id", is_flag=True, help="Raise if validator find features with nullable IDs"
     ),
     pull_repository: bool = typer.Option(False, "-p", "--pull-repository", is_flag=True, help="Pull remote repository"),
+    workers: int = typer.Option(1, "-w", "--workers", min=1, help="Number of processes for feature files parsing"),
 ) -> None:
-    _create_validator().validate(raise_if_nullable_id, pull_repository)
+    _create_validator().validate(raise_if_nullable_id, pull_repository, workers)
@@ -14,4 +14,4 @@ from .tables import (
     TestUser,
 )
 from .users import GroupRole, Role, UserRole
-from .utils import create_session, ensure_feature_types_exist
+from .utils import create_async_session, create_session, ensure_feature_types_exist
@@ -5,6 +5,7 @@ from typing import Any, cast
 import sqlalchemy as sa
 import sqlalchemy.engine as se
 import sqlalchemy.orm as so
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +19,12 @@ convention = {
 
 
 class SAMetadata(sa.MetaData):
-    """Custom SQLAlchemy MetaData with bounded engine."""
+    """Custom SQLAlchemy MetaData with bounded engine and optional asyncio engine."""
 
     def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
         super().__init__(*args, **kwargs)
         self._engine: se.Engine | None = None  # SQLAlchemy2.0 - sa.Engine
+        self._async_engine: AsyncEngine | None = None
 
     @property
     def engine(self) -> se.Engine:  # SQLAlchemy2.0 - sa.Engine
@@ -33,6 +35,19 @@ class SAMetadata(sa.MetaData):
     def set_engine(self, engine: se.Engine) -> None:  # SQLAlchemy2.0 - sa.Engine
         self._engine = engine
 
+    @property
+    def has_async_engine(self) -> bool:
+        return isinstance(self._async_engine, AsyncEngine)
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        if isinstance(self._async_engine, AsyncEngine):
+            return self._async_engine
+        raise RuntimeError("MetaData has not got bounded AsyncEngine!")
+
+    def set_async_engine(self, engine: AsyncEngine) -> None:
+        self._async_engine = engine
+
 
 metadata = SAMetadata(naming_convention=convention)
 
@@ -101,3 +116,5 @@ def _get_query_cls(
 Session = so.sessionmaker(query_cls=_get_query_cls)
 
 current_session = so.scoped_session(Session)
+
+AsyncSession = async_sessionmaker(expire_on_commit=False)
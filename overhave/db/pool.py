@@ -0,0 +1,73 @@
+import time
+from functools import partial
+from typing import Any, Callable
+
+import sqlalchemy as sa
+import sqlalchemy.engine as se
+from sqlalchemy.pool import ConnectionPoolEntry, Pool, QueuePool
+
+from overhave.metrics import BaseOverhaveMetricContainer
+
+
+class _CheckoutWaitObserver(Pool):
+    """Pool mixin, which measures time of waiting for free connection."""
+
+    observe_checkout_wait: Callable[[float], None]
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at = time.monotonic()
+        try:
+            return super()._do_get()
+        finally:
+            self.observe_checkout_wait(time.monotonic() - started_at)
+
+
+def get_metered_pool_class(
+    pool_class: type[Pool], pool_name: str, metric_container: BaseOverhaveMetricContainer
+) -> type[Pool]:
+    """Return subclass of :class:`QueuePool`, which reports checkout wait time to ```metric_container```.
+
+    Subclass is used instead of pool events, because SQLAlchemy has not got event before checkout.
+    Recreated pools keep their class, so metrics survive pool recreation after invalidation.
+    """
+    if not issubclass(pool_class, QueuePool):
+        return pool_class
+    observe = partial(metric_container.observe_db_checkout_wait, pool_name)
+    return type(
+        f"Metered{pool_class.__name__}",
+        (_CheckoutWaitObserver, pool_class),
+        {"observe_checkout_wait": staticmethod(observe)},
+    )
+
+
+def _get_overflow(engine: se.Engine) -> int:  # SQLAlchemy2.0 - sa.Engine
+    if isinstance(engine.pool, QueuePool):
+        return max(engine.pool.overflow(), 0)
+    return 0
+
+
+def observe_pool(
+    engine: se.Engine, pool_name: str, metric_container: BaseOverhaveMetricContainer  # SQLAlchemy2.0 - sa.Engine
+) -> None:
+    """Report checked out and invalidated connections of ```engine``` pool by pool events.
+
+    Overflow is read from current pool of ```engine``` on every metrics collection.
+    """
+
+    def _on_checkout(*args: Any) -> None:
+        metric_container.checkout_db_connection(pool_name)
+
+    def _on_checkin(*args: Any) -> None:
+        metric_container.checkin_db_connection(pool_name)
+
+    def _on_invalidate(*args: Any) -> None:
+        metric_container.invalidate_db_connection(pool_name, soft=False)
+
+    def _on_soft_invalidate(*args: Any) -> None:
+        metric_container.invalidate_db_connection(pool_name, soft=True)
+
+    metric_container.track_db_pool_overflow(pool_name, get_overflow=partial(_get_overflow, engine))
+    sa.event.listen(engine, "checkout", _on_checkout)
+    sa.event.listen(engine, "checkin", _on_checkin)
+    sa.event.listen(engine, "invalidate", _on_invalidate)
+    sa.event.listen(engine, "soft_invalidate", _on_soft_invalidate)
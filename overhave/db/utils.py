@@ -1,11 +1,12 @@
 import logging
-from contextlib import contextmanager
-from typing import Any, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterator
 
 import sqlalchemy.orm as so
 from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext import asyncio as sa_asyncio
 
-from overhave.db.base import Session, metadata
+from overhave.db.base import AsyncSession, Session, metadata
 from overhave.db.tables import FeatureType
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,20 @@ def create_session(**kwargs: Any) -> Iterator[so.Session]:
         new_session.close()
 
 
+@asynccontextmanager
+async def create_async_session(**kwargs: Any) -> AsyncIterator[sa_asyncio.AsyncSession]:
+    """Provide a transactional scope around a series of operations with asyncio engine."""
+    new_session = AsyncSession(bind=metadata.async_engine, **kwargs)
+    try:
+        yield new_session
+        await new_session.commit()
+    except Exception:
+        await new_session.rollback()
+        raise
+    finally:
+        await new_session.close()
+
+
 def ensure_feature_types_exist(feature_types: list[str]) -> None:
     with create_session() as session:
         try:
@@ -7,7 +7,7 @@ from typing import Pattern
 
 from overhave import db
 from overhave.entities.settings import OverhaveEmulationSettings
-from overhave.metrics import EmulationRunOverhaveMetricContainer
+from overhave.metrics import EmulationRunOverhaveMetricContainer, PipelineStage
 from overhave.storage import EmulationRunModel, EmulationStorageError, IEmulationStorage
 from overhave.transport import EmulationTask
 
@@ -89,9 +89,12 @@ class Emulator(ExternalCommandCheckMixin):
     def start_emulation(self, task: EmulationTask) -> None:
         emulation_run_id = task.data.emulation_run_id
         try:
-            emulation_run = self._storage.get_requested_emulation_run(emulation_run_id)
+            with self._metric_container.track_pipeline_stage(PipelineStage.CONTEXT_COMPILATION) as stage:
+                emulation_run = self._storage.get_requested_emulation_run(emulation_run_id)
+                stage.feature_type = emulation_run.emulation.test_user.feature_type.name
             logger.info("Try to emulate: %s", emulation_run.emulation)
-            self._initiate(emulation_run)
+            with self._metric_container.track_pipeline_stage(PipelineStage.EMULATION_START, stage.feature_type):
+                self._initiate(emulation_run)
             self._storage.set_emulation_run_status(emulation_run_id=emulation_run.id, status=db.EmulationStatus.READY)
             self._metric_container.add_emulation_task_status(
                 status=db.EmulationStatus.READY.value, port=emulation_run.port
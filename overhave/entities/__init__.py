@@ -9,9 +9,22 @@ from .auth_managers import (
 )
 from .feature import FeatureExtractor, FeatureTypeExtractionError, IFeatureExtractor, ScenariosTestFileNotFound
 from .file_extractor import BaseFileExtractor
-from .git_initializer import GitPullError, GitRepositoryInitializationError, GitRepositoryInitializer
+from .git_initializer import (
+    GitDiffError,
+    GitDiffPaths,
+    GitPullError,
+    GitRepositoryInitializationError,
+    GitRepositoryInitializer,
+)
 from .language import StepPrefixesModel
-from .report_manager import ReportManager, ReportPresenceResolution
+from .report_manager import (
+    AllureCmdlineReportGenerator,
+    HtmlSummaryReportGenerator,
+    IReportGenerator,
+    ReportCache,
+    ReportManager,
+    ReportPresenceResolution,
+)
 from .settings import (
     OverhaveAdminSettings,
     OverhaveDescriptionManagerSettings,
@@ -21,4 +34,7 @@ from .settings import (
     OverhaveReportManagerSettings,
     OverhaveStepContextSettings,
     ProcessorSettings,
+    ReportGeneratorType,
+    WorkspaceRetention,
 )
+from .workspace import WorkspaceManager
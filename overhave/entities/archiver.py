@@ -1,8 +1,14 @@
+import io
+import zipfile
 from pathlib import Path
 from shutil import make_archive, unpack_archive
+from typing import Iterator
 
 from overhave.entities.settings import OverhaveFileSettings
 
+_STREAMABLE_EXTENSION = "zip"
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class BaseArchiveManagerException(Exception):
     """Base exception for :class:`ArchiveManager`."""
@@ -12,6 +18,25 @@ class IncorrectExtensionError(BaseArchiveManagerException):
     """Exception for situation with specifing incorrect file extension for unpacking."""
 
 
+class _ChunksBuffer(io.RawIOBase):
+    """Non-seekable buffer, which collects written bytes until they are popped."""
+
+    def __init__(self) -> None:
+        self._data = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: bytes) -> int:  # type: ignore[override]
+        self._data += b
+        return len(b)
+
+    def pop(self) -> bytes:
+        data = bytes(self._data)
+        self._data.clear()
+        return data
+
+
 class ArchiveManager:
     """Class for files archiving management."""
 
@@ -22,6 +47,30 @@ class ArchiveManager:
         zipped = self._file_settings.tmp_reports_dir / path.name
         return Path(make_archive(zipped.as_posix(), extension, path))
 
+    @staticmethod
+    def is_streamable(extension: str) -> bool:
+        return extension == _STREAMABLE_EXTENSION
+
+    @staticmethod
+    def iter_archive(path: Path, extension: str) -> Iterator[bytes]:
+        """Produce archive of ```path``` by chunks on the fly, without writing of archive on disk."""
+        if not ArchiveManager.is_streamable(extension):
+            raise IncorrectExtensionError(f"Streaming of '{extension}' archives is not supported!")
+        buffer = _ChunksBuffer()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for file in sorted(path.rglob("*")):
+                info = zipfile.ZipInfo.from_file(file, arcname=file.relative_to(path).as_posix())
+                if file.is_dir():
+                    archive.writestr(info, b"")
+                    continue
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with file.open("rb") as source, archive.open(info, "w") as target:
+                    while chunk := source.read(_STREAM_CHUNK_SIZE):
+                        target.write(chunk)
+                        yield buffer.pop()
+                yield buffer.pop()
+        yield buffer.pop()
+
     def unpack_path(self, path: Path, extension: str) -> Path:
         if not path.name.endswith(extension):
             raise IncorrectExtensionError(
@@ -1,4 +1,6 @@
 import logging
+from dataclasses import dataclass, field
+from pathlib import Path
 
 import git
 
@@ -19,6 +21,18 @@ class GitPullError(BaseGitRepositoryInitializerException):
     """Error for situation with `git.GitError` when origin pulling."""
 
 
+class GitDiffError(BaseGitRepositoryInitializerException):
+    """Error for situation with `git.GitError` when diff between commits calculating."""
+
+
+@dataclass
+class GitDiffPaths:
+    """Absolute paths of files, which are changed between two commits."""
+
+    changed: list[Path] = field(default_factory=list)
+    deleted: list[Path] = field(default_factory=list)
+
+
 class GitRepositoryInitializer:
     """Class for git repository initializing and updating with pull command."""
 
@@ -48,3 +62,28 @@ class GitRepositoryInitializer:
             logger.info("Origin successfully pulled")
         except git.GitError as err:
             raise GitPullError("Error while trying to pull from remote repository!") from err
+
+    @property
+    def head_commit(self) -> str:
+        return str(self._repository.head.commit.hexsha)
+
+    def get_diff_paths(self, from_commit: str, to_commit: str) -> GitDiffPaths:
+        try:
+            diff_index = self._repository.commit(from_commit).diff(to_commit)
+        except (git.GitError, git.BadName, ValueError) as err:
+            raise GitDiffError(f"Error while trying to get diff between '{from_commit}' and '{to_commit}'!") from err
+        working_dir = Path(self._repository.working_dir)
+        diff_paths = GitDiffPaths()
+        for diff in diff_index:
+            if diff.deleted_file or diff.renamed_file:
+                diff_paths.deleted.append(working_dir / diff.a_path)
+            if not diff.deleted_file:
+                diff_paths.changed.append(working_dir / diff.b_path)
+        logger.info(
+            "Git diff %s..%s: %s changed, %s deleted files",
+            from_commit,
+            to_commit,
+            len(diff_paths.changed),
+            len(diff_paths.deleted),
+        )
+        return diff_paths
@@ -1,3 +1,5 @@
 # flake8: noqa
+from .cache import ReportCache
+from .generators import AllureCmdlineReportGenerator, HtmlSummaryReportGenerator, IReportGenerator
 from .models import ReportPresenceResolution
 from .report_manager import ReportManager
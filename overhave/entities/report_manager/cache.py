@@ -0,0 +1,163 @@
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Collection, Sequence
+from uuid import uuid1
+
+from overhave.entities.settings import OverhaveFileSettings, OverhaveReportManagerSettings
+from overhave.metrics import BaseOverhaveMetricContainer
+
+logger = logging.getLogger(__name__)
+
+_EVICTED_PREFIX = ".evicted-"
+
+
+def _get_size(path: Path) -> int:
+    size = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            try:
+                size += os.stat(os.path.join(root, file), follow_symlinks=False).st_size
+            except OSError:
+                continue
+    return size
+
+
+@dataclass
+class _CachedReport:
+    size: int
+    accessed_at: float
+
+
+class ReportCache:
+    """Size-bounded LRU cache of unpacked reports in ```tmp_reports_dir```, which are stored in s3 cloud.
+
+    Reports are evicted when they are older than ```reports_cache_max_age``` or when total size exceeds
+    ```reports_cache_max_bytes```. Reports accessed during the last eviction interval are not evicted,
+    so the report is not removed while its files are served. Evicted directory is renamed before removal,
+    so the request path sees either the whole report or no report.
+    """
+
+    def __init__(
+        self,
+        settings: OverhaveReportManagerSettings,
+        file_settings: OverhaveFileSettings,
+        metric_container: BaseOverhaveMetricContainer,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._settings = settings
+        self._file_settings = file_settings
+        self._metric_container = metric_container
+        self._clock = clock
+        self._reports: OrderedDict[str, _CachedReport] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        metric_container.track_reports_cache_bytes(lambda: self.size)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _put(self, report: str, cached: _CachedReport) -> None:
+        previous = self._reports.pop(report, None)
+        if previous is not None:
+            self._size -= previous.size
+        self._reports[report] = cached
+        self._size += cached.size
+
+    def scan(self, saved_reports: Callable[[Sequence[str]], Collection[str]]) -> None:
+        """Track reports in ```tmp_reports_dir``` in order of their modification.
+
+        Only reports, which are stored in s3 cloud according to ```saved_reports```, are tracked, so the reports
+        kept only locally after failed upload are never evicted.
+        """
+        if not self._file_settings.tmp_reports_dir.exists():
+            return
+        reports = sorted(
+            (path for path in self._file_settings.tmp_reports_dir.iterdir() if path.is_dir()),
+            key=lambda path: path.stat().st_mtime,
+        )
+        for path in reports:
+            if path.name.startswith(_EVICTED_PREFIX):
+                shutil.rmtree(path, ignore_errors=True)
+        saved = saved_reports([path.name for path in reports if not path.name.startswith(_EVICTED_PREFIX)])
+        for path in reports:
+            if path.name not in saved:
+                continue
+            with self._lock:
+                self._put(path.name, _CachedReport(size=_get_size(path), accessed_at=path.stat().st_mtime))
+        logger.info("Tracked %s reports in cache with size %s bytes", len(self._reports), self._size)
+
+    def add(self, report: str, count: bool = False) -> None:
+        """Track report, ```count``` request of absent report for cache hit ratio."""
+        size = _get_size(self._file_settings.tmp_reports_dir / report)
+        with self._lock:
+            self._put(report, _CachedReport(size=size, accessed_at=self._clock()))
+        if count:
+            self._metric_container.request_reports_cache(hit=False)
+
+    def touch(self, report: str, count: bool = False) -> None:
+        """Mark report as recently used, ```count``` request of present report for cache hit ratio."""
+        with self._lock:
+            cached = self._reports.get(report)
+            if cached is not None:
+                cached.accessed_at = self._clock()
+                self._reports.move_to_end(report)
+        if count and cached is not None:
+            self._metric_container.request_reports_cache(hit=True)
+
+    def _pop_evicted(self, now: float) -> list[str]:
+        protected_after = now - self._settings.reports_cache_eviction_interval.total_seconds()
+        expired_before = now - self._settings.reports_cache_max_age.total_seconds()
+        evicted: list[str] = []
+        for report, cached in self._reports.items():
+            if cached.accessed_at >= protected_after:
+                break
+            if cached.accessed_at >= expired_before and self._size <= self._settings.reports_cache_max_bytes:
+                break
+            evicted.append(report)
+            self._size -= cached.size
+        for report in evicted:
+            del self._reports[report]
+        return evicted
+
+    def evict(self) -> list[str]:
+        """Remove expired and least recently used reports over size budget, returns names of removed reports."""
+        removed: list[Path] = []
+        with self._lock:
+            evicted = self._pop_evicted(self._clock())
+            for report in evicted:
+                path = self._file_settings.tmp_reports_dir / report
+                try:
+                    removed.append(path.rename(path.with_name(f"{_EVICTED_PREFIX}{uuid1().hex}")))
+                except FileNotFoundError:
+                    continue
+        for path in removed:
+            shutil.rmtree(path, ignore_errors=True)
+        if evicted:
+            logger.info("Evicted reports from cache: %s", evicted)
+        return evicted
+
+    def _run_eviction(self) -> None:
+        while not self._stopped.wait(self._settings.reports_cache_eviction_interval.total_seconds()):
+            try:
+                self.evict()
+            except Exception:
+                logger.exception("Error while eviction of reports cache!")
+
+    def start(self, saved_reports: Callable[[Sequence[str]], Collection[str]]) -> threading.Thread:
+        """Scan existing reports and start background eviction."""
+        self.scan(saved_reports)
+        self.evict()
+        thread = threading.Thread(target=self._run_eviction, name="reports-cache-eviction", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        self._stopped.set()
@@ -0,0 +1,4 @@
+# flake8: noqa
+from .abstract_generator import IReportGenerator
+from .allure_cmdline import AllureCmdlineReportGenerator
+from .html_summary import HtmlSummaryReportGenerator
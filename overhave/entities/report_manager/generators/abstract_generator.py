@@ -0,0 +1,11 @@
+import abc
+from pathlib import Path
+
+
+class IReportGenerator(abc.ABC):
+    """Abstract class for generation of report from Allure results."""
+
+    @abc.abstractmethod
+    def generate(self, results_dir: Path, report_dir: Path) -> bool:
+        """Generate report with `index.html` into ```report_dir``` and return success flag."""
+        pass
@@ -0,0 +1,40 @@
+import logging
+import subprocess  # noqa: S404
+from os import makedirs
+from pathlib import Path
+
+from overhave.entities.report_manager.generators.abstract_generator import IReportGenerator
+from overhave.entities.settings import OverhaveReportManagerSettings
+
+logger = logging.getLogger(__name__)
+
+
+class AllureCmdlineReportGenerator(IReportGenerator):
+    """Class for generation of Allure report with Allure commandline."""
+
+    def __init__(self, settings: OverhaveReportManagerSettings) -> None:
+        self._settings = settings
+
+    def generate(self, results_dir: Path, report_dir: Path) -> bool:
+        generation_cmd = (
+            self._settings.allure_cmdline,
+            "generate",
+            f"{results_dir}/",
+            "--output",
+            report_dir.as_posix(),
+            "--clean",
+        )
+        logger.debug("Allure report generation command: %s", " ".join(generation_cmd))
+        makedirs(report_dir.as_posix(), exist_ok=True)
+        try:
+            subprocess.run(  # noqa: S603
+                generation_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=self._settings.report_creation_timeout,
+                check=True,
+            )
+            return True
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            logger.exception("Error while generating Allure report!")
+            return False
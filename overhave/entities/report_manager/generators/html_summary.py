@@ -0,0 +1,111 @@
+import json
+import logging
+import shutil
+from collections import Counter, defaultdict
+from functools import cache
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping
+
+import jinja2
+
+from overhave.entities.report_manager.generators.abstract_generator import IReportGenerator
+
+logger = logging.getLogger(__name__)
+
+_RESULT_SUFFIX = "-result.json"
+_CONTAINER_SUFFIX = "-container.json"
+_ATTACHMENTS_DIR = "attachments"
+_INDEX_FILE = "index.html"
+_TEMPLATE_NAME = "html_summary.html"
+_STATUSES = ("failed", "broken", "passed", "skipped", "unknown")
+_SHOWN_LABELS = ("feature", "story", "severity", "tag")
+
+
+def _format_duration(item: Mapping[str, Any]) -> str:
+    start, stop = item.get("start"), item.get("stop")
+    if start is None or stop is None:
+        return ""
+    milliseconds = stop - start
+    if milliseconds < 1000:
+        return f"{milliseconds}ms"
+    return f"{milliseconds / 1000:.2f}s"
+
+
+@cache
+def _get_template() -> jinja2.Template:
+    environment = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(Path(__file__).parent / "templates"), autoescape=True
+    )
+    environment.filters["duration"] = _format_duration
+    return environment.get_template(_TEMPLATE_NAME)
+
+
+def _iter_attachment_sources(items: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+    for item in items:
+        for attachment in item.get("attachments", []):
+            yield attachment["source"]
+        for key in ("steps", "befores", "afters"):
+            yield from _iter_attachment_sources(item.get(key, []))
+
+
+def _load(results_dir: Path, suffix: str) -> list[dict[str, Any]]:
+    return [json.loads(file.read_text()) for file in results_dir.glob(f"*{suffix}")]
+
+
+def _get_fixtures(containers: Iterable[Mapping[str, Any]], key: str) -> dict[str, list[dict[str, Any]]]:
+    fixtures: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for container in containers:
+        for child in container.get("children", []):
+            fixtures[child].extend(container.get(key, []))
+    return fixtures
+
+
+def _get_labels(result: Mapping[str, Any]) -> list[dict[str, str]]:
+    return [label for label in result.get("labels", []) if label.get("name") in _SHOWN_LABELS]
+
+
+def _copy_attachments(results_dir: Path, attachments_dir: Path, sources: Iterable[str]) -> None:
+    attachments_dir.mkdir(exist_ok=True)
+    for source in set(sources):
+        attachment = results_dir / source
+        if attachment.is_file():
+            shutil.copy(attachment, attachments_dir / source)
+            continue
+        logger.warning("Allure attachment '%s' does not exist!", source)
+
+
+class HtmlSummaryReportGenerator(IReportGenerator):
+    """Class for generation of static HTML summary from Allure results without Allure commandline.
+
+    Summary contains statuses and durations of tests with their fixtures, steps, parameters and attachments.
+    """
+
+    def generate(self, results_dir: Path, report_dir: Path) -> bool:
+        try:
+            results = sorted(_load(results_dir, _RESULT_SUFFIX), key=lambda x: x.get("start", 0))
+            containers = _load(results_dir, _CONTAINER_SUFFIX)
+            report_dir.mkdir(parents=True, exist_ok=True)
+            _copy_attachments(
+                results_dir=results_dir,
+                attachments_dir=report_dir / _ATTACHMENTS_DIR,
+                sources=_iter_attachment_sources([*results, *containers]),
+            )
+            statuses = Counter(result.get("status", "unknown") for result in results)
+            (report_dir / _INDEX_FILE).write_text(
+                _get_template().render(
+                    results=results,
+                    befores=_get_fixtures(containers, "befores"),
+                    afters=_get_fixtures(containers, "afters"),
+                    get_labels=_get_labels,
+                    statuses={status: statuses[status] for status in _STATUSES if statuses[status]},
+                    attachments_dir=_ATTACHMENTS_DIR,
+                    total={
+                        "start": min((x["start"] for x in results if "start" in x), default=None),
+                        "stop": max((x["stop"] for x in results if "stop" in x), default=None),
+                    },
+                )
+            )
+            return True
+        except (OSError, ValueError, KeyError, jinja2.TemplateError):
+            logger.exception("Error while generating HTML summary of Allure results!")
+            return False
@@ -1,15 +1,23 @@
 import logging
-import subprocess  # noqa: S404
-from os import makedirs
+import shutil
+import threading
+import zipfile
+from collections import OrderedDict
 from pathlib import Path
+from typing import Sequence
 from uuid import uuid1
 
 from overhave.db import TestReportStatus
 from overhave.entities.archiver import ArchiveManager
+from overhave.entities.report_manager.cache import ReportCache
+from overhave.entities.report_manager.generators import IReportGenerator
 from overhave.entities.report_manager.models import ReportPresenceResolution
 from overhave.entities.settings import OverhaveFileSettings, OverhaveReportManagerSettings
+from overhave.entities.workspace import WorkspaceManager
+from overhave.metrics import UNKNOWN_FEATURE_TYPE, BaseOverhaveMetricContainer, PipelineStage
 from overhave.storage import ITestRunStorage
-from overhave.transport import OverhaveS3Bucket, S3Manager
+from overhave.transport import OverhaveS3Bucket, ReportData, S3Manager
+from overhave.transport.s3.manager import BaseS3ManagerException
 
 logger = logging.getLogger(__name__)
 
@@ -24,63 +32,152 @@ class ReportManager:
         test_run_storage: ITestRunStorage,
         archive_manager: ArchiveManager,
         s3_manager: S3Manager,
+        report_generator: IReportGenerator,
+        report_cache: ReportCache,
+        workspace_manager: WorkspaceManager,
+        metric_container: BaseOverhaveMetricContainer,
     ) -> None:
         self._settings = settings
         self._file_settings = file_settings
         self._test_run_storage = test_run_storage
         self._archive_manager = archive_manager
         self._s3_manager = s3_manager
+        self._report_generator = report_generator
+        self._report_cache = report_cache
+        self._workspace_manager = workspace_manager
+        self._metric_container = metric_container
+        self._s3_archives: OrderedDict[str, zipfile.ZipFile] = OrderedDict()
+        self._s3_archives_lock = threading.Lock()
 
-    def _generate_report(self, alluredir: Path, report_dir: Path) -> int | None:
-        generation_cmd = (
-            self._settings.allure_cmdline,
-            "generate",
-            f"{alluredir}/",
-            "--output",
-            report_dir.as_posix(),
-            "--clean",
+    @property
+    def serves_from_s3(self) -> bool:
+        return (
+            self._settings.serve_from_s3
+            and self._s3_manager.enabled
+            and self._archive_manager.is_streamable(self._settings.archive_extension)
         )
-        logger.debug("Allure report generation command: %s", " ".join(generation_cmd))
-        makedirs(report_dir.as_posix(), exist_ok=True)
-        try:
-            return subprocess.run(  # noqa: S603
-                generation_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=self._settings.report_creation_timeout,
-                check=True,
-            ).returncode
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            logger.exception("Error while generating Allure report!")
-            return None
 
-    def _process_generated_report(self, test_run_id: int, report_dir: Path) -> None:
+    def _process_generated_report(self, test_run_id: int, report_dir: Path, feature_type: str) -> None:
         self._test_run_storage.set_report(run_id=test_run_id, status=TestReportStatus.GENERATED, report=report_dir.name)
         if not self._s3_manager.enabled:
             return
-        zip_report = self._archive_manager.archive_path(path=report_dir, extension=self._settings.archive_extension)
-        logger.info("Zip Allure report: %s", zip_report)
-        upload_result = self._s3_manager.upload_file(file=zip_report, bucket=OverhaveS3Bucket.REPORTS)
-        if not upload_result:
+        try:
+            if self._settings.stream_archive_upload and self._archive_manager.is_streamable(
+                self._settings.archive_extension
+            ):
+                uploaded_bytes = self._stream_report(report_dir=report_dir, feature_type=feature_type)
+            else:
+                uploaded_bytes = self._upload_archived_report(report_dir=report_dir, feature_type=feature_type)
+        except BaseException:
+            # report is kept, otherwise it would be removed together with workspace of test run
+            self._keep_report(report_dir)
+            raise
+        if uploaded_bytes is None:
+            self._keep_report(report_dir)
             return
+        self._metric_container.observe_s3_upload(bucket=OverhaveS3Bucket.REPORTS.value, size=uploaded_bytes)
         self._test_run_storage.set_report(run_id=test_run_id, status=TestReportStatus.SAVED)
+        if report_dir.parent == self._file_settings.tmp_reports_dir:
+            self._report_cache.add(report_dir.name)
+
+    def _keep_report(self, report_dir: Path) -> None:
+        """Move report, which has not been uploaded, from workspace into reports directory."""
+        if report_dir.parent == self._file_settings.tmp_reports_dir:
+            return
+        shutil.move(report_dir, self._file_settings.tmp_reports_dir / report_dir.name)
+
+    def _stream_report(self, report_dir: Path, feature_type: str) -> int | None:
+        # Archiving is interleaved with uploading, so both of them are observed as upload stage
+        with self._metric_container.track_pipeline_stage(PipelineStage.S3_UPLOAD, feature_type):
+            return self._s3_manager.upload_stream(
+                chunks=self._archive_manager.iter_archive(path=report_dir, extension=self._settings.archive_extension),
+                key=f"{report_dir.name}.{self._settings.archive_extension}",
+                bucket=OverhaveS3Bucket.REPORTS,
+            )
+
+    def _upload_archived_report(self, report_dir: Path, feature_type: str) -> int | None:
+        with self._metric_container.track_pipeline_stage(PipelineStage.REPORT_ARCHIVING, feature_type):
+            zip_report = self._archive_manager.archive_path(path=report_dir, extension=self._settings.archive_extension)
+        logger.info("Zip Allure report: %s", zip_report)
+        with self._metric_container.track_pipeline_stage(PipelineStage.S3_UPLOAD, feature_type):
+            upload_result = self._s3_manager.upload_file(file=zip_report, bucket=OverhaveS3Bucket.REPORTS)
+        if not upload_result:
+            return None
+        size = zip_report.stat().st_size
         zip_report.unlink()
+        return size
 
-    def create_allure_report(self, test_run_id: int, results_dir: Path) -> None:
-        report_dir = self._file_settings.tmp_reports_dir / uuid1().hex
+    def _create_allure_report(self, test_run_id: int, results_dir: Path, report_dir: Path, feature_type: str) -> None:
         logger.debug("Allure report directory: %s", report_dir)
-
-        report_generation_returncode = self._generate_report(alluredir=results_dir, report_dir=report_dir)
-        if report_generation_returncode != 0:
+        with self._metric_container.track_pipeline_stage(PipelineStage.REPORT_GENERATION, feature_type):
+            report_generated = self._report_generator.generate(results_dir=results_dir, report_dir=report_dir)
+        if not report_generated:
             self._test_run_storage.set_report(run_id=test_run_id, status=TestReportStatus.GENERATION_FAILED)
             return
         logger.debug("Allure report successfully generated to directory: %s", report_dir.as_posix())
-        self._process_generated_report(test_run_id=test_run_id, report_dir=report_dir)
+        self._process_generated_report(test_run_id=test_run_id, report_dir=report_dir, feature_type=feature_type)
+
+    def create_allure_report(
+        self,
+        test_run_id: int,
+        results_dir: Path,
+        feature_type: str = UNKNOWN_FEATURE_TYPE,
+        workspace: Path | None = None,
+    ) -> None:
+        """Create report from Allure results and release ```workspace``` of test run after that.
+
+        Report is created inside of workspace, when it will be uploaded to s3 cloud, so workspace holds all files.
+        """
+        if workspace is None:
+            self._create_allure_report(
+                test_run_id=test_run_id,
+                results_dir=results_dir,
+                report_dir=self._file_settings.tmp_reports_dir / uuid1().hex,
+                feature_type=feature_type,
+            )
+            return
+        reports_dir = workspace if self._s3_manager.enabled else self._file_settings.tmp_reports_dir
+        try:
+            self._create_allure_report(
+                test_run_id=test_run_id,
+                results_dir=results_dir,
+                report_dir=reports_dir / uuid1().hex,
+                feature_type=feature_type,
+            )
+        finally:
+            self._workspace_manager.release(workspace)
+
+    def create_allure_reports(self, requests: Sequence[ReportData]) -> None:
+        """Create reports for burst of requests, where only the latest request for every test run is processed."""
+        coalesced = {request.test_run_id: request for request in requests}
+        logger.info("Coalesced %s report requests into %s", len(requests), len(coalesced))
+        for request in requests:
+            if request.workspace is not None and request.workspace != coalesced[request.test_run_id].workspace:
+                self._workspace_manager.release(request.workspace)
+        for request in coalesced.values():
+            self.create_allure_report(
+                test_run_id=request.test_run_id,
+                results_dir=request.results_dir,
+                feature_type=request.feature_type,
+                workspace=request.workspace,
+            )
+
+    def start_reports_cache(self) -> None:
+        """Start eviction of unpacked reports, which could be downloaded again from s3 cloud."""
+        if not self._s3_manager.enabled:
+            logger.info("S3Manager disabled, so reports in '%s' are not evicted.", self._file_settings.tmp_reports_dir)
+            return
+        self._report_cache.start(self._test_run_storage.get_saved_reports)
+
+    def touch_report(self, path: str) -> None:
+        """Mark report of requested file as recently used, ```path``` is relative to reports directory."""
+        self._report_cache.touch(path.partition("/")[0])
 
     def get_report_precense_resolution(self, report: str, run_id: int) -> ReportPresenceResolution:  # noqa: C901
         report_index = Path(self._file_settings.tmp_reports_dir / report)
         report_dir = report_index.parent
         if report_dir.exists() and report_index.exists():
+            self._report_cache.touch(report_dir.name, count=True)
             return ReportPresenceResolution(exists=True)
 
         if not report_dir.exists():
@@ -106,6 +203,12 @@ class ReportManager:
                 "File %s after TestRun with id=%s has been generated, but still not uploaded!", test_run.report, run_id
             )
             return resolution
+        if self.serves_from_s3:
+            return ReportPresenceResolution(
+                exists=self._open_s3_archive(report_dir.name) is not None,
+                s3_enabled=self._s3_manager.enabled,
+                report_status=test_run.report_status,
+            )
         zip_report_path = self._file_settings.tmp_reports_dir / (
             report_dir.name + f".{self._settings.archive_extension}"
         )
@@ -122,6 +225,45 @@ class ReportManager:
         )
         zip_report_path.unlink()
         logger.info("Unpacked Allure report: %s", unpacked_report)
+        self._report_cache.add(unpacked_report.name, count=True)
         return ReportPresenceResolution(
             exists=True, s3_enabled=self._s3_manager.enabled, report_status=test_run.report_status
         )
+
+    def _open_s3_archive(self, report: str) -> zipfile.ZipFile | None:
+        with self._s3_archives_lock:
+            if report in self._s3_archives:
+                self._s3_archives.move_to_end(report)
+                return self._s3_archives[report]
+        reader = self._s3_manager.open_object(
+            bucket=OverhaveS3Bucket.REPORTS.value, key=f"{report}.{self._settings.archive_extension}"
+        )
+        if reader is None:
+            return None
+        try:
+            archive = zipfile.ZipFile(reader)
+        except (zipfile.BadZipFile, BaseS3ManagerException):
+            logger.exception("Could not read archive of report '%s' from s3 cloud!", report)
+            return None
+        with self._s3_archives_lock:
+            self._s3_archives[report] = archive
+            while len(self._s3_archives) > self._settings.s3_archives_cache_size:
+                self._s3_archives.popitem(last=False)
+        return archive
+
+    def get_s3_report_file(self, path: str) -> bytes | None:
+        """Read file of report from archive in s3 cloud without downloading of the whole archive.
+
+        ```path``` is a path of file relative to reports directory, where the first part is report name.
+        """
+        report, _, member = path.partition("/")
+        archive = self._open_s3_archive(report)
+        if archive is None:
+            return None
+        try:
+            return archive.read(member)
+        except KeyError:
+            logger.warning("Report '%s' does not contain file '%s'!", report, member)
+        except (zipfile.BadZipFile, BaseS3ManagerException):
+            logger.exception("Could not read file '%s' of report '%s' from s3 cloud!", member, report)
+        return None
@@ -1,3 +1,4 @@
+import enum
 from datetime import timedelta
 from pathlib import Path
 from typing import Any, Sequence
@@ -45,6 +46,13 @@ class OverhaveLanguageSettings(BaseOverhavePrefix):
     step_prefixes: StepPrefixesModel | None = Field(default=None)
 
 
+class WorkspaceRetention(enum.StrEnum):
+    """Enum that declares retention policies of test run workspaces."""
+
+    DELETE = "delete"
+    KEEP = "keep"
+
+
 class OverhaveFileSettings(BaseOverhavePrefix):
     """Settings for scenario file savings."""
 
@@ -74,6 +82,14 @@ class OverhaveFileSettings(BaseOverhavePrefix):
     # Temporary directory for scenarios test runs
     tmp_dir: Path = Path("/tmp/overhave")  # noqa: S108
 
+    # Test run workspace with scenario files, Allure results and report is removed right after processing
+    # with `delete` retention, or is kept for debugging until sweep with `keep` retention.
+    workspace_retention: WorkspaceRetention = WorkspaceRetention.DELETE
+    # Workspaces older than max age are treated as orphaned and removed by sweep,
+    # which is run on start of application and periodically with the interval.
+    workspace_max_age: timedelta = timedelta(hours=12)
+    workspace_sweep_interval: timedelta = timedelta(minutes=10)
+
     @model_validator(mode="before")
     def validate_dirs(cls, values: dict[str, Any]) -> dict[str, Any]:
         root_dir = values.get("root_dir")
@@ -102,14 +118,50 @@ class OverhaveFileSettings(BaseOverhavePrefix):
     def tmp_reports_dir(self) -> Path:
         return self.tmp_dir / "reports"
 
+    @property
+    def tmp_workspaces_dir(self) -> Path:
+        return self.tmp_dir / "workspaces"
+
+    @property
+    def sync_manifest_path(self) -> Path:
+        return self.tmp_dir / "sync_manifest.json"
+
+
+class ReportGeneratorType(enum.StrEnum):
+    """Enum that declares generators of reports from Allure results."""
+
+    ALLURE_CMDLINE = "allure_cmdline"
+    HTML_SUMMARY = "html_summary"
+
 
 class OverhaveReportManagerSettings(BaseOverhavePrefix):
     """Settings for :class:`ReportManager`."""
 
+    # Generator `allure_cmdline` runs Allure commandline (JVM) for every report,
+    # `html_summary` renders static HTML summary of Allure results in Python
+    report_generator: ReportGeneratorType = ReportGeneratorType.ALLURE_CMDLINE
     report_creation_timeout: int = 120  # sec
     report_creation_error_msg: str = "not_created"
     allure_cmdline: str = "allure"
     archive_extension: str = "zip"
+    # Archive of report is produced on the fly into multipart S3 upload without intermediate file on disk.
+    # Supported for `zip` archive extension, other extensions are archived on disk before upload.
+    stream_archive_upload: bool = True
+    # Serve files of reports, which are not present locally, right from `zip` archives in s3 cloud
+    # with ranged GET requests instead of downloading and unpacking of archives into `tmp_reports_dir`.
+    serve_from_s3: bool = False
+    # Number of opened s3 cloud archives, which central directories are kept in memory.
+    s3_archives_cache_size: int = 32
+    # Unpacked reports in `tmp_reports_dir` are used as cache of reports stored in s3 cloud, when s3 is enabled.
+    # Least recently used reports are evicted over size budget, and reports are evicted after max age.
+    reports_cache_max_bytes: int = 1024**3
+    reports_cache_max_age: timedelta = timedelta(days=1)
+    reports_cache_eviction_interval: timedelta = timedelta(minutes=1)
+    # Delegate report generation to consumer of Redis stream `report`, so test execution consumers are not blocked.
+    # Report consumer should have access to Allure results directories of test execution consumers.
+    report_consumer_based: bool = False
+    # Maximum number of report tasks, which are read from stream and coalesced by report consumer at once.
+    report_consumer_batch_size: int = 20
 
 
 class ProcessorSettings(BaseOverhavePrefix):
@@ -0,0 +1,81 @@
+import logging
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+from uuid import uuid1
+
+from overhave.entities.settings import OverhaveFileSettings, WorkspaceRetention
+
+logger = logging.getLogger(__name__)
+
+_RESULTS_DIR = "results"
+
+
+class WorkspaceManager:
+    """Class for management of test run workspaces in ```tmp_workspaces_dir```.
+
+    Workspace is a directory, which holds scenario files, Allure results and report of test run.
+    Workspaces are released according to retention policy, and workspaces older than max age,
+    which have been left after crashes or kept for debugging, are removed by sweep.
+    """
+
+    def __init__(self, file_settings: OverhaveFileSettings, clock: Callable[[], float] = time.time) -> None:
+        self._file_settings = file_settings
+        self._clock = clock
+        self._last_sweep: float | None = None
+        self._sweep_lock = threading.Lock()
+
+    @staticmethod
+    def results_dir(workspace: Path) -> Path:
+        return workspace / _RESULTS_DIR
+
+    def create(self, name: str) -> Path:
+        self._sweep_periodically()
+        workspace = self._file_settings.tmp_workspaces_dir / f"{name}_{uuid1().hex}"
+        self.results_dir(workspace).mkdir(parents=True)
+        logger.debug("Created workspace '%s'", workspace)
+        return workspace
+
+    def adopt_results(self, name: str, results_dir: Path) -> Path:
+        """Create workspace with already existing results, which are moved into it."""
+        workspace = self.create(name)
+        self.results_dir(workspace).rmdir()
+        shutil.move(results_dir, self.results_dir(workspace))
+        return workspace
+
+    def release(self, workspace: Path) -> None:
+        if self._file_settings.workspace_retention is WorkspaceRetention.KEEP:
+            logger.debug("Workspace '%s' is kept until sweep", workspace)
+            return
+        shutil.rmtree(workspace, ignore_errors=True)
+        logger.debug("Removed workspace '%s'", workspace)
+
+    def sweep(self) -> list[Path]:
+        """Remove workspaces older than max age and return their paths."""
+        workspaces_dir = self._file_settings.tmp_workspaces_dir
+        if not workspaces_dir.exists():
+            return []
+        expired_before = self._clock() - self._file_settings.workspace_max_age.total_seconds()
+        removed: list[Path] = []
+        for workspace in workspaces_dir.iterdir():
+            try:
+                if workspace.stat().st_mtime >= expired_before:
+                    continue
+            except FileNotFoundError:
+                continue
+            shutil.rmtree(workspace, ignore_errors=True)
+            removed.append(workspace)
+        if removed:
+            logger.info("Removed %s orphaned workspaces: %s", len(removed), [x.name for x in removed])
+        return removed
+
+    def _sweep_periodically(self) -> None:
+        with self._sweep_lock:
+            now = self._clock()
+            interval = self._file_settings.workspace_sweep_interval.total_seconds()
+            if self._last_sweep is not None and now - self._last_sweep < interval:
+                return
+            self._last_sweep = now
+        self.sweep()
@@ -3,13 +3,20 @@ from functools import cached_property
 from typing import Generic, cast
 
 from overhave.entities import (
+    AllureCmdlineReportGenerator,
     ArchiveManager,
     FeatureExtractor,
     GitRepositoryInitializer,
+    HtmlSummaryReportGenerator,
     IFeatureExtractor,
+    IReportGenerator,
+    ReportCache,
+    ReportGeneratorType,
     ReportManager,
+    WorkspaceManager,
 )
 from overhave.factory.context import TApplicationContext
+from overhave.metrics import BaseOverhaveMetricContainer, get_common_metric_container
 from overhave.scenario import FileManager, ScenarioCompiler, ScenarioParser
 from overhave.storage import (
     DraftStorage,
@@ -161,6 +168,16 @@ class BaseOverhaveFactory(IOverhaveFactory[TApplicationContext]):
             scenario_compiler=self._scenario_compiler,
         )
 
+    @property
+    def metric_container(self) -> BaseOverhaveMetricContainer:
+        return get_common_metric_container()
+
+    @cached_property
+    def _report_generator(self) -> IReportGenerator:
+        if self.context.report_manager_settings.report_generator is ReportGeneratorType.HTML_SUMMARY:
+            return HtmlSummaryReportGenerator()
+        return AllureCmdlineReportGenerator(settings=self.context.report_manager_settings)
+
     @cached_property
     def _report_manager(self) -> ReportManager:
         return ReportManager(
@@ -169,6 +186,22 @@ class BaseOverhaveFactory(IOverhaveFactory[TApplicationContext]):
             test_run_storage=self._test_run_storage,
             archive_manager=self._archive_manager,
             s3_manager=self._s3_manager,
+            report_generator=self._report_generator,
+            report_cache=self._report_cache,
+            workspace_manager=self._workspace_manager,
+            metric_container=self.metric_container,
+        )
+
+    @cached_property
+    def _workspace_manager(self) -> WorkspaceManager:
+        return WorkspaceManager(file_settings=self.context.file_settings)
+
+    @cached_property
+    def _report_cache(self) -> ReportCache:
+        return ReportCache(
+            settings=self.context.report_manager_settings,
+            file_settings=self.context.file_settings,
+            metric_container=self.metric_container,
         )
 
     @property
@@ -1,5 +1,5 @@
 import abc
-from typing import Generic
+from typing import Generic, Sequence
 
 from overhave.transport import TRedisTask
 
@@ -10,3 +10,7 @@ class ITaskConsumerFactory(Generic[TRedisTask], abc.ABC):
     @abc.abstractmethod
     def process_task(self, task: TRedisTask) -> None:
         pass
+
+    def process_tasks(self, tasks: Sequence[TRedisTask]) -> None:
+        for task in tasks:
+            self.process_task(task)
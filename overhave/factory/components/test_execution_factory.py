@@ -1,13 +1,17 @@
 import abc
 from functools import cached_property
+from typing import Sequence
+
+import walrus
 
 from overhave.factory.base_factory import IOverhaveFactory
 from overhave.factory.components.abstract_consumer import ITaskConsumerFactory
 from overhave.factory.components.s3_init_factory import FactoryWithS3ManagerInit
 from overhave.factory.context import OverhaveTestExecutionContext
-from overhave.metrics import TestRunOverhaveMetricContainer, get_test_metric_container
-from overhave.test_execution.executor import ITestExecutor, TestExecutor
-from overhave.transport import TestRunTask
+from overhave.metrics import TestRunOverhaveMetricContainer, get_common_metric_container, get_test_metric_container
+from overhave.test_execution import ITestExecutor, PytestWorkerPool, TestExecutor
+from overhave.transport import RedisProducer, RedisStream, ReportTask, TestRunTask
+from overhave.transport.redis.deps import get_redis_settings, make_redis
 
 
 class ITestExecutionFactory(IOverhaveFactory[OverhaveTestExecutionContext], ITaskConsumerFactory[TestRunTask], abc.ABC):
@@ -18,6 +22,18 @@ class ITestExecutionFactory(IOverhaveFactory[OverhaveTestExecutionContext], ITas
     def test_executor(self) -> ITestExecutor:
         pass
 
+    @abc.abstractmethod
+    def start_worker_pool(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def process_report_task(self, task: ReportTask) -> None:
+        pass
+
+    @abc.abstractmethod
+    def process_report_tasks(self, tasks: Sequence[ReportTask]) -> None:
+        pass
+
 
 class TestExecutionFactory(FactoryWithS3ManagerInit[OverhaveTestExecutionContext], ITestExecutionFactory):
     """Factory for Overhave test execution application."""
@@ -28,22 +44,62 @@ class TestExecutionFactory(FactoryWithS3ManagerInit[OverhaveTestExecutionContext
     def _test_executor(self) -> ITestExecutor:
         return TestExecutor(
             file_settings=self.context.file_settings,
+            test_settings=self.context.test_settings,
             feature_storage=self._feature_storage,
             scenario_storage=self._scenario_storage,
             test_run_storage=self._test_run_storage,
             file_manager=self._file_manager,
             test_runner=self._test_runner,
             report_manager=self._report_manager,
-            metric_container=self._metric_container,
+            workspace_manager=self._workspace_manager,
+            metric_container=self.metric_container,
+            worker_pool=self._worker_pool,
+            redis_producer=self._redis_producer,
         )
 
+    @cached_property
+    def _redis_producer(self) -> RedisProducer | None:
+        if not self.context.report_manager_settings.report_consumer_based:
+            return None
+        redis = make_redis(get_redis_settings())
+        return RedisProducer(
+            settings=get_redis_settings(),
+            mapping={ReportTask: RedisStream.REPORT},
+            database=walrus.Database(connection_pool=redis.connection_pool),
+            metric_container=get_common_metric_container(),
+        )
+
+    def set_context(self, context: OverhaveTestExecutionContext) -> None:
+        super().set_context(context)
+        self._workspace_manager.sweep()
+
+    @cached_property
+    def _worker_pool(self) -> PytestWorkerPool | None:
+        if self.context.test_settings.worker_pool_size is None:
+            return None
+        return PytestWorkerPool(settings=self.context.test_settings)
+
     @property
     def test_executor(self) -> ITestExecutor:
         return self._test_executor
 
+    def start_worker_pool(self) -> None:
+        """Start pool of pytest workers, should be called from main thread before other threads are started."""
+        if self._worker_pool is not None:
+            self._worker_pool.start()
+
     def process_task(self, task: TestRunTask) -> None:
         return self._test_executor.process_test_task(task)
 
+    def process_tasks(self, tasks: Sequence[TestRunTask]) -> None:
+        return self._test_executor.process_test_tasks(tasks)
+
+    def process_report_task(self, task: ReportTask) -> None:
+        return self.process_report_tasks([task])
+
+    def process_report_tasks(self, tasks: Sequence[ReportTask]) -> None:
+        return self._report_manager.create_allure_reports([task.data for task in tasks])
+
     @property
-    def _metric_container(self) -> TestRunOverhaveMetricContainer:
+    def metric_container(self) -> TestRunOverhaveMetricContainer:
         return get_test_metric_container()
@@ -1,5 +1,5 @@
 from functools import cached_property, partial
-from typing import Callable
+from typing import Callable, Sequence
 
 import walrus
 
@@ -13,9 +13,11 @@ from overhave.transport import (
     RedisConsumer,
     RedisConsumerRunner,
     RedisStream,
+    ReportTask,
     TestRunTask,
 )
 from overhave.transport.redis.deps import get_redis_settings, make_redis
+from overhave.transport.redis.settings import BaseRedisSettings
 
 
 class ConsumerFactory:
@@ -29,10 +31,24 @@ class ConsumerFactory:
         redis = make_redis(get_redis_settings())
         return walrus.Database(connection_pool=redis.connection_pool)
 
+    @cached_property
+    def _redis_settings(self) -> BaseRedisSettings:
+        settings = get_redis_settings()
+        if self._stream is RedisStream.TEST:
+            test_settings = get_test_execution_factory().context.test_settings
+            read_count = test_settings.batch_size * (test_settings.worker_pool_size or 1)
+        elif self._stream is RedisStream.REPORT:
+            read_count = get_test_execution_factory().context.report_manager_settings.report_consumer_batch_size
+        else:
+            return settings
+        if read_count <= settings.read_count:
+            return settings
+        return settings.model_copy(update={"read_count": read_count})
+
     @cached_property
     def _consumer(self) -> RedisConsumer:
         return RedisConsumer(
-            settings=get_redis_settings(),
+            settings=self._redis_settings,
             stream_name=self._stream,
             database=self._database,
             metric_container=get_common_metric_container(),
@@ -40,7 +56,7 @@ class ConsumerFactory:
 
     @cached_property
     def runner(self) -> RedisConsumerRunner:
-        return RedisConsumerRunner(consumer=self._consumer, mapping=self._mapping)
+        return RedisConsumerRunner(consumer=self._consumer, mapping=self._mapping, batch_mapping=self._batch_mapping)
 
     @cached_property
     def _mapping(self) -> dict[type[AnyRedisTask], Callable[[AnyRedisTask], None]]:
@@ -48,8 +64,24 @@ class ConsumerFactory:
             TestRunTask: self._process_test_execution_task,  # type: ignore
             PublicationTask: get_publication_factory().process_task,  # type: ignore
             EmulationTask: get_emulation_factory().process_task,  # type: ignore
+            ReportTask: get_test_execution_factory().process_report_task,  # type: ignore
         }
 
+    @cached_property
+    def _batch_mapping(self) -> dict[type[AnyRedisTask], Callable[[Sequence[AnyRedisTask]], None]]:
+        if self._stream is RedisStream.REPORT:
+            return {ReportTask: get_test_execution_factory().process_report_tasks}  # type: ignore
+        if self._stream is not RedisStream.TEST:
+            return {}
+        return {TestRunTask: self._process_test_execution_tasks}  # type: ignore
+
+    @cached_property
+    def _process_test_execution_tasks(self) -> Callable[[Sequence[TestRunTask]], None]:
+        factory = get_test_execution_factory()
+        get_proxy_manager().set_factory(factory)
+        factory.start_worker_pool()
+        return factory.process_tasks
+
     @cached_property
     def _process_test_execution_task(self) -> Callable[[TestRunTask], None]:
         factory = get_test_execution_factory()
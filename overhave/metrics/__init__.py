@@ -1,8 +1,11 @@
 # flake8: noqa
 
 from .client import (
+    UNKNOWN_FEATURE_TYPE,
     BaseOverhaveMetricContainer,
     EmulationRunOverhaveMetricContainer,
+    PipelineStage,
+    PipelineStageTracker,
     PublicationOverhaveMetricContainer,
     TestRunOverhaveMetricContainer,
 )
@@ -6,3 +6,4 @@ from .container import (
     PublicationOverhaveMetricContainer,
     TestRunOverhaveMetricContainer,
 )
+from .stages import UNKNOWN_FEATURE_TYPE, PipelineStage, PipelineStageTracker
@@ -1,9 +1,17 @@
 import logging
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
 
-from prometheus_client import CollectorRegistry, Counter
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
+
+from overhave.metrics.client.stages import UNKNOWN_FEATURE_TYPE, PipelineStage, PipelineStageTracker
 
 logger = logging.getLogger(__name__)
 
+_DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+_SIZE_BUCKETS = tuple(1024 * 4**x for x in range(11))
+
 
 class BaseOverhaveMetricContainer:
     """Base prometheus overhave metric container. Contains common metrics."""
@@ -11,6 +19,10 @@ class BaseOverhaveMetricContainer:
     def __init__(self, registry: CollectorRegistry):
         self.registry = registry
         self._init_redis_metrics()
+        self._init_db_pool_metrics()
+        self._init_api_auth_metrics()
+        self._init_pipeline_metrics()
+        self._init_reports_cache_metrics()
 
     def _init_redis_metrics(self) -> None:
         self.produced_redis_tasks = Counter(
@@ -26,12 +38,148 @@ class BaseOverhaveMetricContainer:
             registry=self.registry,
         )
 
+    def _init_db_pool_metrics(self) -> None:
+        self.db_pool_checked_out_connections = Gauge(
+            "db_pool_checked_out_connections",
+            "How many database connections are checked out from pool",
+            labelnames=("pool",),
+            registry=self.registry,
+        )
+        self.db_pool_overflow_connections = Gauge(
+            "db_pool_overflow_connections",
+            "How many database connections are opened over pool size",
+            labelnames=("pool",),
+            registry=self.registry,
+        )
+        self.db_pool_checkout_wait_seconds = Histogram(
+            "db_pool_checkout_wait_seconds",
+            "Time of waiting for free database connection in pool",
+            labelnames=("pool",),
+            registry=self.registry,
+        )
+        self.db_pool_invalidated_connections = Counter(
+            "db_pool_invalidated_connections",
+            "How many database connections have been invalidated",
+            labelnames=("pool", "soft"),
+            registry=self.registry,
+        )
+
+    def _init_api_auth_metrics(self) -> None:
+        self.api_auth_user_cache_requests = Counter(
+            "api_auth_user_cache_requests",
+            "How many authorized users have been requested from API auth cache",
+            labelnames=("result",),
+            registry=self.registry,
+        )
+        self.api_auth_user_cache_size = Gauge(
+            "api_auth_user_cache_size",
+            "How many authorized users are stored in API auth cache",
+            registry=self.registry,
+        )
+
+    def _init_pipeline_metrics(self) -> None:
+        self.redis_task_queue_wait_seconds = Histogram(
+            "redis_task_queue_wait_seconds",
+            "Time between adding of redis task to stream and its consumption",
+            labelnames=("task_type",),
+            buckets=_DURATION_BUCKETS,
+            registry=self.registry,
+        )
+        self.pipeline_stage_duration_seconds = Histogram(
+            "pipeline_stage_duration_seconds",
+            "Duration of tasks processing pipeline stage",
+            labelnames=("stage", "feature_type"),
+            buckets=_DURATION_BUCKETS,
+            registry=self.registry,
+        )
+        self.pipeline_stages_in_progress = Gauge(
+            "pipeline_stages_in_progress",
+            "How many tasks processing pipeline stages are in progress",
+            labelnames=("stage",),
+            registry=self.registry,
+        )
+        self.s3_uploaded_bytes = Histogram(
+            "s3_uploaded_bytes",
+            "Size of files uploaded to s3 cloud",
+            labelnames=("bucket",),
+            buckets=_SIZE_BUCKETS,
+            registry=self.registry,
+        )
+
+    def _init_reports_cache_metrics(self) -> None:
+        self.reports_cache_requests = Counter(
+            "reports_cache_requests",
+            "How many unpacked reports have been requested from local reports cache",
+            labelnames=("result",),
+            registry=self.registry,
+        )
+        self.reports_cache_bytes = Gauge(
+            "reports_cache_bytes",
+            "Size of unpacked reports in local reports cache",
+            registry=self.registry,
+        )
+
     def produce_redis_task(self, task_type: str) -> None:
         self.produced_redis_tasks.labels(task_type=task_type).inc()
 
     def consume_redis_task(self, task_type: str) -> None:
         self.consumed_redis_tasks.labels(task_type=task_type).inc()
 
+    def checkout_db_connection(self, pool: str) -> None:
+        self.db_pool_checked_out_connections.labels(pool=pool).inc()
+
+    def checkin_db_connection(self, pool: str) -> None:
+        self.db_pool_checked_out_connections.labels(pool=pool).dec()
+
+    def track_db_pool_overflow(self, pool: str, get_overflow: Callable[[], int]) -> None:
+        self.db_pool_overflow_connections.labels(pool=pool).set_function(get_overflow)
+
+    def observe_db_checkout_wait(self, pool: str, seconds: float) -> None:
+        self.db_pool_checkout_wait_seconds.labels(pool=pool).observe(seconds)
+
+    def invalidate_db_connection(self, pool: str, soft: bool) -> None:
+        self.db_pool_invalidated_connections.labels(pool=pool, soft=soft).inc()
+
+    def request_api_auth_user_cache(self, hit: bool) -> None:
+        self.api_auth_user_cache_requests.labels(result="hit" if hit else "miss").inc()
+
+    def track_api_auth_user_cache_size(self, get_size: Callable[[], int]) -> None:
+        self.api_auth_user_cache_size.set_function(get_size)
+
+    def observe_redis_task_queue_wait(self, task_type: str, seconds: float) -> None:
+        self.redis_task_queue_wait_seconds.labels(task_type=task_type).observe(max(seconds, 0))
+
+    def observe_pipeline_stage(
+        self, stage: PipelineStage, seconds: float, feature_type: str = UNKNOWN_FEATURE_TYPE
+    ) -> None:
+        self.pipeline_stage_duration_seconds.labels(stage=stage.value, feature_type=feature_type).observe(seconds)
+
+    @contextmanager
+    def track_pipeline_stage(
+        self, stage: PipelineStage, feature_type: str = UNKNOWN_FEATURE_TYPE
+    ) -> Iterator[PipelineStageTracker]:
+        """Track stage in progress and observe its duration, even if stage has failed."""
+        tracker = PipelineStageTracker(stage=stage, feature_type=feature_type)
+        in_progress = self.pipeline_stages_in_progress.labels(stage=stage.value)
+        in_progress.inc()
+        started_at = time.perf_counter()
+        try:
+            yield tracker
+        finally:
+            in_progress.dec()
+            self.observe_pipeline_stage(
+                stage=stage, seconds=time.perf_counter() - started_at, feature_type=tracker.feature_type
+            )
+
+    def observe_s3_upload(self, bucket: str, size: int) -> None:
+        self.s3_uploaded_bytes.labels(bucket=bucket).observe(size)
+
+    def request_reports_cache(self, hit: bool) -> None:
+        self.reports_cache_requests.labels(result="hit" if hit else "miss").inc()
+
+    def track_reports_cache_bytes(self, get_size: Callable[[], int]) -> None:
+        self.reports_cache_bytes.set_function(get_size)
+
 
 class TestRunOverhaveMetricContainer(BaseOverhaveMetricContainer):
     """Overhave prometheus metric container for test runs."""
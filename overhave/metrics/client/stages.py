@@ -0,0 +1,26 @@
+import enum
+from dataclasses import dataclass
+
+UNKNOWN_FEATURE_TYPE = "unknown"
+
+
+class PipelineStage(enum.StrEnum):
+    """Enum that declares stages of tasks processing pipelines."""
+
+    CONTEXT_COMPILATION = "context_compilation"
+    FILES_GENERATION = "files_generation"
+    PYTEST = "pytest"
+    REPORT_GENERATION = "report_generation"
+    REPORT_ARCHIVING = "report_archiving"
+    S3_UPLOAD = "s3_upload"
+    REPOSITORY_PREPARATION = "repository_preparation"
+    PULL_REQUEST = "pull_request"
+    EMULATION_START = "emulation_start"
+
+
+@dataclass
+class PipelineStageTracker:
+    """Labels of tracked pipeline stage, ```feature_type``` could be specified during stage processing."""
+
+    stage: PipelineStage
+    feature_type: str = UNKNOWN_FEATURE_TYPE
@@ -5,7 +5,7 @@ import git
 
 from overhave import db
 from overhave.entities import GitPullError
-from overhave.metrics import PublicationOverhaveMetricContainer
+from overhave.metrics import PipelineStage, PublicationOverhaveMetricContainer
 from overhave.publication.abstract_publisher import IVersionPublisher
 from overhave.publication.errors import BaseGitVersionPublisherError
 from overhave.scenario import FileManager, OverhaveProjectSettings, generate_task_info
@@ -41,15 +41,19 @@ class BaseVersionPublisher(IVersionPublisher, abc.ABC):
         self._metric_container.add_publication_task_status(status=status.value)
 
     def _compile_context(self, draft_id: int) -> PublisherContext:
-        with db.create_session() as session:
-            draft_model = self._draft_storage.draft_model_by_id(session=session, draft_id=draft_id)
-            test_run_model = self._test_run_storage.testrun_model_by_id(session=session, run_id=draft_model.test_run_id)
-            feature_model = self._feature_storage.feature_model_by_id(
-                session=session, feature_id=draft_model.feature_id
-            )
-            scenario_model = self._scenario_storage.scenario_model_by_id(
-                session=session, scenario_id=test_run_model.scenario_id
-            )
+        with self._metric_container.track_pipeline_stage(PipelineStage.CONTEXT_COMPILATION) as stage:
+            with db.create_session() as session:
+                draft_model = self._draft_storage.draft_model_by_id(session=session, draft_id=draft_id)
+                test_run_model = self._test_run_storage.testrun_model_by_id(
+                    session=session, run_id=draft_model.test_run_id
+                )
+                feature_model = self._feature_storage.feature_model_by_id(
+                    session=session, feature_id=draft_model.feature_id
+                )
+                scenario_model = self._scenario_storage.scenario_model_by_id(
+                    session=session, scenario_id=test_run_model.scenario_id
+                )
+            stage.feature_type = feature_model.feature_type.name
         return PublisherContext(
             feature=feature_model,
             scenario=scenario_model,
@@ -79,7 +83,10 @@ class BaseVersionPublisher(IVersionPublisher, abc.ABC):
         self._draft_storage.set_draft_status(draft_id, db.DraftStatus.CREATING)
         context = self._compile_context(draft_id)
         try:
-            self._prepare_repo(context)
+            with self._metric_container.track_pipeline_stage(
+                PipelineStage.REPOSITORY_PREPARATION, context.feature.feature_type.name
+            ):
+                self._prepare_repo(context)
             return context
         except (git.GitCommandError, GitPullError, BaseGitVersionPublisherError) as err:
             logger.exception("Error while trying to pull or push!")
@@ -6,7 +6,7 @@ from gitlab import GitlabError
 
 from overhave import db
 from overhave.entities import GitRepositoryInitializer
-from overhave.metrics import PublicationOverhaveMetricContainer
+from overhave.metrics import PipelineStage, PublicationOverhaveMetricContainer
 from overhave.publication.git_publisher import GitVersionPublisher
 from overhave.publication.gitlab.settings import OverhaveGitlabPublisherSettings
 from overhave.publication.gitlab.tokenizer.client import TokenizerClient
@@ -63,12 +63,16 @@ class GitlabVersionPublisher(GitVersionPublisher[OverhaveGitlabPublisherSettings
         )
         logger.info("Prepared merge-request: %s", merge_request.model_dump_json(by_alias=True))
         try:
-            token = (
-                self._gitlab_client._settings.auth_token or self._tokenizer_client.get_token(draft_id=draft_id).token
-            )
-            response = self._gitlab_client.send_merge_request(
-                merge_request=merge_request, token=token, repository_id=self._git_publisher_settings.repository_id
-            )
+            with self._metric_container.track_pipeline_stage(
+                PipelineStage.PULL_REQUEST, context.feature.feature_type.name
+            ):
+                token = (
+                    self._gitlab_client._settings.auth_token
+                    or self._tokenizer_client.get_token(draft_id=draft_id).token
+                )
+                response = self._gitlab_client.send_merge_request(
+                    merge_request=merge_request, token=token, repository_id=self._git_publisher_settings.repository_id
+                )
             self._draft_storage.save_response_as_created(
                 draft_id=draft_id,
                 pr_url=response.web_url,
@@ -4,7 +4,7 @@ import httpx
 
 from overhave import db
 from overhave.entities import GitRepositoryInitializer
-from overhave.metrics import PublicationOverhaveMetricContainer
+from overhave.metrics import PipelineStage, PublicationOverhaveMetricContainer
 from overhave.publication.git_publisher import GitVersionPublisher
 from overhave.publication.stash.settings import OverhaveStashPublisherSettings
 from overhave.scenario import FileManager, OverhaveProjectSettings
@@ -65,7 +65,10 @@ class StashVersionPublisher(GitVersionPublisher[OverhaveStashPublisherSettings])
         )
         logger.info("Prepared pull-request: %s", pull_request.model_dump_json(by_alias=True))
         try:
-            response = self._client.send_pull_request(pull_request)
+            with self._metric_container.track_pipeline_stage(
+                PipelineStage.PULL_REQUEST, context.feature.feature_type.name
+            ):
+                response = self._client.send_pull_request(pull_request)
             if isinstance(response, StashPrCreationResponse):
                 self._draft_storage.save_response_as_created(
                     draft_id=draft_id,
@@ -2,8 +2,11 @@
 from .deps import get_description_manager, get_step_context_runner
 from .helpers import (
     DescriptionManager,
+    FeatureInfoCacheInfo,
     StepContextNotDefinedError,
     StepContextRunner,
+    clear_feature_info_cache,
+    get_feature_info_cache_info,
     get_feature_info_from_item,
     get_scenario,
 )
@@ -14,5 +14,11 @@ from .bdd_item import (
     is_pytest_bdd_item,
     set_git_project_url_if_necessary,
 )
-from .parsed_info import get_feature_info_from_item, set_feature_info_for_item
+from .parsed_info import (
+    FeatureInfoCacheInfo,
+    clear_feature_info_cache,
+    get_feature_info_cache_info,
+    get_feature_info_from_item,
+    set_feature_info_for_item,
+)
 from .tag_controller import OverhaveTagController, TagEvaluationResult
@@ -1,5 +1,6 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import cast
+from typing import NamedTuple, cast
 
 from _pytest.nodes import Item
 from pytest_bdd.parser import Scenario
@@ -7,12 +8,45 @@ from pytest_bdd.parser import Scenario
 from overhave.pytest_plugin.helpers.bdd_item import get_scenario
 from overhave.scenario import FeatureInfo, ScenarioParser
 
+_FEATURE_INFO_CACHE_SIZE = 1024
 
-def _parse_feature_info_from_file(scenario: Scenario, scenario_parser: ScenarioParser) -> FeatureInfo:
-    feature_txt = Path(scenario.feature.filename).read_text()
+
+class FeatureInfoCacheInfo(NamedTuple):
+    """Statistics of process-wide cache of parsed feature files."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+@lru_cache(maxsize=_FEATURE_INFO_CACHE_SIZE)
+def _get_feature_info(filename: str, mtime_ns: int, size: int, scenario_parser: ScenarioParser) -> FeatureInfo:
+    """Parse feature file once per its state: items from one feature file share one `FeatureInfo`."""
+    feature_txt = Path(filename).read_text()
     return cast(FeatureInfo, scenario_parser.parse(feature_txt))
 
 
+def _parse_feature_info_from_file(scenario: Scenario, scenario_parser: ScenarioParser) -> FeatureInfo:
+    filename = scenario.feature.filename
+    file_stat = Path(filename).stat()
+    return _get_feature_info(
+        filename=filename, mtime_ns=file_stat.st_mtime_ns, size=file_stat.st_size, scenario_parser=scenario_parser
+    )
+
+
+def get_feature_info_cache_info() -> FeatureInfoCacheInfo:
+    """Hits, misses and size of process-wide cache of parsed feature files."""
+    cache_info = _get_feature_info.cache_info()
+    return FeatureInfoCacheInfo(
+        hits=cache_info.hits, misses=cache_info.misses, maxsize=cache_info.maxsize, currsize=cache_info.currsize
+    )
+
+
+def clear_feature_info_cache() -> None:
+    _get_feature_info.cache_clear()
+
+
 def set_feature_info_for_item(item: Item, scenario_parser: ScenarioParser) -> None:
     setattr(
         item,
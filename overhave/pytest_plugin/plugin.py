@@ -18,6 +18,7 @@ from overhave.pytest_plugin.helpers import (
     add_admin_feature_link_to_report,
     add_scenario_title_to_report,
     add_task_links_to_report,
+    get_feature_info_cache_info,
     get_feature_info_from_item,
     get_full_step_name,
     is_pytest_bdd_item,
@@ -163,3 +164,17 @@ def pytest_runtest_teardown(item: Item, nextitem: Item | None) -> None:
     if not get_proxy_manager().has_factory:
         return
     get_description_manager().apply_description()
+
+
+def pytest_sessionfinish(session: Session) -> None:
+    """Hook for logging of parsed feature files cache usage."""
+    if not get_proxy_manager().has_factory:
+        return
+    cache_info = get_feature_info_cache_info()
+    logger.info(
+        "Parsed feature info cache: %s hits, %s misses, %s/%s files",
+        cache_info.hits,
+        cache_info.misses,
+        cache_info.currsize,
+        cache_info.maxsize,
+    )
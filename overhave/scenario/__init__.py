@@ -6,8 +6,10 @@ from .parser import (
     FeatureNameParsingError,
     NullableFeatureIdError,
     OverhaveScenarioParserSettings,
+    ParsedFeature,
     ScenarioParser,
     StrictFeatureInfo,
     StrictFeatureParsingError,
+    parse_feature_files,
 )
 from .validator import FeatureValidator, IFeatureValidator
@@ -1,6 +1,6 @@
 import logging
 import tempfile
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -40,12 +40,12 @@ class FileManager(FileSavingMixin):
 
     @contextmanager
     def tmp_feature_file(
-        self, context: TestExecutorContext
+        self, context: TestExecutorContext, directory: Path | None = None
     ) -> Iterator[tempfile._TemporaryFileWrapper]:  # type: ignore
         file_name = Path(context.feature.file_path).name
         logger.debug("Feature file name: '%s'", file_name)
         with tempfile.NamedTemporaryFile(
-            dir=self._file_settings.tmp_features_dir,
+            dir=directory or self._file_settings.tmp_features_dir,
             prefix=f"{file_name}_id{context.feature.id}_",
             suffix=self._file_settings.feature_suffix,
             mode="w",
@@ -57,21 +57,51 @@ class FileManager(FileSavingMixin):
 
     @contextmanager
     def tmp_fixture_file(
-        self, context: TestExecutorContext, feature_file: tempfile._TemporaryFileWrapper  # type: ignore
+        self,
+        context: TestExecutorContext,
+        feature_file: tempfile._TemporaryFileWrapper,  # type: ignore
+        directory: Path | None = None,
     ) -> Iterator[tempfile._TemporaryFileWrapper]:  # type: ignore
         with tempfile.NamedTemporaryFile(
-            dir=self._file_settings.tmp_fixtures_dir,
+            dir=directory or self._file_settings.tmp_fixtures_dir,
             prefix=f"{context.test_run.id}_",
             suffix=self._file_settings.fixture_suffix,
             mode="w",
         ) as file:
-            joined_content = "\n".join(self._project_settings.fixture_content)
-            data = joined_content.format(feature_file_path=feature_file.name)
+            data = self._get_fixture_data(feature_file.name)
 
             logger.debug("Fixture file:\n%s", data)
             self._write_data(file=file, data=data, entity_name="fixture")
             yield file
 
+    def _get_fixture_data(self, feature_file_path: str) -> str:
+        joined_content = "\n".join(self._project_settings.fixture_content)
+        return joined_content.format(feature_file_path=feature_file_path)
+
+    @contextmanager
+    def tmp_batch_files(
+        self, contexts: Sequence[TestExecutorContext], directory: Path | None = None
+    ) -> Iterator[dict[int, Path]]:
+        """Write feature and fixture files of several test runs into one temporary directory inside of ```directory```.
+
+        Yields mapping of test run ID to its fixture file. Fixture file names are unique inside of pytest session.
+        """
+        with tempfile.TemporaryDirectory(
+            dir=directory or self._file_settings.tmp_fixtures_dir, prefix="batch_"
+        ) as batch_dir:
+            fixture_files: dict[int, Path] = {}
+            for context in contexts:
+                feature_file = Path(batch_dir) / (
+                    f"{Path(context.feature.file_path).name}_id{context.feature.id}_run{context.test_run.id}"
+                    f"{self._file_settings.feature_suffix}"
+                )
+                feature_file.write_text(self._scenario_compiler.compile(context=context))
+                fixture_file = Path(batch_dir) / f"test_run_{context.test_run.id}{self._file_settings.fixture_suffix}"
+                fixture_file.write_text(self._get_fixture_data(feature_file.as_posix()))
+                fixture_files[context.test_run.id] = fixture_file
+            logger.debug("Generated batch files for test runs %s in '%s'", list(fixture_files), batch_dir)
+            yield fixture_files
+
     def produce_feature_file(self, context: TestExecutorContext) -> Path:
         feature_file_path = (
             self._feature_extractor.feature_type_to_dir_mapping[context.feature.feature_type.name]
@@ -1,4 +1,5 @@
 # flake8: noqa
 from .models import FeatureInfo, StrictFeatureInfo
 from .parser import FeatureNameParsingError, NullableFeatureIdError, ScenarioParser, StrictFeatureParsingError
+from .pool import ParsedFeature, parse_feature_files
 from .settings import OverhaveScenarioParserSettings
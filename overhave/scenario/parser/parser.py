@@ -1,6 +1,5 @@
 import logging
 import re
-from dataclasses import asdict
 from datetime import datetime
 from functools import cached_property
 from typing import Sequence
@@ -18,6 +17,13 @@ from overhave.storage import FeatureTypeName
 logger = logging.getLogger(__name__)
 _DEFAULT_ID = 1
 
+_LINES_DELIMITER = "\n"
+_BLOCKS_DELIMITER = "\n\n"
+_INDENT = "  "
+_INDENT_SUBSTITUTE = "__"
+_STRIPPED_BLOCK_STARTS = ("\n", " ")
+_STRIPPED_BLOCK_PATTERN = re.compile(r"(?:\A|\n\n)(?:\n| (?! ))")
+
 
 class BaseScenarioParserError(Exception):
     """Base exception for parsing error."""
@@ -81,6 +87,43 @@ class ScenarioParser(PrefixMixin):
             return self._as_prefix(self._tasks_keyword)
         return None
 
+    @cached_property
+    def _line_prefix_pattern(self) -> re.Pattern[str]:
+        """Pattern for header line classification by its prefix: ID, tags or feature name.
+
+        Feature prefixes are reversed, so the last matching one wins as it did in sequential checks.
+        """
+        name_prefixes = "|".join(re.escape(prefix) for prefix in reversed(self._feature_prefixes))
+        return re.compile(
+            rf"(?P<id>{re.escape(self._compilation_settings.id_prefix)})"
+            rf"|(?P<tags>{re.escape(self._compilation_settings.tag_prefix)})"
+            rf"|(?P<name>{name_prefixes})"
+        )
+
+    @cached_property
+    def _author_pattern(self) -> re.Pattern[str]:
+        return self._get_additional_info_pattern(
+            left_pointer=self._compilation_settings.created_by_prefix,
+            right_pointer=self._compilation_settings.blocks_delimiter,
+        )
+
+    @cached_property
+    def _last_edited_by_pattern(self) -> re.Pattern[str]:
+        return self._get_additional_info_pattern(
+            left_pointer=self._compilation_settings.last_edited_by_prefix,
+            right_pointer=self._compilation_settings.time_delimiter,
+        )
+
+    @cached_property
+    def _last_edited_at_pattern(self) -> re.Pattern[str]:
+        return re.compile(
+            rf"({self._compilation_settings.time_delimiter})+[\w\-:\s]+({self._compilation_settings.blocks_delimiter})+"
+        )
+
+    @staticmethod
+    def _get_additional_info_pattern(left_pointer: str, right_pointer: str) -> re.Pattern[str]:
+        return re.compile(rf"({left_pointer})+\s?[\w.]+\s?({right_pointer})+")
+
     def _get_id(self, id_line: str) -> int:
         return int(id_line.removeprefix(self._compilation_settings.id_prefix).strip())
 
@@ -112,8 +155,10 @@ class ScenarioParser(PrefixMixin):
         return None
 
     @staticmethod
-    def _get_additional_info(additional_line: str, left_pointer: str, right_pointer: str) -> str:
-        result = re.search(rf"({left_pointer})+\s?[\w.]+\s?({right_pointer})+", additional_line)
+    def _get_additional_info(
+        additional_line: str, pattern: re.Pattern[str], left_pointer: str, right_pointer: str
+    ) -> str:
+        result = pattern.search(additional_line)
         if result:
             return result.group(0).removeprefix(left_pointer).removesuffix(right_pointer).strip()
         raise AdditionalInfoParsingError("Could not parse additional info from '%s'!", additional_line)
@@ -124,76 +169,101 @@ class ScenarioParser(PrefixMixin):
             tasks.extend(task_line.removeprefix(self._task_prefix).split(","))
         return [x.strip() for x in tasks]
 
-    def _get_time_info(self, line: str, left_pointer: str, right_pointer: str) -> datetime:
-        result = re.search(rf"({left_pointer})+[\w\-:\s]+({right_pointer})+", line)
+    def _get_time_info(self, line: str) -> datetime:
+        result = self._last_edited_at_pattern.search(line)
         if result:
-            datetime_str = result.group(0).removeprefix(left_pointer).removesuffix(right_pointer).strip()
+            datetime_str = (
+                result.group(0)
+                .removeprefix(self._compilation_settings.time_delimiter)
+                .removesuffix(self._compilation_settings.blocks_delimiter)
+                .strip()
+            )
             return datetime.strptime(datetime_str, self._compilation_settings.time_format)
         raise DatetimeParsingError("Could not parse datetime from '%s'!", line)
 
-    def _parse_feature_info(self, header: str) -> FeatureInfo:  # noqa: C901
+    def _fill_tags_info(self, feature_info: FeatureInfo, tags_line: str) -> None:
+        tags = self._get_tags(tags_line)
+        feature_info.type = self._get_feature_type(tags)
+        tags.remove(feature_info.type)
+
+        severity_tag = self._get_severity_tag(tags)
+        if severity_tag is not None:
+            tags.remove(severity_tag)
+            feature_info.severity = allure.severity_level(
+                severity_tag.removeprefix(self._compilation_settings.severity_keyword)
+            )
+        feature_info.tags = tags
+
+    def _fill_additional_info(self, feature_info: FeatureInfo, line: str) -> None:
+        if self._compilation_settings.created_by_prefix in line:
+            feature_info.author = self._get_additional_info(
+                line,
+                pattern=self._author_pattern,
+                left_pointer=self._compilation_settings.created_by_prefix,
+                right_pointer=self._compilation_settings.blocks_delimiter,
+            )
+        if self._compilation_settings.last_edited_by_prefix in line:
+            feature_info.last_edited_by = self._get_additional_info(
+                line,
+                pattern=self._last_edited_by_pattern,
+                left_pointer=self._compilation_settings.last_edited_by_prefix,
+                right_pointer=self._compilation_settings.time_delimiter,
+            )
+            feature_info.last_edited_at = self._get_time_info(line)
+        if self._task_prefix is not None and self._task_prefix in line:
+            feature_info.tasks = self._get_task_info(line)
+
+    def _parse_feature_info(self, header: str) -> FeatureInfo:
         feature_info = FeatureInfo()
-        for line in header.split("\n"):
-            if line.startswith(self._compilation_settings.id_prefix):
+        for line in header.split(_LINES_DELIMITER):
+            token = self._line_prefix_pattern.match(line)
+            if token is not None and token.lastgroup == "id":
                 feature_info.id = self._get_id(line)
                 continue
-            if line.startswith(self._compilation_settings.tag_prefix):
-                tags = self._get_tags(line)
-                feature_info.type = self._get_feature_type(tags)
-                tags.remove(feature_info.type)
-
-                severity_tag = self._get_severity_tag(tags)
-                if severity_tag is not None:
-                    tags.remove(severity_tag)
-                    feature_info.severity = allure.severity_level(
-                        severity_tag.removeprefix(self._compilation_settings.severity_keyword)
-                    )
-
-                feature_info.tags = tags
-                continue
-            for prefix in self._feature_prefixes:
-                if not line.startswith(prefix):
-                    continue
-                feature_info.name = self._get_name(name_line=line, feature_prefix=prefix)
-            if self._compilation_settings.created_by_prefix in line:
-                feature_info.author = self._get_additional_info(
-                    line,
-                    left_pointer=self._compilation_settings.created_by_prefix,
-                    right_pointer=self._compilation_settings.blocks_delimiter,
-                )
-            if self._compilation_settings.last_edited_by_prefix in line:
-                feature_info.last_edited_by = self._get_additional_info(
-                    line,
-                    left_pointer=self._compilation_settings.last_edited_by_prefix,
-                    right_pointer=self._compilation_settings.time_delimiter,
-                )
-                feature_info.last_edited_at = self._get_time_info(
-                    line,
-                    left_pointer=self._compilation_settings.time_delimiter,
-                    right_pointer=self._compilation_settings.blocks_delimiter,
-                )
-            if self._task_prefix is not None and self._task_prefix in line:
-                feature_info.tasks = self._get_task_info(line)
+            if token is not None and token.lastgroup == "tags":
+                self._fill_tags_info(feature_info, line)
                 continue
+            if token is not None:
+                feature_info.name = self._get_name(name_line=line, feature_prefix=token.group())
+            self._fill_additional_info(feature_info, line)
         if feature_info.name is None:
             raise FeatureNameParsingError(f"Could not parse feature name from header:\n{header}")
         return feature_info
 
+    @staticmethod
+    def _lstrip_block(block: str) -> str:
+        """Strip leading line breaks and single spaces of block, but keep its indents."""
+        position = 0
+        while position < len(block):
+            if block[position] == " " and block.startswith(_INDENT, position):
+                break
+            if block[position] not in _STRIPPED_BLOCK_STARTS:
+                break
+            position += 1
+        return block[position:]
+
+    @classmethod
+    def _get_scenarios(cls, body: str) -> str:
+        """Normalize scenarios text without substitution of indents in whole text.
+
+        Blocks are split and stripped only when any of them starts with a line break or a single space.
+        Underscores are substituted in the same way as indents were for keeping of output compatibility.
+        """
+        if _STRIPPED_BLOCK_PATTERN.search(body) is not None:
+            body = _BLOCKS_DELIMITER.join(cls._lstrip_block(block) for block in body.split(_BLOCKS_DELIMITER))
+        if _INDENT_SUBSTITUTE in body or "_" + _INDENT in body:
+            body = body.replace(_INDENT, _INDENT_SUBSTITUTE).replace(_INDENT_SUBSTITUTE, _INDENT)
+        return body
+
     def parse(self, feature_txt: str) -> FeatureInfo | StrictFeatureInfo:
-        blocks_delimiter = "\n\n"
-        indent = "  "
-        indent_substitute = "__"
-        blocks = [
-            block.lstrip(" \n") for block in feature_txt.replace(indent, indent_substitute).split(blocks_delimiter)
-        ]
-        header = blocks.pop(0)
-        feature_info = self._parse_feature_info(header)
-        feature_info.scenarios = blocks_delimiter.join(blocks).replace(indent_substitute, indent)
+        header, _, body = feature_txt.partition(_BLOCKS_DELIMITER)
+        feature_info = self._parse_feature_info(self._lstrip_block(header).replace(_INDENT, _INDENT_SUBSTITUTE))
+        feature_info.scenarios = self._get_scenarios(body)
         if not self._parser_settings.parser_strict_mode:
             return feature_info
         if feature_info.id is None:
             raise NullableFeatureIdError("Feature has not got specified ID!")
         try:
-            return StrictFeatureInfo(**asdict(feature_info))
+            return StrictFeatureInfo(**vars(feature_info))
         except ValueError as err:
             raise StrictFeatureParsingError("Could not parse feature to StrictFeatureInfo!") from err
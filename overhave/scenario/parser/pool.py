@@ -0,0 +1,60 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Sequence, cast
+
+from overhave.scenario.parser.models import StrictFeatureInfo
+from overhave.scenario.parser.parser import NullableFeatureIdError, ScenarioParser, StrictFeatureParsingError
+
+logger = logging.getLogger(__name__)
+
+_CHUNKS_PER_WORKER = 4
+
+_worker_parser: ScenarioParser | None = None
+
+
+@dataclass
+class ParsedFeature:
+    """Result of feature file strict parsing."""
+
+    path: Path
+    text: str
+    info: StrictFeatureInfo | None = None
+    error: NullableFeatureIdError | StrictFeatureParsingError | None = None
+
+
+def parse_feature_file(parser: ScenarioParser, path: Path) -> ParsedFeature:
+    text = path.read_text()
+    parser.set_strict_mode(True)
+    try:
+        info = cast(StrictFeatureInfo, parser.parse(text))
+    except (NullableFeatureIdError, StrictFeatureParsingError) as err:
+        return ParsedFeature(path=path, text=text, error=err)
+    return ParsedFeature(path=path, text=text, info=info)
+
+
+def _init_worker(parser: ScenarioParser) -> None:
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _parse_in_worker(path: Path) -> ParsedFeature:
+    if _worker_parser is None:
+        raise RuntimeError("Parser has not been initialized in worker process!")
+    return parse_feature_file(parser=_worker_parser, path=path)
+
+
+def parse_feature_files(parser: ScenarioParser, paths: Sequence[Path], workers: int = 1) -> Iterator[ParsedFeature]:
+    """Read and parse feature files, yield results in order of specified paths.
+
+    With `workers` > 1 files are read and parsed in pool of processes.
+    """
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield parse_feature_file(parser=parser, path=path)
+        return
+    chunksize = max(1, len(paths) // (workers * _CHUNKS_PER_WORKER))
+    logger.info("Parse %s feature files with %s workers...", len(paths), workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(parser,)) as executor:
+        yield from executor.map(_parse_in_worker, paths, chunksize=chunksize)
@@ -5,5 +5,5 @@ class IFeatureValidator(abc.ABC):
     """Interface for features validation."""
 
     @abc.abstractmethod
-    def validate(self, raise_if_nullable_id: bool = False, pull_repository: bool = False) -> None:
+    def validate(self, raise_if_nullable_id: bool = False, pull_repository: bool = False, workers: int = 1) -> None:
         pass
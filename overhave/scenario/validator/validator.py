@@ -1,8 +1,9 @@
 import logging
 from pathlib import Path
+from typing import cast
 
 from overhave.entities import BaseFileExtractor, GitRepositoryInitializer, OverhaveFileSettings
-from overhave.scenario.parser import NullableFeatureIdError, ScenarioParser, StrictFeatureParsingError
+from overhave.scenario.parser import NullableFeatureIdError, ScenarioParser, StrictFeatureInfo, parse_feature_files
 from overhave.scenario.validator.abstract import IFeatureValidator
 from overhave.scenario.validator.duplicate_id_mixin import FeatureDuplicatedIdValidationMixin
 from overhave.scenario.validator.errors import FeaturesWithoutIDPresenceError, IncorrectFeaturesPresenceError
@@ -29,24 +30,25 @@ class FeatureValidator(IFeatureValidator, BaseFileExtractor, FeatureDuplicatedId
         self._nullable_id_features: list[Path] = []
         self._incorrect_features: list[Path] = []
 
-    def validate(self, raise_if_nullable_id: bool = False, pull_repository: bool = False) -> None:
+    def validate(self, raise_if_nullable_id: bool = False, pull_repository: bool = False, workers: int = 1) -> None:
         if pull_repository:
             self._git_initializer.pull()
         logger.info("Start validation...")
         feature_paths = self._extract_recursively(self._file_settings.features_dir)
-        for feature_path in feature_paths:
+        for parsed_feature in parse_feature_files(parser=self._scenario_parser, paths=feature_paths, workers=workers):
+            feature_path = parsed_feature.path
             logger.info("Read feature from file %s...", feature_path.as_posix())
-            try:
-                feature_info = self._scenario_parser.parse(feature_path.read_text())
-                self._save_to_feature_id_to_path_mapping(feature_path=feature_path, feature_id=feature_info.id)
-            except NullableFeatureIdError:
+            if isinstance(parsed_feature.error, NullableFeatureIdError):
                 logger.warning("Feature has not got suitable Overhave ID!")
                 self._nullable_id_features.append(feature_path)
-            except StrictFeatureParsingError:
-                logger.exception("Feature has incorrect format!")
+                continue
+            if parsed_feature.error is not None:
+                logger.error("Feature has incorrect format!", exc_info=parsed_feature.error)
                 self._incorrect_features.append(feature_path)
-            else:
-                logger.info("Feature successfully parsed: %s", feature_info)
+                continue
+            feature_info = cast(StrictFeatureInfo, parsed_feature.info)
+            self._save_to_feature_id_to_path_mapping(feature_path=feature_path, feature_id=feature_info.id)
+            logger.info("Feature successfully parsed: %s", feature_info)
         if self._incorrect_features:
             raise IncorrectFeaturesPresenceError(
                 f"Features with incorrect format: {[x.as_posix() for x in self._incorrect_features]}"
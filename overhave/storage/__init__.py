@@ -17,15 +17,29 @@ from .converters import (
     TestUserSpecification,
 )
 from .draft_storage import DraftStorage, IDraftStorage, NullableScenarioError
-from .emulation_storage import EmulationStorage, EmulationStorageError, IEmulationStorage
-from .feature_storage import FeatureStorage, IFeatureStorage
-from .feature_tag_storage import FeatureTagStorage, IFeatureTagStorage
+from .emulation_storage import (
+    AsyncEmulationStorage,
+    EmulationStorage,
+    EmulationStorageError,
+    IAsyncEmulationStorage,
+    IEmulationStorage,
+)
+from .feature_storage import AsyncFeatureStorage, FeatureStorage, IAsyncFeatureStorage, IFeatureStorage
+from .feature_tag_storage import AsyncFeatureTagStorage, FeatureTagStorage, IAsyncFeatureTagStorage, IFeatureTagStorage
 from .feature_type_storage import FeatureTypeNotExistsError, FeatureTypeStorage, IFeatureTypeStorage
-from .scenario_storage import IScenarioStorage, ScenarioStorage
+from .scenario_storage import AsyncScenarioStorage, IAsyncScenarioStorage, IScenarioStorage, ScenarioStorage
 from .system_user_group_storage import ISystemUserGroupStorage, SystemUserGroupStorage
 from .system_user_storage import ISystemUserStorage, SystemUserStorage
-from .test_run_storage import ITestRunStorage, TestRunStorage
+from .test_run_storage import (
+    AsyncTestRunStorage,
+    IAsyncTestRunStorage,
+    ITestRunStorage,
+    ScenarioNotFoundError,
+    TestRunStorage,
+)
 from .test_user_storage import (
+    AsyncTestUserStorage,
+    IAsyncTestUserStorage,
     ITestUserStorage,
     TestUserDoesNotExistError,
     TestUserStorage,
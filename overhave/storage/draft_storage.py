@@ -1,5 +1,6 @@
 import abc
 from datetime import datetime
+from typing import Iterable
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
@@ -22,6 +23,11 @@ class IDraftStorage(abc.ABC):
     def get_last_published_at_for_feature(feature_id: int) -> datetime | None:
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    def get_last_published_at_for_features(feature_ids: Iterable[int]) -> dict[int, datetime]:
+        pass
+
     @classmethod
     @abc.abstractmethod
     def get_or_create_draft(
@@ -81,6 +87,19 @@ class DraftStorage(IDraftStorage):
                 return None
             return last_draft_with_published_at.published_at
 
+    @staticmethod
+    def get_last_published_at_for_features(feature_ids: Iterable[int]) -> dict[int, datetime]:
+        with db.create_session() as session:
+            rows = (
+                session.query(db.Draft)
+                .with_entities(db.Draft.feature_id, db.Draft.published_at)
+                .filter(db.Draft.feature_id.in_(feature_ids), db.Draft.published_at.isnot(None))
+                .distinct(db.Draft.feature_id)
+                .order_by(db.Draft.feature_id, db.Draft.id.desc())
+                .all()
+            )
+            return {feature_id: published_at for feature_id, published_at in rows}
+
     @staticmethod
     def _get_draft_id_by_testrun_id(session: so.Session, test_run_id: int) -> int | None:
         draft = session.query(db.Draft).filter(db.Draft.test_run_id == test_run_id).one_or_none()
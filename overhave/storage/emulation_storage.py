@@ -9,6 +9,7 @@ import sqlalchemy.orm as so
 from overhave import db
 from overhave.entities.settings import OverhaveEmulationSettings
 from overhave.storage import EmulationRunModel
+from overhave.storage.loader_options import EMULATION_RUN_MODEL_OPTIONS
 from overhave.utils import get_current_time
 
 logger = logging.getLogger(__name__)
@@ -48,6 +49,15 @@ class IEmulationStorage(abc.ABC):
         pass
 
 
+class IAsyncEmulationStorage(abc.ABC):
+    """Abstract class for emulation runs storage with asyncio session."""
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_emulation_runs_by_test_user_id(test_user_id: int) -> list[EmulationRunModel]:
+        pass
+
+
 class EmulationStorage(IEmulationStorage):
     """Class for emulation runs storage."""
 
@@ -100,7 +110,12 @@ class EmulationStorage(IEmulationStorage):
 
     def get_requested_emulation_run(self, emulation_run_id: int) -> EmulationRunModel:
         with db.create_session() as session:
-            emulation_run = session.query(db.EmulationRun).filter(db.EmulationRun.id == emulation_run_id).one()
+            emulation_run = (
+                session.query(db.EmulationRun)
+                .options(*EMULATION_RUN_MODEL_OPTIONS)
+                .filter(db.EmulationRun.id == emulation_run_id)
+                .one()
+            )
             emulation_run.status = db.EmulationStatus.REQUESTED
             emulation_run.port = self._get_next_port(session)
             emulation_run.changed_at = get_current_time()
@@ -132,6 +147,24 @@ class EmulationStorage(IEmulationStorage):
                 .scalar_subquery()
             )
             emulation_runs = (
-                session.query(db.EmulationRun).where(db.EmulationRun.emulation_id.in_(emulation_ids_query)).all()
+                session.query(db.EmulationRun)
+                .options(*EMULATION_RUN_MODEL_OPTIONS)
+                .where(db.EmulationRun.emulation_id.in_(emulation_ids_query))
+                .all()
+            )
+            return [EmulationRunModel.model_validate(x) for x in emulation_runs]
+
+
+class AsyncEmulationStorage(IAsyncEmulationStorage):
+    """Class for emulation runs storage with asyncio session."""
+
+    @staticmethod
+    async def get_emulation_runs_by_test_user_id(test_user_id: int) -> list[EmulationRunModel]:
+        emulation_ids_query = sa.select(db.Emulation.id).where(db.Emulation.test_user_id == test_user_id)
+        async with db.create_async_session() as session:
+            emulation_runs = await session.scalars(
+                sa.select(db.EmulationRun)
+                .options(*EMULATION_RUN_MODEL_OPTIONS)
+                .where(db.EmulationRun.emulation_id.in_(emulation_ids_query))
             )
             return [EmulationRunModel.model_validate(x) for x in emulation_runs]
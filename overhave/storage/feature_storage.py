@@ -1,12 +1,13 @@
 import abc
 import logging
-from typing import Iterable, cast
+from typing import Any, Iterable, Sequence, cast
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 
 from overhave import db
 from overhave.storage.converters import FeatureModel
+from overhave.storage.loader_options import FEATURE_MODEL_OPTIONS
 from overhave.utils import get_current_time
 
 logger = logging.getLogger(__name__)
@@ -48,6 +49,32 @@ class IFeatureStorage(abc.ABC):
     def get_features_by_tag(tag_id: int) -> list[FeatureModel]:
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    def get_feature_models(feature_ids: Iterable[int]) -> list[FeatureModel]:
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def create_features(session: so.Session, models: Sequence[FeatureModel]) -> list[int]:
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def update_features(session: so.Session, models: Sequence[FeatureModel]) -> None:
+        pass
+
+
+class IAsyncFeatureStorage(abc.ABC):
+    """Abstract class for feature storage with asyncio session."""
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_features_by_tag(
+        tag_id: int, after_id: int | None = None, limit: int | None = None
+    ) -> list[FeatureModel]:
+        pass
+
 
 def _append_tags_to_feature(session: so.Session, feature: db.Feature, tag_ids: Iterable[int]) -> None:
     db_tags: list[db.Tags] = []
@@ -60,12 +87,28 @@ def _append_tags_to_feature(session: so.Session, feature: db.Feature, tag_ids: I
     feature.feature_tags.extend(db_tags)
 
 
+def _insert_feature_tags(session: so.Session, models: Sequence[FeatureModel]) -> None:
+    tag_rows = [{"feature_id": model.id, "tags_id": tag.id} for model in models for tag in model.feature_tags]
+    if tag_rows:
+        session.execute(sa.insert(db.FeatureTagsAssociationTable), tag_rows)
+
+
+def _get_feature_values(model: FeatureModel) -> dict[str, Any]:
+    return {
+        "name": model.name,
+        "file_path": model.file_path,
+        "task": model.task,
+        "severity": model.severity,
+        "last_edited_by": model.last_edited_by,
+    }
+
+
 class FeatureStorage(IFeatureStorage):
     """Class for feature storage."""
 
     @staticmethod
     def feature_model_by_id(session: so.Session, feature_id: int) -> FeatureModel:
-        feature = session.query(db.Feature).filter(db.Feature.id == feature_id).one()
+        feature = session.query(db.Feature).options(*FEATURE_MODEL_OPTIONS).filter(db.Feature.id == feature_id).one()
         return FeatureModel.model_validate(feature)
 
     @staticmethod
@@ -123,13 +166,94 @@ class FeatureStorage(IFeatureStorage):
                 .filter(db.FeatureTagsAssociationTable.tags_id == tag_id)
                 .scalar_subquery()
             )
-            features = session.query(db.Feature).filter(db.Feature.id.in_(feature_ids_query)).all()
+            features = (
+                session.query(db.Feature)
+                .options(*FEATURE_MODEL_OPTIONS)
+                .filter(db.Feature.id.in_(feature_ids_query))
+                .all()
+            )
             return [FeatureModel.model_validate(x) for x in features]
 
     @staticmethod
     def get_feature_model(feature_id: int) -> FeatureModel | None:
         with db.create_session() as session:
-            feature = session.get(db.Feature, feature_id)
+            feature = session.get(db.Feature, feature_id, options=FEATURE_MODEL_OPTIONS)
             if feature is not None:
                 return FeatureModel.model_validate(feature)
             return None
+
+    @staticmethod
+    def get_feature_models(feature_ids: Iterable[int]) -> list[FeatureModel]:
+        with db.create_session() as session:
+            features = (
+                session.query(db.Feature).options(*FEATURE_MODEL_OPTIONS).filter(db.Feature.id.in_(feature_ids)).all()
+            )
+            return [FeatureModel.model_validate(x) for x in features]
+
+    @staticmethod
+    def create_features(session: so.Session, models: Sequence[FeatureModel]) -> list[int]:
+        """Create features with their tags by executemany and return IDs in order of specified models."""
+        if not models:
+            return []
+        rows = session.execute(
+            sa.insert(db.Feature).returning(db.Feature.id, db.Feature.file_path),
+            [
+                {
+                    **_get_feature_values(model),
+                    "author": model.author,
+                    "type_id": model.feature_type.id,
+                    "last_edited_at": model.last_edited_at,
+                    "released": model.released,
+                }
+                for model in models
+            ],
+        ).all()
+        file_path_to_id = {file_path: feature_id for feature_id, file_path in rows}
+        for model in models:
+            model.id = file_path_to_id[model.file_path]
+        _insert_feature_tags(session=session, models=models)
+        return [model.id for model in models]
+
+    @staticmethod
+    def update_features(session: so.Session, models: Sequence[FeatureModel]) -> None:
+        """Update features and replace their tags by executemany."""
+        if not models:
+            return
+        session.execute(
+            sa.update(db.Feature),
+            [
+                {**_get_feature_values(model), "id": model.id, "last_edited_at": get_current_time(), "released": True}
+                for model in models
+            ],
+        )
+        session.execute(
+            sa.delete(db.FeatureTagsAssociationTable).where(
+                db.FeatureTagsAssociationTable.feature_id.in_([model.id for model in models])
+            )
+        )
+        _insert_feature_tags(session=session, models=models)
+
+
+class AsyncFeatureStorage(IAsyncFeatureStorage):
+    """Class for feature storage with asyncio session."""
+
+    @staticmethod
+    async def get_features_by_tag(
+        tag_id: int, after_id: int | None = None, limit: int | None = None
+    ) -> list[FeatureModel]:
+        """Return page of features with specified tag ordered by ID, which starts after feature with `after_id`."""
+        feature_ids_query = sa.select(db.FeatureTagsAssociationTable.feature_id).where(
+            db.FeatureTagsAssociationTable.tags_id == tag_id
+        )
+        query = (
+            sa.select(db.Feature)
+            .options(*FEATURE_MODEL_OPTIONS)
+            .where(db.Feature.id.in_(feature_ids_query))
+            .order_by(db.Feature.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            query = query.where(db.Feature.id > after_id)
+        async with db.create_async_session() as session:
+            features = await session.scalars(query)
+            return [FeatureModel.model_validate(x) for x in features]
@@ -1,6 +1,8 @@
 import abc
 
+import sqlalchemy as sa
 import sqlalchemy.orm as so
+from sqlalchemy.dialects import postgresql
 
 from overhave import db
 from overhave.storage.converters import TagModel
@@ -24,6 +26,25 @@ class IFeatureTagStorage(abc.ABC):
     def get_or_create_tag(session: so.Session, value: str, created_by: str) -> db.Tags:
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    def get_or_create_tags(session: so.Session, value_to_creator: dict[str, str]) -> list[TagModel]:
+        pass
+
+
+class IAsyncFeatureTagStorage(abc.ABC):
+    """Abstract class for feature tags storage with asyncio session."""
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_tag_by_value(value: str) -> TagModel | None:
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_tags_like_value(value: str) -> list[TagModel]:
+        pass
+
 
 class FeatureTagStorage(IFeatureTagStorage):
     """Class for feature tags storage."""
@@ -49,3 +70,33 @@ class FeatureTagStorage(IFeatureTagStorage):
             tag = db.Tags(value=value, created_by=created_by)
             session.add(tag)
         return tag
+
+    @staticmethod
+    def get_or_create_tags(session: so.Session, value_to_creator: dict[str, str]) -> list[TagModel]:
+        """Create absent tags with one INSERT ... ON CONFLICT statement and return all specified tags."""
+        if not value_to_creator:
+            return []
+        session.execute(
+            postgresql.insert(db.Tags).on_conflict_do_nothing(index_elements=[db.Tags.value]),
+            [{"value": value, "created_by": created_by} for value, created_by in value_to_creator.items()],
+        )
+        db_tags = session.query(db.Tags).filter(db.Tags.value.in_(value_to_creator)).all()
+        return [TagModel.model_validate(tag) for tag in db_tags]
+
+
+class AsyncFeatureTagStorage(IAsyncFeatureTagStorage):
+    """Class for feature tags storage with asyncio session."""
+
+    @staticmethod
+    async def get_tag_by_value(value: str) -> TagModel | None:
+        async with db.create_async_session() as session:
+            tag = (await session.scalars(sa.select(db.Tags).where(db.Tags.value == value))).one_or_none()
+            if tag is not None:
+                return TagModel.model_validate(tag)
+            return None
+
+    @staticmethod
+    async def get_tags_like_value(value: str) -> list[TagModel]:
+        async with db.create_async_session() as session:
+            db_tags = await session.scalars(sa.select(db.Tags).where(db.Tags.value.like(value)))
+            return [TagModel.model_validate(tag) for tag in db_tags]
@@ -0,0 +1,11 @@
+import sqlalchemy.orm as so
+
+from overhave import db
+
+# Loader options for relationships, which are validated by converters. Relationships of tables are lazy,
+# so every storage method, which returns converter model, should load them with these options.
+FEATURE_MODEL_OPTIONS = (so.joinedload(db.Feature.feature_type), so.selectinload(db.Feature.feature_tags))
+TEST_USER_MODEL_OPTIONS = (so.joinedload(db.TestUser.feature_type),)
+EMULATION_RUN_MODEL_OPTIONS = (
+    so.joinedload(db.EmulationRun.emulation).joinedload(db.Emulation.test_user).joinedload(db.TestUser.feature_type),
+)
@@ -1,8 +1,9 @@
 import abc
-from typing import cast
+from typing import Iterable, Sequence, cast
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
+from sqlalchemy.dialects import postgresql
 
 from overhave import db
 from overhave.storage.converters import ScenarioModel
@@ -21,6 +22,11 @@ class IScenarioStorage(abc.ABC):
     def get_scenario_by_feature_id(feature_id: int) -> ScenarioModel:
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    def get_scenario_ids(feature_ids: Iterable[int] = (), tag_values: Iterable[str] = ()) -> dict[int, int]:
+        pass
+
     @staticmethod
     @abc.abstractmethod
     def update_scenario(model: ScenarioModel) -> None:
@@ -31,6 +37,38 @@ class IScenarioStorage(abc.ABC):
     def create_scenario(model: ScenarioModel) -> int:
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    def upsert_scenarios(session: so.Session, models: Sequence[ScenarioModel]) -> None:
+        pass
+
+
+class IAsyncScenarioStorage(abc.ABC):
+    """Abstract class for scenario storage with asyncio session."""
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_scenario_ids(feature_ids: Iterable[int] = (), tag_values: Iterable[str] = ()) -> dict[int, int]:
+        pass
+
+
+def _get_scenario_ids_query(feature_ids: Iterable[int], tag_values: Iterable[str]) -> sa.Select[tuple[int, int]] | None:
+    conditions = []
+    feature_ids = list(feature_ids)
+    if feature_ids:
+        conditions.append(db.Scenario.feature_id.in_(feature_ids))
+    tag_values = list(tag_values)
+    if tag_values:
+        tagged_feature_ids = (
+            sa.select(db.FeatureTagsAssociationTable.feature_id)
+            .join(db.Tags, db.Tags.id == db.FeatureTagsAssociationTable.tags_id)
+            .where(db.Tags.value.in_(tag_values))
+        )
+        conditions.append(db.Scenario.feature_id.in_(tagged_feature_ids))
+    if not conditions:
+        return None
+    return sa.select(db.Scenario.feature_id, db.Scenario.id).where(sa.or_(*conditions)).order_by(db.Scenario.id)
+
 
 class ScenarioStorage(IScenarioStorage):
     """Class for feature type storage."""
@@ -46,6 +84,16 @@ class ScenarioStorage(IScenarioStorage):
             scenario: db.Scenario = session.query(db.Scenario).filter(db.Scenario.feature_id == feature_id).one()
             return ScenarioModel.model_validate(scenario)
 
+    @staticmethod
+    def get_scenario_ids(feature_ids: Iterable[int] = (), tag_values: Iterable[str] = ()) -> dict[int, int]:
+        """Return mapping of feature ID to scenario ID for features with specified IDs or tags."""
+        query = _get_scenario_ids_query(feature_ids=feature_ids, tag_values=tag_values)
+        if query is None:
+            return {}
+        with db.create_session() as session:
+            rows = session.execute(query).all()
+            return {feature_id: scenario_id for feature_id, scenario_id in rows}
+
     @staticmethod
     def update_scenario(model: ScenarioModel) -> None:
         with db.create_session() as session:
@@ -58,3 +106,30 @@ class ScenarioStorage(IScenarioStorage):
             session.add(scenario)
             session.flush()
             return cast(int, scenario.id)
+
+    @staticmethod
+    def upsert_scenarios(session: so.Session, models: Sequence[ScenarioModel]) -> None:
+        """Create or update scenarios by `feature_id` with one INSERT ... ON CONFLICT statement."""
+        if not models:
+            return
+        insert_query = postgresql.insert(db.Scenario)
+        session.execute(
+            insert_query.on_conflict_do_update(
+                index_elements=[db.Scenario.feature_id], set_={"text": insert_query.excluded.text}
+            ),
+            [{"feature_id": model.feature_id, "text": model.text} for model in models],
+        )
+
+
+class AsyncScenarioStorage(IAsyncScenarioStorage):
+    """Class for scenario storage with asyncio session."""
+
+    @staticmethod
+    async def get_scenario_ids(feature_ids: Iterable[int] = (), tag_values: Iterable[str] = ()) -> dict[int, int]:
+        """Return mapping of feature ID to scenario ID for features with specified IDs or tags."""
+        query = _get_scenario_ids_query(feature_ids=feature_ids, tag_values=tag_values)
+        if query is None:
+            return {}
+        async with db.create_async_session() as session:
+            rows = (await session.execute(query)).all()
+            return {feature_id: scenario_id for feature_id, scenario_id in rows}
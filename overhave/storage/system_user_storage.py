@@ -1,4 +1,5 @@
 import abc
+from typing import Iterable
 
 import sqlalchemy.orm as so
 from pydantic import SecretStr
@@ -27,6 +28,11 @@ class ISystemUserStorage(abc.ABC):
     def get_user_by_credits(session: so.Session, login: str, password: SecretStr | None = None) -> db.UserRole | None:
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    def get_existing_logins(session: so.Session, logins: Iterable[str]) -> set[str]:
+        pass
+
 
 class SystemUserStorage(ISystemUserStorage):
     """Class for system user storage."""
@@ -57,3 +63,8 @@ class SystemUserStorage(ISystemUserStorage):
         if password is not None:
             query = query.filter(db.UserRole.password == password.get_secret_value())
         return query.one_or_none()
+
+    @staticmethod
+    def get_existing_logins(session: so.Session, logins: Iterable[str]) -> set[str]:
+        rows = session.query(db.UserRole).with_entities(db.UserRole.login).filter(db.UserRole.login.in_(logins)).all()
+        return {login for (login,) in rows}
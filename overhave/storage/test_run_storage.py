@@ -1,5 +1,5 @@
 import abc
-from typing import Any, cast
+from typing import Any, Sequence, cast
 
 import sqlalchemy as sa
 import sqlalchemy.orm as so
@@ -9,6 +9,14 @@ from overhave.storage.converters import TestRunModel
 from overhave.utils import get_current_time
 
 
+class BaseTestRunStorageException(Exception):
+    """Base exception for :class:`TestRunStorage`."""
+
+
+class ScenarioNotFoundError(BaseTestRunStorageException):
+    """Exception for situation with not existing scenarios for test runs."""
+
+
 class ITestRunStorage(abc.ABC):
     """Abstract class for test runs storage."""
 
@@ -16,6 +24,10 @@ class ITestRunStorage(abc.ABC):
     def create_testrun(self, scenario_id: int, executed_by: str) -> int:
         pass
 
+    @abc.abstractmethod
+    def create_testruns_bulk(self, scenario_ids: Sequence[int], executed_by: str) -> list[int]:
+        pass
+
     @abc.abstractmethod
     def set_run_status(self, run_id: int, status: db.TestRunStatus, traceback: str | None = None) -> None:
         pass
@@ -24,6 +36,10 @@ class ITestRunStorage(abc.ABC):
     def set_report(self, run_id: int, status: db.TestReportStatus, report: str | None = None) -> None:
         pass
 
+    @abc.abstractmethod
+    def get_saved_reports(self, reports: Sequence[str]) -> set[str]:
+        pass
+
     @abc.abstractmethod
     def testrun_model_by_id(self, session: so.Session, run_id: int) -> TestRunModel:
         pass
@@ -33,6 +49,47 @@ class ITestRunStorage(abc.ABC):
         pass
 
 
+class IAsyncTestRunStorage(abc.ABC):
+    """Abstract class for test runs storage with asyncio session."""
+
+    @abc.abstractmethod
+    async def create_testruns_bulk(self, scenario_ids: Sequence[int], executed_by: str) -> list[int]:
+        pass
+
+    @abc.abstractmethod
+    async def get_testrun_model(self, run_id: int) -> TestRunModel | None:
+        pass
+
+
+_INSERT_TEST_RUNS_QUERY = sa.insert(db.TestRun).returning(db.TestRun.id, sort_by_parameter_order=True)
+
+
+def _get_scenario_names_query(scenario_ids: Sequence[int]) -> sa.Select[tuple[int, str]]:
+    return (
+        sa.select(db.Scenario.id, db.Feature.name)
+        .join(db.Feature, db.Feature.id == db.Scenario.feature_id)
+        .where(db.Scenario.id.in_(set(scenario_ids)))
+    )
+
+
+def _get_testrun_values(
+    scenario_ids: Sequence[int], scenario_names: dict[int, str], executed_by: str
+) -> list[dict[str, Any]]:
+    missing_ids = set(scenario_ids).difference(scenario_names)
+    if missing_ids:
+        raise ScenarioNotFoundError(f"Scenarios with ids={sorted(missing_ids)} do not exist!")
+    return [
+        {
+            "scenario_id": scenario_id,
+            "name": scenario_names[scenario_id],
+            "status": db.TestRunStatus.STARTED,
+            "report_status": db.TestReportStatus.EMPTY,
+            "executed_by": executed_by,
+        }
+        for scenario_id in scenario_ids
+    ]
+
+
 class TestRunStorage(ITestRunStorage):
     """Class for test runs storage."""
 
@@ -50,6 +107,19 @@ class TestRunStorage(ITestRunStorage):
             session.flush()
             return cast(int, run.id)
 
+    def create_testruns_bulk(self, scenario_ids: Sequence[int], executed_by: str) -> list[int]:
+        """Create test runs for scenarios by one INSERT and return their IDs in order of specified scenarios."""
+        if not scenario_ids:
+            return []
+        with db.create_session() as session:
+            rows = session.execute(_get_scenario_names_query(scenario_ids)).all()
+            scenario_names = {scenario_id: name for scenario_id, name in rows}
+            test_run_ids = session.scalars(
+                _INSERT_TEST_RUNS_QUERY,
+                _get_testrun_values(scenario_ids=scenario_ids, scenario_names=scenario_names, executed_by=executed_by),
+            ).all()
+            return list(test_run_ids)
+
     def set_run_status(self, run_id: int, status: db.TestRunStatus, traceback: str | None = None) -> None:
         with db.create_session() as session:
             values: dict[str, Any] = {"status": status}
@@ -70,6 +140,13 @@ class TestRunStorage(ITestRunStorage):
 
             session.execute(sa.update(db.TestRun).where(db.TestRun.id == run_id).values(**values))
 
+    def get_saved_reports(self, reports: Sequence[str]) -> set[str]:
+        with db.create_session() as session:
+            query = sa.select(db.TestRun.report).where(
+                db.TestRun.report.in_(reports), db.TestRun.report_status == db.TestReportStatus.SAVED
+            )
+            return {report for report in session.execute(query).scalars() if report is not None}
+
     def testrun_model_by_id(self, session: so.Session, run_id: int) -> TestRunModel:
         run = session.query(db.TestRun).filter(db.TestRun.id == run_id).one()
         return TestRunModel.model_validate(run)
@@ -80,3 +157,27 @@ class TestRunStorage(ITestRunStorage):
             if run is None:
                 return None
             return TestRunModel.model_validate(run)
+
+
+class AsyncTestRunStorage(IAsyncTestRunStorage):
+    """Class for test runs storage with asyncio session."""
+
+    async def create_testruns_bulk(self, scenario_ids: Sequence[int], executed_by: str) -> list[int]:
+        """Create test runs for scenarios by one INSERT and return their IDs in order of specified scenarios."""
+        if not scenario_ids:
+            return []
+        async with db.create_async_session() as session:
+            rows = (await session.execute(_get_scenario_names_query(scenario_ids))).all()
+            scenario_names = {scenario_id: name for scenario_id, name in rows}
+            test_run_ids = await session.scalars(
+                _INSERT_TEST_RUNS_QUERY,
+                _get_testrun_values(scenario_ids=scenario_ids, scenario_names=scenario_names, executed_by=executed_by),
+            )
+            return list(test_run_ids)
+
+    async def get_testrun_model(self, run_id: int) -> TestRunModel | None:
+        async with db.create_async_session() as session:
+            run = await session.get(db.TestRun, run_id)
+            if run is None:
+                return None
+            return TestRunModel.model_validate(run)
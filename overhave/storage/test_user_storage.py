@@ -4,7 +4,9 @@ import sqlalchemy as sa
 import sqlalchemy.orm as so
 
 from overhave import db
-from overhave.storage import TestUserModel, TestUserSpecification
+from overhave.storage import FeatureTypeName, TestUserModel, TestUserSpecification
+from overhave.storage.feature_type_storage import FeatureTypeNotExistsError
+from overhave.storage.loader_options import TEST_USER_MODEL_OPTIONS
 from overhave.utils import get_current_time
 
 
@@ -55,13 +57,44 @@ class ITestUserStorage(abc.ABC):
         pass
 
 
+class IAsyncTestUserStorage(abc.ABC):
+    """Abstract class for Test User storage with asyncio session."""
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_testuser_model_by_id(user_id: int) -> TestUserModel | None:
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_testuser_model_by_key(key: str) -> TestUserModel | None:
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def get_test_users_by_feature_type_name(
+        feature_type_name: FeatureTypeName, allow_update: bool
+    ) -> list[TestUserModel]:
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def update_test_user_specification(user_id: int, specification: TestUserSpecification) -> None:
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    async def delete_test_user(user_id: int) -> None:
+        pass
+
+
 class TestUserStorage(ITestUserStorage):
     """Class for Test User storage."""
 
     @staticmethod
     def get_testuser_model_by_id(user_id: int) -> TestUserModel | None:
         with db.create_session() as session:
-            user = session.get(db.TestUser, user_id)
+            user = session.get(db.TestUser, user_id, options=TEST_USER_MODEL_OPTIONS)
             if user is not None:
                 return TestUserModel.model_validate(user)
             return None
@@ -69,7 +102,12 @@ class TestUserStorage(ITestUserStorage):
     @staticmethod
     def get_testuser_model_by_key(key: str) -> TestUserModel | None:
         with db.create_session() as session:
-            user: db.TestUser | None = session.query(db.TestUser).filter(db.TestUser.key == key).one_or_none()
+            user: db.TestUser | None = (
+                session.query(db.TestUser)
+                .options(*TEST_USER_MODEL_OPTIONS)
+                .filter(db.TestUser.key == key)
+                .one_or_none()
+            )
             if user is not None:
                 return TestUserModel.model_validate(user)
             return None
@@ -80,6 +118,7 @@ class TestUserStorage(ITestUserStorage):
     ) -> list[TestUserModel]:
         db_users = (
             session.query(db.TestUser)
+            .options(*TEST_USER_MODEL_OPTIONS)
             .filter(db.TestUser.feature_type_id == feature_type_id, db.TestUser.allow_update.is_(allow_update))
             .all()
         )
@@ -106,3 +145,66 @@ class TestUserStorage(ITestUserStorage):
             if user is None:
                 raise TestUserDoesNotExistError(f"Test user with id {user_id} does not exist!")
             session.delete(user)
+
+
+class AsyncTestUserStorage(IAsyncTestUserStorage):
+    """Class for Test User storage with asyncio session."""
+
+    @staticmethod
+    async def get_testuser_model_by_id(user_id: int) -> TestUserModel | None:
+        async with db.create_async_session() as session:
+            user = await session.get(db.TestUser, user_id, options=TEST_USER_MODEL_OPTIONS)
+            if user is not None:
+                return TestUserModel.model_validate(user)
+            return None
+
+    @staticmethod
+    async def get_testuser_model_by_key(key: str) -> TestUserModel | None:
+        async with db.create_async_session() as session:
+            user = (
+                await session.scalars(
+                    sa.select(db.TestUser).options(*TEST_USER_MODEL_OPTIONS).where(db.TestUser.key == key)
+                )
+            ).one_or_none()
+            if user is not None:
+                return TestUserModel.model_validate(user)
+            return None
+
+    @staticmethod
+    async def get_test_users_by_feature_type_name(
+        feature_type_name: FeatureTypeName, allow_update: bool
+    ) -> list[TestUserModel]:
+        async with db.create_async_session() as session:
+            feature_type_id = await session.scalar(
+                sa.select(db.FeatureType.id).where(db.FeatureType.name == feature_type_name)
+            )
+            if feature_type_id is None:
+                raise FeatureTypeNotExistsError(f"Could not find feature type with name='{feature_type_name}'!")
+            db_users = await session.scalars(
+                sa.select(db.TestUser)
+                .options(*TEST_USER_MODEL_OPTIONS)
+                .where(db.TestUser.feature_type_id == feature_type_id, db.TestUser.allow_update.is_(allow_update))
+            )
+            return [TestUserModel.model_validate(user) for user in db_users]
+
+    @staticmethod
+    async def update_test_user_specification(user_id: int, specification: TestUserSpecification) -> None:
+        async with db.create_async_session() as session:
+            test_user = await session.get(db.TestUser, user_id)
+            if test_user is None:
+                raise TestUserDoesNotExistError(f"Test user with id {user_id} does not exist!")
+            if not test_user.allow_update:
+                raise TestUserUpdatingNotAllowedError(f"Test user updating with id {user_id} not allowed!")
+            await session.execute(
+                sa.update(db.TestUser)
+                .where(db.TestUser.id == test_user.id)
+                .values(specification=specification, changed_at=get_current_time())
+            )
+
+    @staticmethod
+    async def delete_test_user(user_id: int) -> None:
+        async with db.create_async_session() as session:
+            user = await session.get(db.TestUser, user_id)
+            if user is None:
+                raise TestUserDoesNotExistError(f"Test user with id {user_id} does not exist!")
+            await session.delete(user)
@@ -1,4 +1,10 @@
 # flake8: noqa
 from .abstract import IOverhaveSynchronizer
-from .storage_manager import FeatureInfoUserNotFoundError, SynchronizerStorageManager
+from .manifest import ManifestEntry, SynchronizationManifest
+from .storage_manager import (
+    FeatureCreationTask,
+    FeatureInfoUserNotFoundError,
+    FeatureUpdateTask,
+    SynchronizerStorageManager,
+)
 from .synchronizer import OverhaveSynchronizer
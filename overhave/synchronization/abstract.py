@@ -5,5 +5,12 @@ class IOverhaveSynchronizer(abc.ABC):
     """Abstract class for synchronization between git and database."""
 
     @abc.abstractmethod
-    def synchronize(self, create_db_features: bool = False, pull_repository: bool = False) -> None:
+    def synchronize(
+        self,
+        create_db_features: bool = False,
+        pull_repository: bool = False,
+        incremental: bool = False,
+        workers: int = 1,
+        batch_size: int | None = None,
+    ) -> None:
         pass
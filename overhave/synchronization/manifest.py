@@ -0,0 +1,56 @@
+import hashlib
+import logging
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+def get_content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class FileState(BaseModel):
+    """Model for state of feature file."""
+
+    mtime: float
+    size: int
+    content_hash: str
+
+
+class ManifestEntry(FileState):
+    """Model for state of synchronized feature file."""
+
+    feature_id: int
+
+
+class SynchronizationManifest(BaseModel):
+    """Model for state of previous synchronization.
+
+    Keeps git HEAD of the last successful synchronization, synchronized feature files
+    and feature files, which were seen but not synchronized (for example, features without ID).
+    Paths are relative to `features_dir`.
+    """
+
+    head: str | None = None
+    entries: dict[str, ManifestEntry] = {}
+    pending: set[str] = set()
+
+    @classmethod
+    def load(cls, path: Path) -> "SynchronizationManifest":
+        if not path.exists():
+            logger.info("Synchronization manifest '%s' does not exist yet.", path.as_posix())
+            return cls()
+        try:
+            return cls.model_validate_json(path.read_text())
+        except ValidationError:
+            logger.warning("Synchronization manifest '%s' is broken and will be recreated!", path.as_posix())
+            return cls()
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f"{path.suffix}.tmp")
+        tmp_path.write_text(self.model_dump_json())
+        tmp_path.replace(path)
+        logger.info("Synchronization manifest saved to '%s'.", path.as_posix())
@@ -1,8 +1,12 @@
 import logging
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Iterable, Sequence
 
+import allure
 import sqlalchemy.orm as so
 
+from overhave import db
 from overhave.scenario import StrictFeatureInfo
 from overhave.storage import (
     FeatureModel,
@@ -17,7 +21,7 @@ from overhave.storage import (
     ScenarioModel,
     TagModel,
 )
-from overhave.utils import ANY_INT
+from overhave.utils import ANY_INT, get_current_time
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +34,22 @@ class FeatureInfoUserNotFoundError(BaseSynchronizerStorageMixinException):
     """Exception for situation without specified user in database."""
 
 
+@dataclass
+class FeatureCreationTask:
+    """Feature info with relative file path for feature creation."""
+
+    file_path: str
+    info: StrictFeatureInfo
+
+
+@dataclass
+class FeatureUpdateTask:
+    """Existing feature model with actual feature info for feature updating."""
+
+    model: FeatureModel
+    info: StrictFeatureInfo
+
+
 class SynchronizerStorageManager:
     """Class for storages management while synchronizing features."""
 
@@ -91,3 +111,86 @@ class SynchronizerStorageManager:
         model.id = self._feature_storage.create_feature(model)
         scenario_model = ScenarioModel(id=ANY_INT, feature_id=model.id, text=scenario)
         self._scenario_storage.create_scenario(scenario_model)
+
+    def get_features(self, feature_ids: Iterable[int]) -> dict[int, FeatureModel]:
+        unique_feature_ids = set(feature_ids)
+        if not unique_feature_ids:
+            return {}
+        return {model.id: model for model in self._feature_storage.get_feature_models(unique_feature_ids)}
+
+    def get_last_change_times(self, models: Sequence[FeatureModel]) -> dict[int, datetime]:
+        if not models:
+            return {}
+        last_published_at = self._draft_storage.get_last_published_at_for_features(model.id for model in models)
+        return {model.id: last_published_at.get(model.id, model.last_edited_at) for model in models}
+
+    def _ensure_all_users_exist(self, session: so.Session, infos: Sequence[StrictFeatureInfo]) -> None:
+        logins = {login for info in infos for login in (info.author, info.last_edited_by)}
+        missing_logins = logins.difference(
+            self._system_user_storage.get_existing_logins(session=session, logins=logins)
+        )
+        if missing_logins:
+            raise FeatureInfoUserNotFoundError(f"Could not find users with logins={sorted(missing_logins)}!")
+
+    def _get_all_feature_tags(self, session: so.Session, infos: Sequence[StrictFeatureInfo]) -> dict[str, TagModel]:
+        value_to_creator: dict[str, str] = {}
+        for info in infos:
+            for tag in info.tags or []:
+                value_to_creator.setdefault(tag, info.last_edited_by)
+        tags = self._tag_storage.get_or_create_tags(session=session, value_to_creator=value_to_creator)
+        return {tag.value: tag for tag in tags}
+
+    def _get_feature_types(
+        self, session: so.Session, infos: Sequence[StrictFeatureInfo]
+    ) -> dict[FeatureTypeName, FeatureTypeModel]:
+        return {name: self.feature_type_by_name(session=session, feature_type=name) for name in {x.type for x in infos}}
+
+    def write_features(
+        self, creation_tasks: Sequence[FeatureCreationTask], update_tasks: Sequence[FeatureUpdateTask]
+    ) -> list[int]:
+        """Create and update features with their tags and scenarios in one transaction.
+
+        Returns IDs of created features in order of creation tasks.
+        """
+        infos = [task.info for task in creation_tasks] + [task.info for task in update_tasks]
+        if not infos:
+            return []
+        with db.create_session() as session:
+            self._ensure_all_users_exist(session=session, infos=infos)
+            tags = self._get_all_feature_tags(session=session, infos=infos)
+            feature_types = self._get_feature_types(session=session, infos=[task.info for task in creation_tasks])
+            created_models = [
+                FeatureModel(
+                    id=ANY_INT,
+                    created_at=get_current_time(),
+                    name=task.info.name,
+                    author=task.info.author,
+                    type_id=feature_types[task.info.type].id,
+                    last_edited_by=task.info.last_edited_by,
+                    last_edited_at=task.info.last_edited_at,
+                    task=task.info.tasks or [],
+                    file_path=task.file_path,
+                    released=True,
+                    feature_type=feature_types[task.info.type],
+                    feature_tags=[tags[tag] for tag in task.info.tags or []],
+                    severity=task.info.severity or allure.severity_level.NORMAL,
+                )
+                for task in creation_tasks
+            ]
+            created_ids = self._feature_storage.create_features(session=session, models=created_models)
+            for task in update_tasks:
+                task.model.name = task.info.name
+                task.model.severity = task.info.severity
+                task.model.last_edited_by = task.info.last_edited_by
+                task.model.task = task.info.tasks
+                task.model.feature_tags = [tags[tag] for tag in task.info.tags or []]
+            self._feature_storage.update_features(session=session, models=[task.model for task in update_tasks])
+            self._scenario_storage.upsert_scenarios(
+                session=session,
+                models=[
+                    ScenarioModel(id=ANY_INT, feature_id=model.id, text=info.scenarios)
+                    for model, info in zip(created_models + [task.model for task in update_tasks], infos, strict=True)
+                ],
+            )
+        logger.info("Created %s and updated %s features.", len(created_ids), len(update_tasks))
+        return created_ids
@@ -1,18 +1,38 @@
+import enum
+import itertools
 import logging
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import cast
+from typing import Callable, Iterable, Iterator, Sequence, cast
 
 import allure
 import pytz
 
 from overhave import db
-from overhave.entities import BaseFileExtractor, FeatureExtractor, GitRepositoryInitializer, OverhaveFileSettings
-from overhave.scenario import FeatureInfo, NullableFeatureIdError, ScenarioParser, StrictFeatureInfo
-from overhave.storage import FeatureModel
+from overhave.entities import (
+    BaseFileExtractor,
+    FeatureExtractor,
+    GitDiffError,
+    GitRepositoryInitializer,
+    OverhaveFileSettings,
+)
+from overhave.scenario import (
+    FeatureInfo,
+    NullableFeatureIdError,
+    ParsedFeature,
+    ScenarioParser,
+    StrictFeatureInfo,
+    parse_feature_files,
+)
+from overhave.storage import FeatureModel, FeatureTypeName
 from overhave.synchronization.abstract import IOverhaveSynchronizer
-from overhave.synchronization.storage_manager import SynchronizerStorageManager
+from overhave.synchronization.manifest import FileState, ManifestEntry, SynchronizationManifest, get_content_hash
+from overhave.synchronization.storage_manager import (
+    FeatureCreationTask,
+    FeatureUpdateTask,
+    SynchronizerStorageManager,
+)
 from overhave.utils import ANY_INT, get_current_time
 
 logger = logging.getLogger(__name__)
@@ -34,6 +54,14 @@ class NullableInfoFeatureTypeError(BaseOverhaveSynchronizerException):
     """Exception for situation without feature info type."""
 
 
+class _FeatureState(enum.Enum):
+    """State of feature in database relative to its feature file."""
+
+    ACTUAL = "actual"
+    OUTDATED = "outdated"
+    NOT_RELEASED = "not_released"
+
+
 class OverhaveSynchronizer(BaseFileExtractor, IOverhaveSynchronizer):
     """Class for synchronization between git and database."""
 
@@ -65,8 +93,8 @@ class OverhaveSynchronizer(BaseFileExtractor, IOverhaveSynchronizer):
         self._storage_manager.update_db_feature(model=model, scenario=info.scenarios)
         logger.info("Feature has been updated successfully.")
 
-    def _create_feature(self, file: Path, info: FeatureInfo) -> None:
-        logger.info("Feature is gonna be created...")
+    @staticmethod
+    def _get_strict_creation_info(info: FeatureInfo) -> StrictFeatureInfo:
         if info.name is None:
             raise NullableInfoNameError("Feature info has not got feature name!")
         if info.type is None:
@@ -77,7 +105,18 @@ class OverhaveSynchronizer(BaseFileExtractor, IOverhaveSynchronizer):
             info.last_edited_by = info.author
 
         info.id = ANY_INT
-        strict_info = StrictFeatureInfo(**asdict(info))
+        return StrictFeatureInfo(**asdict(info))
+
+    def _get_optional_feature_info(self, parsed_feature: ParsedFeature) -> FeatureInfo:
+        self._scenario_parser.set_strict_mode(False)
+        return cast(FeatureInfo, self._scenario_parser.parse(parsed_feature.text))
+
+    def _get_feature_file_path(self, file: Path, feature_type: FeatureTypeName) -> str:
+        return file.relative_to(self._feature_extractor.feature_type_to_dir_mapping[feature_type]).as_posix()
+
+    def _create_feature(self, file: Path, info: FeatureInfo) -> int:
+        logger.info("Feature is gonna be created...")
+        strict_info = self._get_strict_creation_info(info)
 
         with db.create_session() as session:
             self._storage_manager.ensure_users_exist(session=session, info=strict_info)
@@ -93,9 +132,7 @@ class OverhaveSynchronizer(BaseFileExtractor, IOverhaveSynchronizer):
             last_edited_by=strict_info.last_edited_by,
             last_edited_at=strict_info.last_edited_at,
             task=strict_info.tasks or [],
-            file_path=file.relative_to(
-                self._feature_extractor.feature_type_to_dir_mapping[feature_type.name]
-            ).as_posix(),
+            file_path=self._get_feature_file_path(file=file, feature_type=feature_type.name),
             released=True,
             feature_type=feature_type,
             feature_tags=feature_tags,
@@ -103,46 +140,257 @@ class OverhaveSynchronizer(BaseFileExtractor, IOverhaveSynchronizer):
         )
         self._storage_manager.create_db_feature(model=feature_model, scenario=strict_info.scenarios)
         logger.info("Feature with ID=%s has been created successfully.", feature_model.id)
+        return feature_model.id
 
-    def synchronize(self, create_db_features: bool = False, pull_repository: bool = False) -> None:  # noqa: C901
-        if pull_repository:
-            self._git_initializer.pull()
-        logger.info("Start synchronization...")
-        all_features = self._extract_recursively(self._file_settings.features_dir)
-        for feature_file in all_features:
-            logger.info("Synchronize feature from file %s...", feature_file.as_posix())
-            feature_text = feature_file.read_text()
-            self._scenario_parser.set_strict_mode(True)
-            try:
-                feature_info: StrictFeatureInfo = cast(StrictFeatureInfo, self._scenario_parser.parse(feature_text))
-            except NullableFeatureIdError:
+    @staticmethod
+    def _get_feature_file_ts(feature_file: Path) -> datetime:
+        return datetime.fromtimestamp(feature_file.stat().st_mtime, tz=pytz.UTC)
+
+    @staticmethod
+    def _get_feature_state(
+        model: FeatureModel, feature_file_ts: datetime, get_last_change_time: Callable[[], datetime]
+    ) -> _FeatureState:
+        """Compare feature in database with its feature file modified at ```feature_file_ts```."""
+        if model.last_edited_at == feature_file_ts and model.released:
+            logger.warning("Feature has been already synchronized.")
+            return _FeatureState.ACTUAL
+        last_change_time = get_last_change_time()
+        if last_change_time < feature_file_ts:
+            return _FeatureState.OUTDATED
+        if model.released:
+            logger.info("Feature is already actual. Skip.")
+            return _FeatureState.ACTUAL
+        logger.warning(
+            "Feature was changed soon (at %s), but not released. Skip.",
+            last_change_time.strftime("%d-%m-%Y %H:%M:%S"),
+        )
+        return _FeatureState.NOT_RELEASED
+
+    def _get_existing_feature_info(self, parsed_feature: ParsedFeature) -> StrictFeatureInfo:
+        if parsed_feature.error is not None:
+            raise parsed_feature.error
+        feature_info = cast(StrictFeatureInfo, parsed_feature.info)
+        logger.debug("Parsed feature info: %s", feature_info)
+        return feature_info
+
+    def _synchronize_feature(self, parsed_feature: ParsedFeature, create_db_features: bool) -> int | None:
+        """Synchronize feature file with database and return feature ID, if feature is actual in database."""
+        feature_file = parsed_feature.path
+        logger.info("Synchronize feature from file %s...", feature_file.as_posix())
+        if isinstance(parsed_feature.error, NullableFeatureIdError):
+            logger.warning("Feature has not got Overhave ID or ID format is incorrect.")
+            if not create_db_features:
+                logger.warning("create_db_features=%s. Skip it.", create_db_features)
+                return None
+            return self._create_feature(file=feature_file, info=self._get_optional_feature_info(parsed_feature))
+        feature_info = self._get_existing_feature_info(parsed_feature)
+        feature_model = self._storage_manager.get_feature(feature_info.id)
+        if feature_model is None:
+            logger.warning("Feature doesn't exist in Overhave database.")
+            return None  # TODO: unlink file and create MR with deletions at the end
+
+        feature_file_ts = self._get_feature_file_ts(feature_file)
+        feature_state = self._get_feature_state(
+            model=feature_model,
+            feature_file_ts=feature_file_ts,
+            get_last_change_time=lambda: self._storage_manager.get_last_change_time(model=feature_model),
+        )
+        if feature_state is _FeatureState.NOT_RELEASED:
+            return None
+        if feature_state is _FeatureState.OUTDATED:
+            self._update_feature(model=feature_model, info=feature_info, file_ts=feature_file_ts)
+        return feature_model.id
+
+    def _synchronize_batch(
+        self, parsed_features: Sequence[ParsedFeature], create_db_features: bool
+    ) -> list[tuple[ParsedFeature, int | None]]:
+        """Synchronize batch of feature files with preloaded database state and bulk writes."""
+        feature_models = self._storage_manager.get_features(
+            parsed_feature.info.id for parsed_feature in parsed_features if parsed_feature.info
+        )
+        last_change_times = self._storage_manager.get_last_change_times(list(feature_models.values()))
+        feature_ids: dict[Path, int | None] = {}
+        created_features: list[ParsedFeature] = []
+        creation_tasks: list[FeatureCreationTask] = []
+        update_tasks: list[FeatureUpdateTask] = []
+        for parsed_feature in parsed_features:
+            logger.info("Synchronize feature from file %s...", parsed_feature.path.as_posix())
+            feature_ids[parsed_feature.path] = None
+            if isinstance(parsed_feature.error, NullableFeatureIdError):
                 logger.warning("Feature has not got Overhave ID or ID format is incorrect.")
-                if not create_db_features:
-                    logger.warning("create_db_features=%s. Skip it.", create_db_features)
-                    continue
-                self._scenario_parser.set_strict_mode(False)
-                optional_feature_info = cast(FeatureInfo, self._scenario_parser.parse(feature_text))
-                self._create_feature(file=feature_file, info=optional_feature_info)
+                if create_db_features:
+                    strict_info = self._get_strict_creation_info(self._get_optional_feature_info(parsed_feature))
+                    file_path = self._get_feature_file_path(file=parsed_feature.path, feature_type=strict_info.type)
+                    creation_tasks.append(FeatureCreationTask(file_path=file_path, info=strict_info))
+                    created_features.append(parsed_feature)
                 continue
-            logger.debug("Parsed feature info: %s", feature_info)
-            feature_model = self._storage_manager.get_feature(feature_info.id)
+            feature_info = self._get_existing_feature_info(parsed_feature)
+            feature_model = feature_models.get(feature_info.id)
             if feature_model is None:
                 logger.warning("Feature doesn't exist in Overhave database.")
-                continue  # TODO: unlink file and create MR with deletions at the end
-
-            feature_file_ts = datetime.fromtimestamp(feature_file.stat().st_mtime, tz=pytz.UTC)
-            if feature_model.last_edited_at == feature_file_ts and feature_model.released:
-                logger.warning("Feature has been already synchronized.")
                 continue
-            last_change_time = self._storage_manager.get_last_change_time(model=feature_model)
-            if last_change_time < feature_file_ts:
-                self._update_feature(model=feature_model, info=feature_info, file_ts=feature_file_ts)
+            feature_state = self._get_feature_state(
+                model=feature_model,
+                feature_file_ts=self._get_feature_file_ts(parsed_feature.path),
+                get_last_change_time=lambda: last_change_times[feature_model.id],
+            )
+            if feature_state is _FeatureState.NOT_RELEASED:
+                continue
+            feature_ids[parsed_feature.path] = feature_model.id
+            if feature_state is _FeatureState.OUTDATED:
+                update_tasks.append(FeatureUpdateTask(model=feature_model, info=feature_info))
+        created_ids = self._storage_manager.write_features(creation_tasks=creation_tasks, update_tasks=update_tasks)
+        feature_ids.update(zip((x.path for x in created_features), created_ids, strict=True))
+        return [(parsed_feature, feature_ids[parsed_feature.path]) for parsed_feature in parsed_features]
+
+    def _synchronize_features(
+        self, parsed_features: Iterable[ParsedFeature], create_db_features: bool, batch_size: int | None
+    ) -> Iterator[tuple[ParsedFeature, int | None]]:
+        if not batch_size:
+            for parsed_feature in parsed_features:
+                yield parsed_feature, self._synchronize_feature(
+                    parsed_feature=parsed_feature, create_db_features=create_db_features
+                )
+            return
+        parsed_features_iterator = iter(parsed_features)
+        while batch := list(itertools.islice(parsed_features_iterator, batch_size)):
+            yield from self._synchronize_batch(parsed_features=batch, create_db_features=create_db_features)
+
+    def _is_feature_file(self, path: Path) -> bool:
+        if not path.is_relative_to(self._file_settings.features_dir) or not path.exists():
+            return False
+        relative_dirs = path.relative_to(self._file_settings.features_dir).parent.parts
+        if any(part.startswith((".", "_")) for part in relative_dirs):
+            return False
+        return self._check_file_compliance(path)
+
+    def _get_manifest_key(self, path: Path) -> str:
+        return path.relative_to(self._file_settings.features_dir).as_posix()
+
+    def _get_diff_feature_files(self, manifest: SynchronizationManifest, head: str) -> list[Path] | None:
+        if manifest.head is None:
+            logger.info("Synchronization manifest has not got git HEAD. Scan all feature files.")
+            return None
+        try:
+            diff_paths = self._git_initializer.get_diff_paths(from_commit=manifest.head, to_commit=head)
+        except GitDiffError:
+            logger.exception("Could not get git diff. Scan all feature files.")
+            return None
+        for deleted_path in diff_paths.deleted:
+            if not deleted_path.is_relative_to(self._file_settings.features_dir):
                 continue
-            if feature_model.released:
-                logger.info("Feature is already actual. Skip.")
+            deleted_key = self._get_manifest_key(deleted_path)
+            manifest.pending.discard(deleted_key)
+            if manifest.entries.pop(deleted_key, None) is not None:
+                logger.warning("Feature file %s has been deleted from repository.", deleted_key)
+        feature_files = {path for path in diff_paths.changed if self._is_feature_file(path)}
+        feature_files.update(
+            self._file_settings.features_dir / key
+            for key in manifest.pending
+            if self._is_feature_file(self._file_settings.features_dir / key)
+        )
+        return sorted(feature_files, key=lambda x: str(x))
+
+    def _get_scanned_feature_files(self, manifest: SynchronizationManifest) -> list[Path]:
+        feature_files = self._extract_recursively(self._file_settings.features_dir)
+        existing_keys = {self._get_manifest_key(path) for path in feature_files}
+        for deleted_key in set(manifest.entries).difference(existing_keys):
+            logger.warning("Feature file %s has been deleted.", deleted_key)
+            del manifest.entries[deleted_key]
+        manifest.pending.intersection_update(existing_keys)
+        return feature_files
+
+    def _is_manifest_feature_changed(
+        self, manifest: SynchronizationManifest, feature_file: Path, file_state: FileState
+    ) -> bool:
+        key = self._get_manifest_key(feature_file)
+        entry = manifest.entries.get(key)
+        if entry is None:
+            return True
+        if entry.content_hash != file_state.content_hash:
+            return True
+        logger.debug("Feature file %s content has not been changed. Skip.", key)
+        manifest.entries[key] = ManifestEntry(**file_state.model_dump(), feature_id=entry.feature_id)
+        return False
+
+    def _get_changed_feature_files(
+        self, manifest: SynchronizationManifest, feature_files: list[Path]
+    ) -> dict[Path, FileState]:
+        changed_files: dict[Path, FileState] = {}
+        for feature_file in feature_files:
+            file_stat = feature_file.stat()
+            entry = manifest.entries.get(self._get_manifest_key(feature_file))
+            if entry is not None and entry.mtime == file_stat.st_mtime and entry.size == file_stat.st_size:
                 continue
-            logger.warning(
-                "Feature was changed soon (at %s), but not released. Skip.",
-                last_change_time.strftime("%d-%m-%Y %H:%M:%S"),
+            file_state = FileState(
+                mtime=file_stat.st_mtime,
+                size=file_stat.st_size,
+                content_hash=get_content_hash(feature_file.read_bytes()),
+            )
+            if self._is_manifest_feature_changed(manifest=manifest, feature_file=feature_file, file_state=file_state):
+                changed_files[feature_file] = file_state
+        return changed_files
+
+    def _synchronize_incrementally(
+        self, create_db_features: bool, pull_repository: bool, workers: int, batch_size: int | None
+    ) -> None:
+        manifest_path = self._file_settings.sync_manifest_path
+        manifest = SynchronizationManifest.load(manifest_path)
+        feature_files: list[Path] | None = None
+        head: str | None = None
+        if pull_repository:
+            head = self._git_initializer.head_commit
+            feature_files = self._get_diff_feature_files(manifest=manifest, head=head)
+        if feature_files is None:
+            feature_files = self._get_scanned_feature_files(manifest)
+        logger.info("Feature files to check: %s", len(feature_files))
+        changed_files = self._get_changed_feature_files(manifest=manifest, feature_files=feature_files)
+        logger.info("Changed feature files: %s", len(changed_files))
+        try:
+            parsed_features = parse_feature_files(
+                parser=self._scenario_parser, paths=list(changed_files), workers=workers
+            )
+            for parsed_feature, feature_id in self._synchronize_features(
+                parsed_features=parsed_features, create_db_features=create_db_features, batch_size=batch_size
+            ):
+                key = self._get_manifest_key(parsed_feature.path)
+                if feature_id is None:
+                    manifest.entries.pop(key, None)
+                    manifest.pending.add(key)
+                    continue
+                manifest.pending.discard(key)
+                manifest.entries[key] = ManifestEntry(
+                    **changed_files[parsed_feature.path].model_dump(), feature_id=feature_id
+                )
+            if head is not None:
+                manifest.head = head
+        finally:
+            manifest.save(manifest_path)
+
+    def synchronize(
+        self,
+        create_db_features: bool = False,
+        pull_repository: bool = False,
+        incremental: bool = False,
+        workers: int = 1,
+        batch_size: int | None = None,
+    ) -> None:
+        if pull_repository:
+            self._git_initializer.pull()
+        logger.info("Start synchronization...")
+        if incremental:
+            self._synchronize_incrementally(
+                create_db_features=create_db_features,
+                pull_repository=pull_repository,
+                workers=workers,
+                batch_size=batch_size,
             )
+            logger.info("Synchronization completed.")
+            return
+        feature_files = self._extract_recursively(self._file_settings.features_dir)
+        parsed_features = parse_feature_files(parser=self._scenario_parser, paths=feature_files, workers=workers)
+        for parsed_feature, feature_id in self._synchronize_features(
+            parsed_features=parsed_features, create_db_features=create_db_features, batch_size=batch_size
+        ):
+            logger.debug("Feature file %s corresponds to feature with ID=%s", parsed_feature.path, feature_id)
         logger.info("Synchronization completed.")
@@ -4,3 +4,4 @@ from .objects import BddStepModel, StepTypeName, public_step
 from .settings import OverhaveAdminLinkSettings, OverhaveStepCollectorSettings, OverhaveTestSettings
 from .step_collector import StepCollector
 from .test_runner import PytestRunner
+from .worker_pool import PytestWorkerError, PytestWorkerPool
@@ -0,0 +1,154 @@
+import json
+import logging
+import resource
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Mapping
+
+import pytest
+from _pytest.reports import CollectReport, TestReport
+
+logger = logging.getLogger(__name__)
+
+_ALLURE_RESULT_SUFFIX = "-result.json"
+_ALLURE_CONTAINER_SUFFIX = "-container.json"
+_ALLURE_ATTACHMENT_MARKER = "-attachment"
+_ALLURE_PACKAGE_LABEL = "package"
+
+
+def get_module_name(nodeid: str) -> str:
+    return Path(nodeid.split("::")[0]).stem
+
+
+class BatchOutcomeRecorder:
+    """Pytest plugin for recording of test outcomes in batch by test runs.
+
+    Test run is identified by name of its fixture module, so mapping ```module_to_run``` should contain
+    fixture module name as key and test run ID as value.
+    """
+
+    def __init__(self, module_to_run: Mapping[str, int]) -> None:
+        self._module_to_run = module_to_run
+        self._executed: set[int] = set()
+        self._failed: set[int] = set()
+
+    @property
+    def module_to_run(self) -> Mapping[str, int]:
+        return self._module_to_run
+
+    def _record(self, report: CollectReport | TestReport) -> None:
+        test_run_id = self._module_to_run.get(get_module_name(report.nodeid))
+        if test_run_id is None:
+            return
+        if isinstance(report, TestReport):
+            self._executed.add(test_run_id)
+        if report.failed:
+            self._failed.add(test_run_id)
+
+    def pytest_collectreport(self, report: CollectReport) -> None:
+        self._record(report)
+
+    def pytest_runtest_logreport(self, report: TestReport) -> None:
+        self._record(report)
+
+    def is_succeeded(self, test_run_id: int) -> bool:
+        return test_run_id in self._executed and test_run_id not in self._failed
+
+
+@dataclass(frozen=True)
+class PytestJob:
+    """Pytest session arguments with mapping of fixture module name to test run ID."""
+
+    args: list[str]
+    module_to_run: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class PytestJobResult:
+    """Result of pytest session: return code, succeeded test runs, peak memory of process in kilobytes and
+    duration of session in seconds."""
+
+    return_code: int
+    succeeded_runs: frozenset[int] = frozenset()
+    max_rss_kb: int = 0
+    duration: float = 0.0
+
+
+def execute_pytest_job(job: PytestJob) -> PytestJobResult:
+    recorder = BatchOutcomeRecorder(module_to_run=job.module_to_run)
+    started_at = time.perf_counter()
+    return_code = pytest.main(job.args, plugins=[recorder])
+    return PytestJobResult(
+        return_code=int(return_code),
+        succeeded_runs=frozenset(x for x in job.module_to_run.values() if recorder.is_succeeded(x)),
+        max_rss_kb=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        duration=time.perf_counter() - started_at,
+    )
+
+
+def _iter_attachment_sources(data: Mapping[str, Any]) -> Iterator[str]:
+    for attachment in data.get("attachments", []):
+        yield attachment["source"]
+    for key in ("steps", "befores", "afters"):
+        for item in data.get(key, []):
+            yield from _iter_attachment_sources(item)
+
+
+def _get_result_test_run(result: Mapping[str, Any], module_to_run: Mapping[str, int]) -> int | None:
+    for label in result.get("labels", []):
+        if label.get("name") != _ALLURE_PACKAGE_LABEL:
+            continue
+        return module_to_run.get(label["value"].rsplit(".", 1)[-1])
+    return None
+
+
+def _copy_with_attachments(file: Path, data: Mapping[str, Any], run_dirs: list[Path]) -> None:
+    for run_dir in run_dirs:
+        shutil.copy(file, run_dir)
+        for source in _iter_attachment_sources(data):
+            shutil.copy(file.parent / source, run_dir)
+
+
+def _split_results(results_dir: Path, module_to_run: Mapping[str, int], run_dirs: Mapping[int, Path]) -> dict[str, int]:
+    result_to_run: dict[str, int] = {}
+    for result_file in results_dir.glob(f"*{_ALLURE_RESULT_SUFFIX}"):
+        result = json.loads(result_file.read_text())
+        test_run_id = _get_result_test_run(result, module_to_run)
+        if test_run_id is None:
+            logger.warning("Could not match Allure result '%s' with any test run!", result_file.name)
+            continue
+        result_to_run[result["uuid"]] = test_run_id
+        _copy_with_attachments(result_file, result, [run_dirs[test_run_id]])
+    return result_to_run
+
+
+def _split_containers(results_dir: Path, result_to_run: Mapping[str, int], run_dirs: Mapping[int, Path]) -> None:
+    for container_file in results_dir.glob(f"*{_ALLURE_CONTAINER_SUFFIX}"):
+        container = json.loads(container_file.read_text())
+        container_runs = {result_to_run[x] for x in container.get("children", []) if x in result_to_run}
+        _copy_with_attachments(container_file, container, [run_dirs[x] for x in sorted(container_runs)])
+
+
+def _is_common_file(file: Path) -> bool:
+    if not file.is_file() or _ALLURE_ATTACHMENT_MARKER in file.name:
+        return False
+    return not file.name.endswith((_ALLURE_RESULT_SUFFIX, _ALLURE_CONTAINER_SUFFIX))
+
+
+def split_allure_results(results_dir: Path, module_to_run: Mapping[str, int]) -> dict[int, Path]:
+    """Split Allure results of batch into results directory per test run.
+
+    Results are matched to test runs by `package` label, containers - by their children results.
+    Common files (like `environment.properties`) are copied into every results directory.
+    """
+    run_dirs = {test_run_id: results_dir / str(test_run_id) for test_run_id in module_to_run.values()}
+    common_files = [file for file in results_dir.iterdir() if _is_common_file(file)]
+    for run_dir in run_dirs.values():
+        run_dir.mkdir()
+        for common_file in common_files:
+            shutil.copy(common_file, run_dir)
+    result_to_run = _split_results(results_dir=results_dir, module_to_run=module_to_run, run_dirs=run_dirs)
+    _split_containers(results_dir=results_dir, result_to_run=result_to_run, run_dirs=run_dirs)
+    return run_dirs
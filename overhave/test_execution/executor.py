@@ -1,19 +1,36 @@
 import abc
 import logging
-import tempfile
+import threading
+from contextlib import ExitStack
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Sequence
 
 from overhave import db
 from overhave.db import TestRunStatus
-from overhave.entities import OverhaveFileSettings, ReportManager
-from overhave.metrics import TestRunOverhaveMetricContainer
+from overhave.entities import OverhaveFileSettings, ReportManager, WorkspaceManager
+from overhave.metrics import PipelineStage, TestRunOverhaveMetricContainer
 from overhave.scenario import FileManager
 from overhave.storage import IFeatureStorage, IScenarioStorage, ITestRunStorage, TestExecutorContext
+from overhave.test_execution.batch import PytestJob, PytestJobResult, execute_pytest_job, split_allure_results
+from overhave.test_execution.settings import OverhaveTestSettings
 from overhave.test_execution.test_runner import PytestRunner
-from overhave.transport import TestRunTask
+from overhave.test_execution.worker_pool import PytestWorkerError, PytestWorkerPool
+from overhave.transport import RedisProducer, ReportData, ReportTask, TestRunTask
 
 logger = logging.getLogger(__name__)
 
+_MIXED_FEATURE_TYPES = "mixed"
+
+
+@dataclass(frozen=True)
+class _PreparedBatch:
+    test_run_ids: Sequence[int]
+    workspace: Path
+    results_dir: Path
+    job: PytestJob
+    feature_type: str
+
 
 class ITestExecutor(abc.ABC):
     """Abstract class for test execution."""
@@ -22,80 +39,257 @@ class ITestExecutor(abc.ABC):
     def execute_test(self, test_run_id: int) -> None:
         pass
 
+    @abc.abstractmethod
+    def execute_tests(self, test_run_ids: Sequence[int]) -> None:
+        pass
+
     @abc.abstractmethod
     def process_test_task(self, task: TestRunTask) -> None:
         pass
 
+    @abc.abstractmethod
+    def process_test_tasks(self, tasks: Sequence[TestRunTask]) -> None:
+        pass
+
 
 class TestExecutor(ITestExecutor):
-    """Class for test execution."""
+    """Class for test execution.
+
+    Pytest sessions inside of current process are run one at a time, because pytest is not thread-safe.
+    Reports are created by consumer of report tasks when ```redis_producer``` is specified,
+    or inside of current process when the task could not be sent.
+    """
 
     def __init__(
         self,
         file_settings: OverhaveFileSettings,
+        test_settings: OverhaveTestSettings,
         feature_storage: IFeatureStorage,
         scenario_storage: IScenarioStorage,
         test_run_storage: ITestRunStorage,
         file_manager: FileManager,
         test_runner: PytestRunner,
         report_manager: ReportManager,
+        workspace_manager: WorkspaceManager,
         metric_container: TestRunOverhaveMetricContainer,
+        worker_pool: PytestWorkerPool | None = None,
+        redis_producer: RedisProducer | None = None,
     ):
         self._file_settings = file_settings
+        self._test_settings = test_settings
         self._feature_storage = feature_storage
         self._scenario_storage = scenario_storage
         self._test_run_storage = test_run_storage
         self._file_manager = file_manager
         self._test_runner = test_runner
         self._report_manager = report_manager
+        self._workspace_manager = workspace_manager
         self._metric_container = metric_container
+        self._worker_pool = worker_pool
+        self._redis_producer = redis_producer
+        self._pytest_lock = threading.Lock()
 
-    def _run_test(self, context: TestExecutorContext, alluredir: Path) -> int:
-        with self._file_manager.tmp_feature_file(context=context) as feature_file:
-            with self._file_manager.tmp_fixture_file(context=context, feature_file=feature_file) as fixture_file:
-                return self._test_runner.run(fixture_file=fixture_file.name, alluredir=alluredir.as_posix())
+    def _run_test(self, context: TestExecutorContext, workspace: Path) -> int:
+        feature_type = context.feature.feature_type.name
+        with ExitStack() as stack:
+            with self._metric_container.track_pipeline_stage(PipelineStage.FILES_GENERATION, feature_type):
+                feature_file = stack.enter_context(
+                    self._file_manager.tmp_feature_file(context=context, directory=workspace)
+                )
+                fixture_file = stack.enter_context(
+                    self._file_manager.tmp_fixture_file(context=context, feature_file=feature_file, directory=workspace)
+                )
+            with self._pytest_lock, self._metric_container.track_pipeline_stage(PipelineStage.PYTEST, feature_type):
+                return self._test_runner.run(
+                    fixture_file=fixture_file.name, alluredir=self._workspace_manager.results_dir(workspace).as_posix()
+                )
 
     def _compile_context(self, test_run_id: int) -> TestExecutorContext:
-        with db.create_session() as session:
-            test_run_model = self._test_run_storage.testrun_model_by_id(session=session, run_id=test_run_id)
-            scenario_model = self._scenario_storage.scenario_model_by_id(
-                session=session, scenario_id=test_run_model.scenario_id
-            )
-            feature_model = self._feature_storage.feature_model_by_id(
-                session=session, feature_id=scenario_model.feature_id
-            )
+        with self._metric_container.track_pipeline_stage(PipelineStage.CONTEXT_COMPILATION) as stage:
+            with db.create_session() as session:
+                test_run_model = self._test_run_storage.testrun_model_by_id(session=session, run_id=test_run_id)
+                scenario_model = self._scenario_storage.scenario_model_by_id(
+                    session=session, scenario_id=test_run_model.scenario_id
+                )
+                feature_model = self._feature_storage.feature_model_by_id(
+                    session=session, feature_id=scenario_model.feature_id
+                )
+            stage.feature_type = feature_model.feature_type.name
         return TestExecutorContext(
             feature=feature_model,
             scenario=scenario_model,
             test_run=test_run_model,
         )
 
+    def _set_internal_error(self, test_run_id: int, error: Exception) -> None:
+        self._test_run_storage.set_run_status(
+            run_id=test_run_id, status=TestRunStatus.INTERNAL_ERROR, traceback=str(error)
+        )
+        self._metric_container.add_test_run_status(status=TestRunStatus.INTERNAL_ERROR.value)
+
+    def _set_run_result(self, test_run_id: int, succeeded: bool) -> None:
+        if succeeded:
+            self._test_run_storage.set_run_status(run_id=test_run_id, status=TestRunStatus.SUCCESS)
+            self._metric_container.add_test_run_status(status=TestRunStatus.SUCCESS.value)
+        else:
+            self._test_run_storage.set_run_status(
+                run_id=test_run_id, status=TestRunStatus.FAILED, traceback="Test run failed!"
+            )
+            self._metric_container.add_test_run_status(status=TestRunStatus.FAILED.value)
+
+    def _create_report(self, test_run_id: int, workspace: Path, feature_type: str) -> None:
+        """Create report from results in ```workspace```, which is released by :class:`ReportManager`."""
+        results_dir = self._workspace_manager.results_dir(workspace)
+        if self._redis_producer is not None and self._redis_producer.add_task(
+            ReportTask(
+                data=ReportData(
+                    test_run_id=test_run_id, results_dir=results_dir, feature_type=feature_type, workspace=workspace
+                )
+            )
+        ):
+            return
+        self._report_manager.create_allure_report(
+            test_run_id=test_run_id, results_dir=results_dir, feature_type=feature_type, workspace=workspace
+        )
+
     def execute_test(self, test_run_id: int) -> None:
         self._test_run_storage.set_run_status(run_id=test_run_id, status=TestRunStatus.RUNNING)
         ctx = self._compile_context(test_run_id)
 
-        results_dir = Path(tempfile.mkdtemp())
-        logger.debug("Allure results directory path: %s", results_dir.as_posix())
+        workspace = self._workspace_manager.create(f"run_{test_run_id}")
+        logger.debug("Test run workspace path: %s", workspace.as_posix())
         try:
-            test_return_code = self._run_test(context=ctx, alluredir=results_dir)
+            test_return_code = self._run_test(context=ctx, workspace=workspace)
         except Exception as e:
             logger.exception("Error!")
-            self._test_run_storage.set_run_status(
-                run_id=test_run_id, status=TestRunStatus.INTERNAL_ERROR, traceback=str(e)
-            )
-            self._metric_container.add_test_run_status(status=TestRunStatus.INTERNAL_ERROR.value)
+            self._set_internal_error(test_run_id=test_run_id, error=e)
+            self._workspace_manager.release(workspace)
             return
 
         logger.debug("Test returncode: %s", test_return_code)
-        if test_return_code == 0:
-            self._test_run_storage.set_run_status(run_id=test_run_id, status=TestRunStatus.SUCCESS)
-            self._metric_container.add_test_run_status(status=TestRunStatus.SUCCESS.value)
-        else:
-            self._test_run_storage.set_run_status(
-                run_id=test_run_id, status=TestRunStatus.FAILED, traceback="Test run failed!"
+        self._set_run_result(test_run_id=test_run_id, succeeded=test_return_code == 0)
+        self._create_report(test_run_id=test_run_id, workspace=workspace, feature_type=ctx.feature.feature_type.name)
+
+    def _compile_contexts(self, test_run_ids: Sequence[int]) -> dict[int, TestExecutorContext]:
+        """Compile contexts of test runs, test runs without context are finished with internal error."""
+        contexts: dict[int, TestExecutorContext] = {}
+        for test_run_id in test_run_ids:
+            try:
+                self._test_run_storage.set_run_status(run_id=test_run_id, status=TestRunStatus.RUNNING)
+                contexts[test_run_id] = self._compile_context(test_run_id)
+            except Exception as e:
+                logger.exception("Could not compile context of test run %s!", test_run_id)
+                self._set_internal_error(test_run_id=test_run_id, error=e)
+        return contexts
+
+    def _prepare_batch(self, test_run_ids: Sequence[int], stack: ExitStack) -> _PreparedBatch | None:
+        contexts = self._compile_contexts(test_run_ids)
+        if not contexts:
+            return None
+        test_run_ids = list(contexts)
+        feature_types = {context.feature.feature_type.name for context in contexts.values()}
+        feature_type = feature_types.pop() if len(feature_types) == 1 else _MIXED_FEATURE_TYPES
+        workspace: Path | None = None
+        try:
+            workspace = self._workspace_manager.create("batch")
+            results_dir = self._workspace_manager.results_dir(workspace)
+            logger.debug("Workspace path for test runs %s: %s", test_run_ids, workspace.as_posix())
+            with self._metric_container.track_pipeline_stage(PipelineStage.FILES_GENERATION, feature_type):
+                fixture_files = stack.enter_context(
+                    self._file_manager.tmp_batch_files(contexts=list(contexts.values()), directory=workspace)
+                )
+            job = self._test_runner.get_batch_job(
+                fixture_files=[file.as_posix() for file in fixture_files.values()],
+                alluredir=results_dir.as_posix(),
+                module_to_run={file.stem: test_run_id for test_run_id, file in fixture_files.items()},
+            )
+        except Exception as e:
+            logger.exception("Could not prepare batch of test runs %s!", test_run_ids)
+            for test_run_id in test_run_ids:
+                self._set_internal_error(test_run_id=test_run_id, error=e)
+            if workspace is not None:
+                self._workspace_manager.release(workspace)
+            return None
+        return _PreparedBatch(
+            test_run_ids=test_run_ids, workspace=workspace, results_dir=results_dir, job=job, feature_type=feature_type
+        )
+
+    def _finish_batch(self, batch: _PreparedBatch, result: PytestJobResult | Exception) -> None:
+        if isinstance(result, Exception):
+            for test_run_id in batch.test_run_ids:
+                self._set_internal_error(test_run_id=test_run_id, error=result)
+            self._workspace_manager.release(batch.workspace)
+            return
+        logger.debug("Tests batch returncode: %s", result.return_code)
+        run_results_dirs = split_allure_results(results_dir=batch.results_dir, module_to_run=batch.job.module_to_run)
+        run_workspaces = {
+            test_run_id: self._workspace_manager.adopt_results(name=f"run_{test_run_id}", results_dir=results_dir)
+            for test_run_id, results_dir in run_results_dirs.items()
+        }
+        self._workspace_manager.release(batch.workspace)
+        for test_run_id in batch.test_run_ids:
+            self._set_run_result(test_run_id=test_run_id, succeeded=test_run_id in result.succeeded_runs)
+            self._create_report(
+                test_run_id=test_run_id, workspace=run_workspaces[test_run_id], feature_type=batch.feature_type
             )
-            self._metric_container.add_test_run_status(status=TestRunStatus.FAILED.value)
-        self._report_manager.create_allure_report(test_run_id=test_run_id, results_dir=results_dir)
+
+    def execute_tests(self, test_run_ids: Sequence[int]) -> None:
+        """Execute several test runs in one pytest session and demultiplex their results."""
+        with ExitStack() as stack:
+            batch = self._prepare_batch(test_run_ids=test_run_ids, stack=stack)
+            if batch is None:
+                return
+            try:
+                with self._pytest_lock, self._metric_container.track_pipeline_stage(
+                    PipelineStage.PYTEST, batch.feature_type
+                ):
+                    result: PytestJobResult | Exception = execute_pytest_job(batch.job)
+            except Exception as e:
+                logger.exception("Error!")
+                result = e
+        self._finish_batch(batch=batch, result=result)
+
+    def _execute_in_worker_pool(self, worker_pool: PytestWorkerPool, batches: Sequence[Sequence[int]]) -> None:
+        with ExitStack() as stack:
+            prepared_batches: list[_PreparedBatch] = []
+            try:
+                for test_run_ids in batches:
+                    batch = self._prepare_batch(test_run_ids=test_run_ids, stack=stack)
+                    if batch is not None:
+                        prepared_batches.append(batch)
+            except Exception as e:
+                for batch in prepared_batches:
+                    self._finish_batch(batch=batch, result=e)
+                raise
+            jobs = ((index, batch.job) for index, batch in enumerate(prepared_batches))
+            for index, result in worker_pool.run_jobs(jobs):
+                batch = prepared_batches[index]
+                if isinstance(result, PytestWorkerError):
+                    logger.error("Error while running tests batch in worker: %s", result)
+                else:
+                    self._metric_container.observe_pipeline_stage(
+                        stage=PipelineStage.PYTEST, seconds=result.duration, feature_type=batch.feature_type
+                    )
+                self._finish_batch(batch=batch, result=result)
 
     def process_test_task(self, task: TestRunTask) -> None:
+        if self._worker_pool is not None:
+            self._execute_in_worker_pool(worker_pool=self._worker_pool, batches=[[task.data.test_run_id]])
+            return
         self.execute_test(test_run_id=task.data.test_run_id)
+
+    def process_test_tasks(self, tasks: Sequence[TestRunTask]) -> None:
+        test_run_ids = [task.data.test_run_id for task in tasks]
+        batch_size = max(self._test_settings.batch_size, 1)
+        batches: list[list[int]] = []
+        for start in range(0, len(test_run_ids), batch_size):
+            stop = start + batch_size
+            batches.append(test_run_ids[start:stop])
+        if self._worker_pool is not None:
+            self._execute_in_worker_pool(worker_pool=self._worker_pool, batches=batches)
+            return
+        for batch in batches:
+            if len(batch) == 1:
+                self.execute_test(test_run_id=batch[0])
+                continue
+            self.execute_tests(test_run_ids=batch)
@@ -41,6 +41,11 @@ class OverhaveTestSettings(BaseOverhavePrefix):
     extra_pytest_addoptions: str | None = Field(default=None)
 
     workers: int | None = Field(default=None, description="Number of xdist workers")
+    batch_size: int = Field(default=1, description="Maximum number of test runs executed in one pytest session")
+
+    worker_pool_size: int | None = Field(default=None, description="Number of pre-forked pytest worker processes")
+    worker_max_runs: int = Field(default=20, description="Number of pytest sessions before worker recycling")
+    worker_max_memory_mb: int | None = Field(default=None, description="Peak worker memory for its recycling")
 
 
 class OverhaveStepCollectorSettings(BaseOverhavePrefix):
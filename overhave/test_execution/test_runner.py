@@ -1,8 +1,10 @@
 import logging
 from pathlib import Path
+from typing import Mapping, Sequence
 
 import pytest
 
+from overhave.test_execution.batch import PytestJob
 from overhave.test_execution.settings import OverhaveTestSettings
 
 logger = logging.getLogger(__name__)
@@ -20,15 +22,25 @@ class PytestRunner:
     def __init__(self, settings: OverhaveTestSettings) -> None:
         self._settings = settings
 
-    def run(self, fixture_file: str, alluredir: str) -> int:
-        pytest_cmd = [fixture_file, f"--alluredir={alluredir}"]
+    def _get_run_cmd(self, fixture_files: Sequence[str], alluredir: str) -> list[str]:
+        pytest_cmd = [*fixture_files, f"--alluredir={alluredir}"]
         for addoptions in (self._settings.default_pytest_addoptions, self._settings.extra_pytest_addoptions):
             _extend_cmd_args(cmd=pytest_cmd, addoptions=addoptions)
         if self._settings.workers is not None:
             pytest_cmd.extend(["-n", f"{self._settings.workers}"])
-
         logger.debug("Prepared pytest args: %s", pytest_cmd)
-        return pytest.main(pytest_cmd)
+        return pytest_cmd
+
+    def run(self, fixture_file: str, alluredir: str) -> int:
+        return pytest.main(self._get_run_cmd(fixture_files=[fixture_file], alluredir=alluredir))
+
+    def get_batch_job(
+        self, fixture_files: Sequence[str], alluredir: str, module_to_run: Mapping[str, int]
+    ) -> PytestJob:
+        """Job for running of fixture files of several test runs in one pytest session."""
+        return PytestJob(
+            args=self._get_run_cmd(fixture_files=fixture_files, alluredir=alluredir), module_to_run=dict(module_to_run)
+        )
 
     def collect_only(self, fixture_file: Path) -> None:
         logger.info("Started tests collection process with '%s'...", fixture_file.name)
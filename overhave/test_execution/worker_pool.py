@@ -0,0 +1,278 @@
+import importlib
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import socket
+import threading
+import time
+from multiprocessing.connection import Connection, wait
+from typing import Callable, Hashable, Iterable, Iterator, TypeVar, cast
+
+from overhave.test_execution.batch import PytestJob, PytestJobResult, execute_pytest_job
+from overhave.test_execution.settings import OverhaveTestSettings
+
+logger = logging.getLogger(__name__)
+
+TJobKey = TypeVar("TJobKey", bound=Hashable)
+
+_WORKER_STOP_TIMEOUT_SECONDS = 10
+_WORKER_POLL_INTERVAL_SECONDS = 0.05
+_PID_SIZE = 8
+
+
+class BasePytestWorkerPoolException(Exception):
+    """Base exception for :class:`PytestWorkerPool`."""
+
+
+class PytestWorkerError(BasePytestWorkerPoolException):
+    """Exception for pytest session failure inside of worker process."""
+
+
+def import_plugins() -> None:
+    """Import pytest-bdd steps modules, so forked workers have them already imported."""
+    from overhave.pytest_plugin import get_proxy_manager
+
+    proxy_manager = get_proxy_manager()
+    if not proxy_manager.has_factory:
+        logger.warning("ProxyManager has not got factory, so steps modules could not be imported in advance.")
+        return
+    for module in proxy_manager.plugin_resolver.get_plugins():
+        try:
+            importlib.import_module(module)
+        except Exception:
+            logger.exception("Could not import steps module '%s' in advance!", module)
+
+
+def _worker_loop(connection: Connection) -> None:
+    while True:
+        job: PytestJob | None = connection.recv()
+        if job is None:
+            return
+        try:
+            connection.send(execute_pytest_job(job))
+        except Exception as e:
+            logger.exception("Error while running pytest in worker!")
+            connection.send(PytestWorkerError(str(e)))
+
+
+def _fork_worker(spawner_socket: socket.socket) -> None:
+    parent_socket, child_socket = socket.socketpair()
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        spawner_socket.close()
+        parent_socket.close()
+        exit_code = 0
+        try:
+            _worker_loop(Connection(child_socket.detach()))
+        except BaseException:
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+    child_socket.close()
+    socket.send_fds(spawner_socket, [pid.to_bytes(_PID_SIZE, "little")], [parent_socket.fileno()])
+    parent_socket.close()
+
+
+def _dispose_inherited_engine() -> None:
+    from overhave.db import metadata
+
+    try:
+        metadata.engine.dispose(close=False)
+    except RuntimeError:
+        return
+
+
+def _spawner_loop(spawner_socket: socket.socket, pool_socket: socket.socket) -> None:
+    pool_socket.close()
+    _dispose_inherited_engine()
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    while spawner_socket.recv(1):
+        _fork_worker(spawner_socket)
+
+
+class _WorkerSpawner:
+    """Single-threaded process, which is forked once from main thread and forks pytest workers on request.
+
+    Workers are forked from the spawner instead of multi-threaded consumer process, so they do not inherit
+    locks held by other threads and open sockets of consumer.
+    """
+
+    def __init__(self) -> None:
+        self._socket, spawner_socket = socket.socketpair()
+        self._process = multiprocessing.get_context("fork").Process(
+            target=_spawner_loop, args=(spawner_socket, self._socket), daemon=True
+        )
+        self._process.start()
+        spawner_socket.close()
+        self._lock = threading.Lock()
+        logger.debug("Started pytest workers spawner with pid=%s", self._process.pid)
+
+    def spawn(self) -> tuple[int, Connection]:
+        with self._lock:
+            try:
+                self._socket.send(b"1")
+                message, fds, _, _ = socket.recv_fds(self._socket, _PID_SIZE, 1)
+            except OSError as e:
+                raise PytestWorkerError("Could not fork pytest worker by spawner!") from e
+        if not fds:
+            raise PytestWorkerError("Pytest workers spawner has unexpectedly died!")
+        return int.from_bytes(message, "little"), Connection(fds[0])
+
+    def stop(self) -> None:
+        self._socket.close()
+        self._process.join(_WORKER_STOP_TIMEOUT_SECONDS)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        logger.debug("Stopped pytest workers spawner with pid=%s", self._process.pid)
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class _PytestWorker:
+    """Forked process, which runs pytest sessions one by one."""
+
+    def __init__(self, spawner: _WorkerSpawner) -> None:
+        self._pid, self.connection = spawner.spawn()
+        self.runs = 0
+        logger.debug("Started pytest worker with pid=%s", self._pid)
+
+    def send(self, job: PytestJob) -> None:
+        self.connection.send(job)
+
+    def receive(self) -> PytestJobResult:
+        try:
+            result: PytestJobResult | PytestWorkerError = self.connection.recv()
+        except EOFError as e:
+            raise PytestWorkerError(f"Pytest worker with pid={self._pid} has unexpectedly died!") from e
+        finally:
+            self.runs += 1
+        if isinstance(result, PytestWorkerError):
+            raise result
+        return result
+
+    def _wait(self, timeout: float) -> bool:
+        deadline = time.monotonic() + timeout
+        while _is_alive(self._pid):
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(_WORKER_POLL_INTERVAL_SECONDS)
+        return True
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except OSError:
+            logger.debug("Pytest worker with pid=%s has already been stopped", self._pid)
+        if not self._wait(_WORKER_STOP_TIMEOUT_SECONDS):
+            os.kill(self._pid, signal.SIGKILL)
+        self.connection.close()
+        logger.debug("Stopped pytest worker with pid=%s", self._pid)
+
+
+class PytestWorkerPool:
+    """Pool of pre-forked processes for pytest sessions.
+
+    Pool should be started with ```start``` from main thread before other threads are started: it runs
+    ```warm_up``` and forks single-threaded spawner, which inherits factory context and imported steps modules.
+    Workers are forked by the spawner, also on recycle. Every worker runs one job at a time and is recycled after
+    ```worker_max_runs``` jobs or when its peak memory exceeds ```worker_max_memory_mb```.
+    Pool is thread-safe: concurrent calls of ```run_jobs``` share idle workers and wait for them.
+    """
+
+    def __init__(self, settings: OverhaveTestSettings, warm_up: Callable[[], None] = import_plugins) -> None:
+        self._settings = settings
+        self._warm_up = warm_up
+        self._spawner: _WorkerSpawner | None = None
+        self._workers: list[_PytestWorker] = []
+        self._idle: queue.SimpleQueue[_PytestWorker] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return max(self._settings.worker_pool_size or 1, 1)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._spawner is None:
+                if threading.current_thread() is not threading.main_thread():
+                    logger.warning("Pytest workers spawner is forked not from main thread!")
+                self._warm_up()
+                self._spawner = _WorkerSpawner()
+            while len(self._workers) < self.size:
+                worker = _PytestWorker(self._spawner)
+                self._workers.append(worker)
+                self._idle.put(worker)
+
+    def _should_recycle(self, worker: _PytestWorker, result: PytestJobResult | None) -> bool:
+        if result is None or worker.runs >= self._settings.worker_max_runs:
+            return True
+        max_memory_mb = self._settings.worker_max_memory_mb
+        return max_memory_mb is not None and result.max_rss_kb > max_memory_mb * 1024
+
+    def _acquire(self, block: bool) -> _PytestWorker | None:
+        try:
+            return self._idle.get(block=block)
+        except queue.Empty:
+            return None
+
+    def _release(self, worker: _PytestWorker, result: PytestJobResult | None) -> None:
+        if self._should_recycle(worker, result):
+            logger.info("Recycle pytest worker after %s runs", worker.runs)
+            worker.stop()
+            with self._lock:
+                self._workers.remove(worker)
+                worker = _PytestWorker(cast(_WorkerSpawner, self._spawner))
+                self._workers.append(worker)
+        self._idle.put(worker)
+
+    def _receive(self, worker: _PytestWorker) -> PytestJobResult | PytestWorkerError:
+        try:
+            return worker.receive()
+        except PytestWorkerError as e:
+            return e
+
+    def run_jobs(
+        self, jobs: Iterable[tuple[TJobKey, PytestJob]]
+    ) -> Iterator[tuple[TJobKey, PytestJobResult | PytestWorkerError]]:
+        """Run jobs in workers and yield their results in order of completion."""
+        self.start()
+        pending = list(jobs)
+        pending.reverse()
+        running: dict[Connection, tuple[TJobKey, _PytestWorker]] = {}
+        try:
+            while pending or running:
+                while pending:
+                    worker = self._acquire(block=not running)
+                    if worker is None:
+                        break
+                    key, job = pending.pop()
+                    worker.send(job)
+                    running[worker.connection] = (key, worker)
+                for connection in wait(list(running)):
+                    key, worker = running.pop(cast(Connection, connection))
+                    result = self._receive(worker)
+                    self._release(worker, result if isinstance(result, PytestJobResult) else None)
+                    yield key, result
+        finally:
+            for _, worker in running.values():
+                self._release(worker, None)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for worker in self._workers:
+                worker.stop()
+            self._workers.clear()
+            self._idle = queue.SimpleQueue()
+            if self._spawner is not None:
+                self._spawner.stop()
+                self._spawner = None
@@ -30,12 +30,15 @@ from .redis import (
     OverhaveRedisSettings,
     PublicationData,
     PublicationTask,
+    RedisChannel,
     RedisConsumer,
     RedisConsumerRunner,
     RedisProducer,
     RedisStream,
+    ReportData,
+    ReportTask,
     TestRunData,
     TestRunTask,
     TRedisTask,
 )
-from .s3 import OverhaveS3Bucket, OverhaveS3ManagerSettings, S3Manager
+from .s3 import OverhaveS3Bucket, OverhaveS3ManagerSettings, S3Manager, S3ObjectReader
@@ -7,7 +7,10 @@ from .objects import (
     EmulationTask,
     PublicationData,
     PublicationTask,
+    RedisChannel,
     RedisStream,
+    ReportData,
+    ReportTask,
     TestRunData,
     TestRunTask,
     TRedisTask,
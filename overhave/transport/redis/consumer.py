@@ -1,7 +1,12 @@
 import logging
+import os
+import socket
+import time
+from functools import cached_property
 from types import TracebackType
-from typing import Iterator, Sequence
+from typing import Iterator, Sequence, cast
 
+import redis
 import walrus
 
 from overhave.metrics import BaseOverhaveMetricContainer
@@ -10,9 +15,19 @@ from overhave.transport.redis.settings import BaseRedisSettings
 
 logger = logging.getLogger(__name__)
 
+_NOGROUP_ERROR_PREFIX = "NOGROUP"
+_StreamMessages = list[tuple[bytes, dict[bytes, bytes]]]
+
 
 class RedisConsumer:
-    """Class for consuming tasks from Redis stream ```stream_name```."""
+    """Class for consuming tasks from Redis stream ```stream_name```.
+
+    When ```settings.max_in_flight``` is greater than 1 or ```settings.reliable_delivery``` is enabled, messages
+    are not acknowledged on read - consumer of messages should call :meth:`ack` after their processing.
+    In reliable mode every process has its own consumer name, pending messages are kept on start and
+    could be taken by :meth:`reclaim` after ```settings.claim_idle_timeout```; consumer is deleted from group
+    on clean exit, when it has not got pending messages anymore.
+    """
 
     def __init__(
         self,
@@ -27,15 +42,49 @@ class RedisConsumer:
         self._metric_container = metric_container
 
     @property
+    def settings(self) -> BaseRedisSettings:
+        return self._settings
+
+    @property
+    def _deferred_ack(self) -> bool:
+        return self._settings.max_in_flight > 1 or self._settings.reliable_delivery
+
+    @property
+    def _group_name(self) -> str:
+        return f"cg-{self._stream_name}"
+
+    @property
+    def _consumer_name(self) -> str:
+        if self._settings.reliable_delivery:
+            return f"{self._group_name}.{socket.gethostname()}-{os.getpid()}"
+        return f"{self._group_name}.c1"
+
+    @cached_property
     def _consumer_group(self) -> walrus.ConsumerGroup:
-        consumer_group = self._database.consumer_group(f"cg-{self._stream_name}", (self._stream_name,))
+        consumer_group = self._database.consumer_group(
+            self._group_name, (self._stream_name,), consumer=self._consumer_name
+        )
         consumer_group.create()
         return consumer_group
 
-    @property
+    @cached_property
     def _stream(self) -> walrus.containers.ConsumerGroupStream:
         return getattr(self._consumer_group, self._stream_name.with_dunder)
 
+    def _reset_handles(self) -> None:
+        self.__dict__.pop("_consumer_group", None)
+        self.__dict__.pop("_stream", None)
+
+    def _read(self, count: int) -> _StreamMessages:
+        try:
+            return cast(_StreamMessages, self._stream.read(count=count, block=self._settings.timeout_milliseconds))
+        except (redis.exceptions.ConnectionError, redis.exceptions.ResponseError) as e:
+            if isinstance(e, redis.exceptions.ResponseError) and not str(e).startswith(_NOGROUP_ERROR_PREFIX):
+                raise
+            logger.warning("Lost consumer group of stream %s, try to recreate it: %s", self._stream_name, e)
+            self._reset_handles()
+        return cast(_StreamMessages, self._stream.read(count=count, block=self._settings.timeout_milliseconds))
+
     def _clean_pending(self) -> None:
         pending_messages = self._stream.pending()
         models: list[RedisPendingData] = [RedisPendingData.model_validate(msg) for msg in pending_messages]
@@ -45,19 +94,78 @@ class RedisConsumer:
             self._stream.ack(*message_ids)
             logger.info("Clean all pending messages for stream %s: %s", self._stream_name, models)
 
-    def _consume(self) -> Sequence[RedisUnreadData]:
-        messages = self._stream.read(count=self._settings.read_count, block=self._settings.timeout_milliseconds)
+    def _consume(self, count: int | None = None) -> Sequence[RedisUnreadData]:
+        messages = self._read(count or self._settings.read_count)
         objects: list[RedisUnreadData] = []
         for msg in messages:
             data = RedisUnreadData(*msg)
             logger.debug("Message from redis: %s", data)
-            self._stream.ack(data.message_id)
+            self._metric_container.observe_redis_task_queue_wait(
+                task_type=self._stream_name.value, seconds=time.time() - data.timestamp
+            )
+            if not self._deferred_ack:
+                self._stream.ack(data.message_id)
             objects.append(data)
         return objects
 
+    def consume(self, count: int) -> Sequence[RedisUnreadData]:
+        """Read not more than ```count``` messages, waiting for them not longer than block timeout."""
+        messages = self._consume(count)
+        if messages:
+            self._metric_container.consume_redis_task(task_type=self._stream_name.value)
+        return messages
+
+    def ack(self, *message_ids: str) -> None:
+        self._stream.ack(*message_ids)
+        logger.debug("Acknowledged messages: %s", message_ids)
+
+    def touch(self, *message_ids: str) -> None:
+        """Reset idle time of pending messages, so they are not reclaimed by other consumers."""
+        self._database.xclaim(
+            self._stream_name.value, self._group_name, self._consumer_name, 0, list(message_ids), justid=True
+        )
+
+    def _move_to_dead_letter(self, message_ids: list[str]) -> None:
+        messages = self._stream.claim(*message_ids, min_idle_time=self._settings.claim_idle_milliseconds)
+        moved_ids: list[bytes | str] = []
+        for message_id, message in messages:
+            if not message:
+                continue
+            self._database.xadd(self._stream_name.dead_letter, {**message, b"message_id": message_id})
+            moved_ids.append(message_id)
+        if not moved_ids:
+            return
+        self._stream.ack(*moved_ids)
+        logger.warning(
+            "Messages %s were delivered %s times and moved to stream %s",
+            moved_ids,
+            self._settings.max_deliveries,
+            self._stream_name.dead_letter,
+        )
+
+    def reclaim(self, count: int) -> Sequence[RedisUnreadData]:
+        """Claim messages, which are pending longer than idle timeout, for processing by current consumer.
+
+        Messages delivered ```settings.max_deliveries``` times are moved into dead-letter stream instead.
+        """
+        pending_messages = self._stream.pending(count=count, idle=self._settings.claim_idle_milliseconds)
+        models = [RedisPendingData.model_validate(msg) for msg in pending_messages]
+        exhausted = [x.message_id for x in models if x.times_delivered >= self._settings.max_deliveries]
+        if exhausted:
+            self._move_to_dead_letter(exhausted)
+        stale = [x.message_id for x in models if x.times_delivered < self._settings.max_deliveries]
+        if not stale:
+            return []
+        messages = self._stream.claim(*stale, min_idle_time=self._settings.claim_idle_milliseconds)
+        objects = [RedisUnreadData(*msg) for msg in messages if msg[1]]
+        if objects:
+            logger.info("Reclaimed pending messages for stream %s: %s", self._stream_name, [str(x) for x in objects])
+        return objects
+
     def __enter__(self) -> None:
         logger.info("Starting consuming from %s...", self._stream_name)
-        self._clean_pending()
+        if not self._settings.reliable_delivery:
+            self._clean_pending()
 
     def __iter__(self) -> Iterator[Sequence[RedisUnreadData]]:
         while True:
@@ -73,5 +181,19 @@ class RedisConsumer:
                 logger.exception("Error while trying to consume message from redis!")
             raise StopIteration()
 
-    def __exit__(self, exc_type: type[Exception], exc_val: Exception, exc_tb: TracebackType) -> None:
-        pass  # no actions on exit required
+    def _delete_consumer(self) -> None:
+        if self._stream.pending(count=1, consumer=self._consumer_name):
+            logger.info("Consumer %s has got pending messages, keep it in group", self._consumer_name)
+            return
+        self._database.xgroup_delconsumer(self._stream_name.value, self._group_name, self._consumer_name)
+        logger.info("Consumer %s has been deleted from group %s", self._consumer_name, self._group_name)
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        if exc_type is not None or not self._settings.reliable_delivery:
+            return
+        try:
+            self._delete_consumer()
+        except redis.exceptions.RedisError:
+            logger.exception("Could not delete consumer %s from group!", self._consumer_name)
@@ -1,8 +1,10 @@
 import abc
 import enum
 import json
+from pathlib import Path
 from typing import Any, TypeVar
 
+from pydantic import ConfigDict
 from pydantic.main import BaseModel
 
 
@@ -12,11 +14,22 @@ class RedisStream(enum.StrEnum):
     TEST = "test"
     PUBLICATION = "publication"
     EMULATION = "emulation"
+    REPORT = "report"
 
     @property
     def with_dunder(self) -> str:
         return self.value.replace("-", "_")
 
+    @property
+    def dead_letter(self) -> str:
+        return f"{self.value}-dead-letter"
+
+
+class RedisChannel(enum.StrEnum):
+    """Enum that declares Redis Pub/Sub channels."""
+
+    SYSTEM_USERS = "system-users"
+
 
 class _IRedisTask(BaseModel, abc.ABC):
     @property
@@ -39,6 +52,8 @@ class TestRunData(BaseModel):
     """Specific data for test run."""
 
     __test__ = False
+    # Data of report task contains test run ID too, so it should not be parsed as test run data.
+    model_config = ConfigDict(extra="forbid")
 
     test_run_id: int
 
@@ -75,8 +90,24 @@ class EmulationTask(BaseRedisTask):
     data: EmulationData
 
 
-TRedisTask = TypeVar("TRedisTask", TestRunTask, EmulationTask, PublicationTask, covariant=True)
-AnyRedisTask = TestRunTask | PublicationTask | EmulationTask
+class ReportData(BaseModel):
+    """Specific data for Allure report generation of test run."""
+
+    test_run_id: int
+    results_dir: Path
+    feature_type: str
+    # Workspace of test run, which is released after report creation
+    workspace: Path | None = None
+
+
+class ReportTask(BaseRedisTask):
+    """Redis stream task for Allure report generation."""
+
+    data: ReportData
+
+
+TRedisTask = TypeVar("TRedisTask", TestRunTask, EmulationTask, PublicationTask, ReportTask, covariant=True)
+AnyRedisTask = TestRunTask | PublicationTask | EmulationTask | ReportTask
 
 
 class RedisPendingData(BaseModel):
@@ -95,6 +126,11 @@ class RedisUnreadData:
         self.message_id = message_id.decode()
         self.message = message
 
+    @property
+    def timestamp(self) -> float:
+        """Time of message addition to stream in seconds since epoch, which is a part of message ID."""
+        return int(self.message_id.split("-", 1)[0]) / 1000
+
     @property
     def decoded_message(self) -> dict[str, Any]:
         return {key.decode(): json.loads(value.decode("utf-8")) for key, value in self.message.items()}
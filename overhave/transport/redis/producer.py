@@ -1,10 +1,11 @@
 import logging
+from typing import Sequence
 
 import redis
 import walrus
 
 from overhave.metrics import BaseOverhaveMetricContainer
-from overhave.transport.redis.objects import BaseRedisTask, RedisStream
+from overhave.transport.redis.objects import BaseRedisTask, RedisChannel, RedisStream
 from overhave.transport.redis.settings import BaseRedisSettings
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,7 @@ class RedisProducer:
         metric_container: BaseOverhaveMetricContainer,
     ):
         self._settings = settings
+        self._database = database
         self._streams = {task: database.Stream(stream.value) for task, stream in mapping.items()}
         self._mapping = mapping
         self._metric_container = metric_container
@@ -32,9 +34,40 @@ class RedisProducer:
         stream = self._streams[type(task)]
         logger.info("Added Redis task %s", task)
         try:
-            stream.add(task.message)
+            stream.add(task.message, maxlen=self._settings.stream_max_len)
             self._metric_container.produce_redis_task(task_type=self._mapping[type(task)].value)
             return True
         except redis.exceptions.ConnectionError:
             logger.exception("Could not add %s to Redis!", type(task).__name__)
             return False
+
+    def add_tasks(self, tasks: Sequence[BaseRedisTask]) -> list[bool]:
+        """Send tasks in one pipeline and return success flag for every task."""
+        if not tasks:
+            return []
+        try:
+            with self._database.pipeline(transaction=False) as pipeline:
+                for task in tasks:
+                    pipeline.xadd(self._mapping[type(task)].value, task.message, maxlen=self._settings.stream_max_len)
+                results = pipeline.execute(raise_on_error=False)
+        except redis.exceptions.ConnectionError:
+            logger.exception("Could not add %s tasks to Redis!", len(tasks))
+            return [False] * len(tasks)
+        succeeded: list[bool] = []
+        for task, result in zip(tasks, results):
+            if isinstance(result, Exception):
+                logger.error("Could not add %s to Redis: %s", type(task).__name__, result)
+                succeeded.append(False)
+                continue
+            self._metric_container.produce_redis_task(task_type=self._mapping[type(task)].value)
+            succeeded.append(True)
+        logger.info("Added %s of %s Redis tasks", sum(succeeded), len(tasks))
+        return succeeded
+
+    def publish(self, channel: RedisChannel, message: str) -> bool:
+        try:
+            self._database.publish(channel.value, message)
+            return True
+        except redis.exceptions.ConnectionError:
+            logger.exception("Could not publish message to Redis channel '%s'!", channel.value)
+            return False
@@ -0,0 +1,69 @@
+import logging
+import queue
+import threading
+from typing import Iterable
+
+from overhave.transport.redis.consumer import RedisConsumer
+from overhave.transport.redis.objects import RedisUnreadData
+
+logger = logging.getLogger(__name__)
+
+
+class RedisReclaimer:
+    """Background keeper of pending messages for reliable delivery mode of :class:`RedisConsumer`.
+
+    Every ```reclaim_interval``` reclaimer touches in-flight messages of current consumer, so they are not taken
+    by other consumers during long processing, and reclaims stale pending messages of failed consumers.
+    Reclaimed messages are queued until they are taken by :meth:`take`.
+    """
+
+    def __init__(self, consumer: RedisConsumer) -> None:
+        self._consumer = consumer
+        self._in_flight: set[str] = set()
+        self._lock = threading.Lock()
+        self._reclaimed: queue.SimpleQueue[RedisUnreadData] = queue.SimpleQueue()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="redis-reclaimer", daemon=True)
+
+    def track(self, message_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._in_flight.update(message_ids)
+
+    def untrack(self, message_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._in_flight.difference_update(message_ids)
+
+    def take(self, count: int) -> list[RedisUnreadData]:
+        messages: list[RedisUnreadData] = []
+        while len(messages) < count:
+            try:
+                messages.append(self._reclaimed.get_nowait())
+            except queue.Empty:
+                break
+        return messages
+
+    def tick(self) -> None:
+        with self._lock:
+            in_flight = list(self._in_flight)
+        if in_flight:
+            self._consumer.touch(*in_flight)
+        if not self._reclaimed.empty():
+            return
+        messages = self._consumer.reclaim(count=self._consumer.settings.read_count)
+        self.track(x.message_id for x in messages)
+        for message in messages:
+            self._reclaimed.put(message)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._consumer.settings.reclaim_interval.total_seconds()):
+            try:
+                self.tick()
+            except Exception:
+                logger.exception("Error while reclaiming of pending messages!")
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
@@ -1,8 +1,16 @@
 import logging
-from typing import Callable
+import signal
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Iterator, Sequence
 
 from overhave.transport.redis.consumer import RedisConsumer
 from overhave.transport.redis.objects import AnyRedisTask, RedisContainer, RedisUnreadData
+from overhave.transport.redis.reclaimer import RedisReclaimer
 
 logger = logging.getLogger(__name__)
 
@@ -13,21 +21,73 @@ class RedisConsumerRunnerException(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class _ProcessingUnit:
+    message_ids: list[str]
+    process: Callable[[], None]
+
+
 class RedisConsumerRunner:
     """Class for running tasks specified by ```mapping```.
 
     Runner tasks launch with instance of :class:`RedisConsumer` ```consumer```.
+    Tasks with type from ```batch_mapping``` are processed by all consumed messages at once.
+
+    When consumer setting ```max_in_flight``` is greater than 1, tasks are processed concurrently in pool of threads:
+    runner reads only as many messages as there are free slots and acknowledges every message after its processing.
+    Errors of concurrent tasks are logged and do not stop the runner. On :meth:`stop` or SIGTERM runner stops
+    reading of new messages and waits for in-flight tasks.
+
+    When consumer setting ```reliable_delivery``` is enabled, messages are processed in the same way, but
+    acknowledged only after successful processing. Pending messages are kept alive and reclaimed
+    by :class:`RedisReclaimer`, so failed messages are redelivered until ```max_deliveries```.
     """
 
     def __init__(
-        self, consumer: RedisConsumer, mapping: dict[type[AnyRedisTask], Callable[[AnyRedisTask], None]]
+        self,
+        consumer: RedisConsumer,
+        mapping: dict[type[AnyRedisTask], Callable[[AnyRedisTask], None]],
+        batch_mapping: dict[type[AnyRedisTask], Callable[[Sequence[AnyRedisTask]], None]] | None = None,
     ) -> None:
         self._consumer = consumer
         self._mapping = mapping
+        self._batch_mapping = batch_mapping or {}
+        self._shutdown = threading.Event()
+        self._reliable = consumer.settings.reliable_delivery
+        self._reclaimer = RedisReclaimer(consumer) if self._reliable else None
+
+    @property
+    def _max_in_flight(self) -> int:
+        return max(self._consumer.settings.max_in_flight, 1)
+
+    @property
+    def _slots_count(self) -> int:
+        if self._max_in_flight > 1:
+            return self._max_in_flight
+        return max(self._consumer.settings.read_count, 1)
+
+    def stop(self) -> None:
+        logger.info("Stop consuming of new messages...")
+        self._shutdown.set()
+
+    @contextmanager
+    def _handle_termination(self) -> Iterator[None]:
+        if threading.current_thread() is not threading.main_thread():
+            yield
+            return
+        previous_handler = signal.signal(signal.SIGTERM, lambda *_: self.stop())
+        try:
+            yield
+        finally:
+            signal.signal(signal.SIGTERM, previous_handler)
 
     def run(self) -> None:
         try:
-            self._run()
+            with self._handle_termination():
+                if self._max_in_flight > 1 or self._reliable:
+                    self._run_in_pool()
+                else:
+                    self._run()
         except Exception as e:
             raise RedisConsumerRunnerException from e
 
@@ -36,10 +96,102 @@ class RedisConsumerRunner:
     def _run(self) -> None:
         with self._consumer:
             for message_sequence in self._consumer:
-                for msg in message_sequence:
-                    self._process(msg)
+                if self._batch_mapping:
+                    self._process_batch(message_sequence)
+                else:
+                    for msg in message_sequence:
+                        self._process(msg)
+                if self._shutdown.is_set():
+                    return
+
+    def _acquire_slots(self, slots: threading.BoundedSemaphore) -> int:
+        if not slots.acquire(timeout=self._consumer.settings.block_timeout.total_seconds()):
+            return 0
+        acquired = 1
+        while acquired < self._consumer.settings.read_count and slots.acquire(blocking=False):
+            acquired += 1
+        return acquired
+
+    def _complete(self, future: Future[Any], message_ids: list[str], slots: threading.BoundedSemaphore) -> None:
+        try:
+            error = future.exception()
+            if error is not None:
+                logger.error("Error while processing messages %s!", message_ids, exc_info=error)
+            if error is None or not self._reliable:
+                self._consumer.ack(*message_ids)
+        finally:
+            if self._reclaimer is not None:
+                self._reclaimer.untrack(message_ids)
+            for _ in message_ids:
+                slots.release()
+
+    def _read(self, count: int) -> Sequence[RedisUnreadData]:
+        if self._reclaimer is None:
+            return self._consumer.consume(count=count)
+        messages = self._reclaimer.take(count) or self._consumer.consume(count=count)
+        self._reclaimer.track(x.message_id for x in messages)
+        return messages
+
+    @contextmanager
+    def _reclaiming(self) -> Iterator[None]:
+        if self._reclaimer is None:
+            yield
+            return
+        self._reclaimer.start()
+        try:
+            yield
+        finally:
+            self._reclaimer.stop()
+
+    def _run_in_pool(self) -> None:
+        slots = threading.BoundedSemaphore(self._slots_count)
+        executor = ThreadPoolExecutor(max_workers=self._max_in_flight, thread_name_prefix="redis-consumer")
+        with self._consumer, self._reclaiming(), executor:
+            while not self._shutdown.is_set():
+                acquired = self._acquire_slots(slots)
+                if not acquired:
+                    continue
+                if self._shutdown.is_set():
+                    for _ in range(acquired):
+                        slots.release()
+                    break
+                messages = self._read(count=acquired)
+                for _ in range(acquired - len(messages)):
+                    slots.release()
+                for unit in self._get_processing_units(messages):
+                    future = executor.submit(unit.process)
+                    future.add_done_callback(partial(self._complete, message_ids=unit.message_ids, slots=slots))
+            logger.info("Waiting for in-flight tasks...")
+
+    def _process_task(self, task: AnyRedisTask) -> None:
+        logger.info("Gotten ready for test_execution BaseRedisTask: %s", task)
+        self._mapping[type(task)](task)
+
+    def _process_tasks(self, task_type: type[AnyRedisTask], tasks: list[AnyRedisTask]) -> None:
+        logger.info("Gotten ready for test_execution batch of %s BaseRedisTasks: %s", len(tasks), tasks)
+        self._batch_mapping[task_type](tasks)
 
     def _process(self, data: RedisUnreadData) -> None:
-        container = RedisContainer(task=data.decoded_message)
-        logger.info("Gotten ready for test_execution BaseRedisTask: %s", container.task)
-        self._mapping[type(container.task)](container.task)
+        self._process_task(RedisContainer(task=data.decoded_message).task)
+
+    def _get_processing_units(self, message_sequence: Sequence[RedisUnreadData]) -> list[_ProcessingUnit]:
+        messages_by_type: dict[type[AnyRedisTask], list[tuple[str, AnyRedisTask]]] = defaultdict(list)
+        for msg in message_sequence:
+            task = RedisContainer(task=msg.decoded_message).task
+            messages_by_type[type(task)].append((msg.message_id, task))
+        units: list[_ProcessingUnit] = []
+        for task_type, messages in messages_by_type.items():
+            if task_type in self._batch_mapping:
+                tasks = [task for _, task in messages]
+                process = partial(self._process_tasks, task_type, tasks)
+                units.append(_ProcessingUnit(message_ids=[message_id for message_id, _ in messages], process=process))
+                continue
+            units.extend(
+                _ProcessingUnit(message_ids=[message_id], process=partial(self._process_task, task))
+                for message_id, task in messages
+            )
+        return units
+
+    def _process_batch(self, message_sequence: Sequence[RedisUnreadData]) -> None:
+        for unit in self._get_processing_units(message_sequence):
+            unit.process()
@@ -11,12 +11,29 @@ class BaseRedisSettings(BaseSettings):
     db: int = 0
     block_timeout: timedelta = timedelta(seconds=1)
     read_count: int = 1
+    # Maximum number of messages, which are processed concurrently by one consumer.
+    # Messages are acknowledged after processing when value is greater than 1.
+    max_in_flight: int = 1
+    # Acknowledge messages only after successful processing and redeliver messages of failed consumers.
+    reliable_delivery: bool = False
+    # Pending messages, which were not touched during this time, are redelivered to another consumer.
+    claim_idle_timeout: timedelta = timedelta(minutes=5)
+    # Interval of touching of in-flight messages and reclaiming of stale ones, should be less than idle timeout.
+    reclaim_interval: timedelta = timedelta(seconds=30)
+    # Messages delivered this number of times are moved into dead-letter stream.
+    max_deliveries: int = 3
+    # Approximate maximum length of streams, which are trimmed by producer on every task addition.
+    stream_max_len: int | None = None
     socket_timeout: timedelta = timedelta(seconds=5)
 
     @property
     def timeout_milliseconds(self) -> int:
         return int(self.block_timeout.total_seconds() * 1000)
 
+    @property
+    def claim_idle_milliseconds(self) -> int:
+        return int(self.claim_idle_timeout.total_seconds() * 1000)
+
     class Config:
         env_prefix = "OVERHAVE_REDIS_"
 
@@ -1,4 +1,5 @@
 # flake8: noqa
 from .manager import S3Manager
 from .objects import OverhaveS3Bucket
+from .reader import S3ObjectReader
 from .settings import OverhaveS3ManagerSettings
@@ -1,7 +1,11 @@
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import timedelta
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator, Sequence
 
 import boto3
 import botocore.exceptions
@@ -14,14 +18,19 @@ from overhave.transport.s3.models import (
     LIST_OBJECT_MODEL_ADAPTER,
     BucketModel,
     DeletionResultModel,
+    DeletionSummary,
     ObjectModel,
 )
 from overhave.transport.s3.objects import OverhaveS3Bucket
+from overhave.transport.s3.reader import S3ObjectReader
 from overhave.transport.s3.settings import OverhaveS3ManagerSettings
 from overhave.utils import make_url
 
 logger = logging.getLogger(__name__)
 
+# S3 returns at most 1000 keys in one listing page and deletes at most 1000 keys in one request.
+_MAX_KEYS = 1000
+
 
 class BaseS3ManagerException(Exception):
     """Base exception for :class:`S3Manager`."""
@@ -51,6 +60,12 @@ class EmptyObjectsListError(BaseS3ManagerException):
     """Exception for situation with empty object list."""
 
 
+def _iter_batches(objects: Iterable[ObjectModel]) -> Iterator[list[ObjectModel]]:
+    iterator = iter(objects)
+    while batch := list(islice(iterator, _MAX_KEYS)):
+        yield batch
+
+
 def _s3_error(msg: str):  # type: ignore
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         def wrapper(*args: Any, **kwargs: dict[str, Any]) -> Any:
@@ -144,17 +159,78 @@ class S3Manager:
             logger.exception("Could not upload file to s3 cloud!")
             return False
 
+    def _upload_part(self, bucket: str, key: str, upload_id: str, number: int, body: bytes) -> dict[str, Any]:
+        response = self._ensured_client.upload_part(
+            Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=body
+        )
+        return {"ETag": response["ETag"], "PartNumber": number}
+
+    def _upload_parts(self, chunks: Iterable[bytes], bucket: str, key: str, upload_id: str) -> int:
+        parts: list[dict[str, Any]] = []
+        buffer = bytearray()
+        uploaded_bytes = 0
+        for chunk in chunks:
+            buffer += chunk
+            while len(buffer) >= self._settings.multipart_chunk_size:
+                body = bytes(buffer[: self._settings.multipart_chunk_size])
+                del buffer[: self._settings.multipart_chunk_size]
+                parts.append(self._upload_part(bucket, key, upload_id, number=len(parts) + 1, body=body))
+                uploaded_bytes += len(body)
+        if buffer or not parts:
+            parts.append(self._upload_part(bucket, key, upload_id, number=len(parts) + 1, body=bytes(buffer)))
+            uploaded_bytes += len(buffer)
+        self._ensured_client.complete_multipart_upload(
+            Bucket=bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+        )
+        return uploaded_bytes
+
+    def upload_stream(self, chunks: Iterable[bytes], key: str, bucket: OverhaveS3Bucket) -> int | None:
+        """Upload stream of bytes with multipart upload, which keeps in memory only one part.
+
+        Returns number of uploaded bytes or None, when upload has been failed and aborted.
+        Upload is aborted on any other error too, which is raised then.
+        """
+        logger.info("Start streaming upload of object '%s'...", key)
+        upload_id: str | None = None
+        try:
+            upload_id = self._ensured_client.create_multipart_upload(Bucket=bucket.value, Key=key)["UploadId"]
+            uploaded_bytes = self._upload_parts(chunks, bucket=bucket.value, key=key, upload_id=upload_id)
+            logger.info("Object '%s' successfully uploaded, size: %s bytes", key, uploaded_bytes)
+            return uploaded_bytes
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError, OSError):
+            logger.exception("Could not upload stream to s3 cloud!")
+        except BaseException:
+            if upload_id is not None:
+                self._abort_multipart_upload(bucket=bucket.value, key=key, upload_id=upload_id)
+            raise
+        if upload_id is not None:
+            self._abort_multipart_upload(bucket=bucket.value, key=key, upload_id=upload_id)
+        return None
+
+    def _abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        try:
+            self._ensured_client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError):
+            logger.exception("Could not abort multipart upload of object '%s'!", key)
+
     @_s3_error(msg="Error while getting bucket objects list!")
+    def _get_objects_page(self, pages: Iterator[dict[str, Any]]) -> dict[str, Any] | None:
+        return next(pages, None)
+
+    def iter_bucket_objects(self, bucket: str) -> Iterator[ObjectModel]:
+        """Iterate over all bucket objects, which are listed by pages with continuation tokens."""
+        paginator = self._ensured_client.get_paginator("list_objects_v2")
+        pages = iter(paginator.paginate(Bucket=bucket, FetchOwner=True, PaginationConfig={"PageSize": _MAX_KEYS}))
+        while (page := self._get_objects_page(pages)) is not None:
+            logger.debug("Got %s objects in listing page of bucket '%s'", page.get("KeyCount"), bucket)
+            yield from LIST_OBJECT_MODEL_ADAPTER.validate_python(page.get("Contents", []))
+
     def get_bucket_objects(self, bucket: str) -> list[ObjectModel]:
-        response = self._ensured_client.list_objects(Bucket=bucket)
-        logger.debug("List objects response:\n%s", response)
-        return LIST_OBJECT_MODEL_ADAPTER.validate_python(response.get("Contents"))
+        return list(self.iter_bucket_objects(bucket))
 
     @_s3_error(msg="Error while deleting bucket objects!")
-    def delete_bucket_objects(self, bucket: str, objects: list[ObjectModel]) -> DeletionResultModel:
-        if not objects:
-            raise EmptyObjectsListError("No one object specified for deletion!")
-        logger.info("Deleting items %s...", [obj.name for obj in objects])
+    def _delete_objects(self, bucket: str, objects: Sequence[ObjectModel]) -> DeletionResultModel:
+        logger.debug("Deleting items %s...", [obj.name for obj in objects])
         response = self._ensured_client.delete_objects(
             Bucket=bucket,
             Delete={"Objects": [{"Key": obj.name} for obj in objects]},
@@ -162,16 +238,75 @@ class S3Manager:
         logger.debug("Delete objects response:\n%s", response)
         return DeletionResultModel.model_validate(response)
 
-    def _ensure_bucket_clean(self, bucket: str) -> None:
-        objects = self.get_bucket_objects(bucket)
+    def delete_bucket_objects(self, bucket: str, objects: list[ObjectModel]) -> DeletionResultModel:
         if not objects:
+            raise EmptyObjectsListError("No one object specified for deletion!")
+        logger.info("Deleting items %s...", [obj.name for obj in objects])
+        results: list[DeletionResultModel] = [
+            self._delete_objects(bucket=bucket, objects=batch) for batch in _iter_batches(objects)
+        ]
+        if len(results) == 1:
+            return results[0]
+        return DeletionResultModel(
+            Deleted=[obj for result in results for obj in result.deleted or []],
+            Errors=[obj for result in results for obj in result.errors or []],
+        )
+
+    def _delete_batch(self, bucket: str, objects: Sequence[ObjectModel]) -> DeletionSummary:
+        result = self._delete_objects(bucket=bucket, objects=objects)
+        deleted = {obj.name for obj in result.deleted or []}
+        for error in result.errors or []:
+            logger.warning("Could not delete object '%s': %s", error.name, error.message)
+        return DeletionSummary(
+            deleted=len(deleted),
+            errors=len(result.errors or []),
+            size=sum(obj.size for obj in objects if obj.name in deleted),
+        )
+
+    @staticmethod
+    def _collect_done(
+        futures: list[Future[DeletionSummary]], summary: DeletionSummary
+    ) -> list[Future[DeletionSummary]]:
+        pending = []
+        for future in futures:
+            if not future.done():
+                pending.append(future)
+                continue
+            result = future.result()
+            summary.deleted += result.deleted
+            summary.errors += result.errors
+            summary.size += result.size
+        return pending
+
+    def delete_objects_in_batches(
+        self, bucket: str, objects: Iterable[ObjectModel], concurrency: int = 1
+    ) -> DeletionSummary:
+        """Delete objects by batches of 1000 keys with ```concurrency``` parallel requests.
+
+        Objects are taken from iterable lazily, so not more than ```concurrency``` batches are held in memory.
+        """
+        summary = DeletionSummary()
+        slots = threading.BoundedSemaphore(concurrency)
+        futures: list[Future[DeletionSummary]] = []
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="s3-deletion") as executor:
+            for batch in _iter_batches(objects):
+                slots.acquire()
+                futures = self._collect_done(futures, summary)
+                future = executor.submit(self._delete_batch, bucket=bucket, objects=batch)
+                future.add_done_callback(lambda _: slots.release())
+                futures.append(future)
+            wait(futures)
+            self._collect_done(futures, summary)
+        logger.info("Deleted %s objects from bucket '%s', %s errors.", summary.deleted, bucket, summary.errors)
+        return summary
+
+    def _ensure_bucket_clean(self, bucket: str) -> None:
+        summary = self.delete_objects_in_batches(bucket=bucket, objects=self.iter_bucket_objects(bucket))
+        if not summary.deleted and not summary.errors:
             logger.info("Has not got any objects in bucket '%s'.", bucket)
             return
-        deletion_result = self.delete_bucket_objects(bucket=bucket, objects=objects)
-        if len(deletion_result.deleted) != len(objects):
-            logger.warning("Expected %s deleted objects, got %s!", len(objects), len(deletion_result.deleted))
-            logger.warning("Errors while deleted items:\n%s", deletion_result.errors)
-        logger.info("Items %s successfully deleted.", [obj.name for obj in deletion_result.deleted])
+        if summary.errors:
+            logger.warning("Could not delete %s objects from bucket '%s'!", summary.errors, bucket)
 
     @_s3_error("Error while deleting bucket!")
     def delete_bucket(self, bucket: str, force: bool = False) -> None:
@@ -193,6 +328,24 @@ class S3Manager:
             logger.exception("Could not download file from s3 cloud!")
             return False
 
+    @_s3_error(msg="Error while getting range of object!")
+    def _get_object_range(self, bucket: str, key: str, start: int, end: int) -> bytes:
+        response = self._ensured_client.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end}")
+        return bytes(response["Body"].read())
+
+    def open_object(self, bucket: str, key: str) -> S3ObjectReader | None:
+        """Open object for random access reading with ranged GET requests without downloading of whole object."""
+        try:
+            response = self._ensured_client.head_object(Bucket=bucket, Key=key)
+        except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError):
+            logger.exception("Could not get s3 cloud object '%s'!", key)
+            return None
+        return S3ObjectReader(
+            size=response["ContentLength"],
+            get_range=partial(self._get_object_range, bucket, key),
+            block_size=self._settings.range_block_size,
+        )
+
     def create_presigned_url(self, bucket: str, object_name: str, expiration: timedelta) -> httpx.URL | None:
         try:
             response = self._ensured_client.generate_presigned_url(
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -73,3 +74,12 @@ class DeletionResultModel(BaseModel):
         if deleted is None and errors is None:
             raise ValueError("At least one result field should be presented!")
         return values
+
+
+@dataclass
+class DeletionSummary:
+    """Summary of objects deletion in batches."""
+
+    deleted: int = 0
+    errors: int = 0
+    size: int = 0
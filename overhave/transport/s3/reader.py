@@ -0,0 +1,62 @@
+import io
+import os
+from typing import Callable
+
+# Function, which returns bytes of object in range [start, end] inclusively.
+RangeGetter = Callable[[int, int], bytes]
+
+
+class S3ObjectReader(io.RawIOBase):
+    """Seekable read-only file object over s3 cloud object, which reads data with ranged GET requests.
+
+    Every request reads at least ```block_size``` bytes, and the last read block is kept for following reads.
+    """
+
+    def __init__(self, size: int, get_range: RangeGetter, block_size: int) -> None:
+        self._size = size
+        self._get_range = get_range
+        self._block_size = block_size
+        self._position = 0
+        self._block_start = 0
+        self._block = b""
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}!")
+        self._position = offset
+        return self._position
+
+    def _in_block(self, start: int, end: int) -> bool:
+        return self._block_start <= start and end <= self._block_start + len(self._block)
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        end = min(self._position + len(buffer), self._size)
+        if end <= self._position:
+            return 0
+        if not self._in_block(self._position, end):
+            block_end = min(max(end, self._position + self._block_size), self._size)
+            self._block = self._get_range(self._position, block_end - 1)
+            self._block_start = self._position
+        offset = self._position - self._block_start
+        stop = offset + end - self._position
+        data = self._block[offset:stop]
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
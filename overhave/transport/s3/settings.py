@@ -16,6 +16,10 @@ class OverhaveS3ManagerSettings(BaseSettings):
     verify: bool = True
 
     autocreate_buckets: bool = False
+    # Size of parts for streaming multipart upload, S3 requires at least 5 MiB for every part except the last one.
+    multipart_chunk_size: int = Field(default=8 * 1024 * 1024, ge=5 * 1024 * 1024)
+    # Minimum size of ranged GET request while reading of objects by parts.
+    range_block_size: int = Field(default=256 * 1024, gt=0)
 
     class Config:
         env_prefix = "OVERHAVE_S3_"
@@ -0,0 +1,61 @@
+"""Micro-benchmark of :class:`ScenarioParser` over a corpus of generated features.
+
+Usage: python -m tests.benchmarks.parser_benchmark [--features 1000] [--scenarios 10] [--repeat 5]
+"""
+import argparse
+import timeit
+
+from overhave import OverhaveLanguageSettings, OverhaveScenarioCompilerSettings, OverhaveScenarioParserSettings
+from overhave.scenario import ScenarioParser
+from tests.objects import get_test_feature_extractor
+
+
+def _generate_feature(feature_id: int, scenarios: int, settings: OverhaveScenarioCompilerSettings) -> str:
+    feature_type = get_test_feature_extractor().feature_types[feature_id % 3]
+    header = (
+        f"{settings.tag_prefix}{feature_type} {settings.tag_prefix}tag_{feature_id} {settings.severity_prefix}normal\n"
+        f"Feature: generated feature {feature_id}\n"
+        f"{settings.id_prefix} {feature_id}\n"
+        f"{settings.created_by_prefix} author {settings.blocks_delimiter} {settings.last_edited_by_prefix} editor"
+        f"{settings.time_delimiter} 10-10-2021 11:00:00 {settings.blocks_delimiter}\n"
+        f"Tasks: PRJ-{feature_id}, PRJ-{feature_id + 1}"
+    )
+    blocks = [
+        f"Scenario Outline: scenario {number}\n"
+        f"  Given I am user_{number}\n"
+        f'  When I say "<phrase>"\n'
+        f"  Then I see answer\n\n"
+        f"  Examples:\n"
+        f"    | phrase |\n"
+        f"    | hello  |"
+        for number in range(scenarios)
+    ]
+    return "\n\n".join([header, *blocks])
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--features", type=int, default=1000)
+    arg_parser.add_argument("--scenarios", type=int, default=10)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    compilation_settings = OverhaveScenarioCompilerSettings()
+    parser = ScenarioParser(
+        parser_settings=OverhaveScenarioParserSettings(parser_strict_mode=True),
+        compilation_settings=compilation_settings,
+        language_settings=OverhaveLanguageSettings(),
+        feature_extractor=get_test_feature_extractor(),
+        tasks_keyword="Tasks",
+    )
+    corpus = [_generate_feature(x, args.scenarios, compilation_settings) for x in range(1, args.features + 1)]
+    timings = timeit.repeat(lambda: [parser.parse(x) for x in corpus], number=1, repeat=args.repeat)
+    best = min(timings)
+    print(
+        f"Parsed {len(corpus)} features ({sum(len(x) for x in corpus)} chars) x {args.repeat}: "
+        f"best {best:.4f}s, {best / len(corpus) * 1e6:.1f}us per feature"
+    )
+
+
+if __name__ == "__main__":
+    main()
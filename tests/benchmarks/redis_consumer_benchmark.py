@@ -0,0 +1,66 @@
+"""Benchmark of Redis commands issued by :class:`RedisConsumer` per consumed message.
+
+Compares consumer with cached consumer group and stream handles against consumer, which recreates them
+on every access (previous behaviour). Requires running Redis, stream `emulation` in specified database is cleared.
+
+Usage: python -m tests.benchmarks.redis_consumer_benchmark [--url redis://localhost:6379] [--db 15]
+    [--messages 1000] [--read-count 1]
+"""
+import argparse
+from typing import Any
+
+import walrus
+
+from overhave.metrics import get_common_metric_container
+from overhave.transport import EmulationData, EmulationTask, RedisConsumer, RedisStream
+from overhave.transport.redis.settings import BaseRedisSettings
+
+
+class _CountingDatabase(walrus.Database):
+    commands = 0
+
+    def execute_command(self, *args: Any, **options: Any) -> Any:
+        self.commands += 1
+        return super().execute_command(*args, **options)
+
+
+class _RecreatingConsumer(RedisConsumer):
+    @property
+    def _stream(self) -> walrus.containers.ConsumerGroupStream:
+        self._reset_handles()
+        return RedisConsumer._stream.__get__(self)
+
+
+def _measure(consumer_class: type[RedisConsumer], database: _CountingDatabase, args: argparse.Namespace) -> float:
+    stream = RedisStream.EMULATION
+    database.delete(stream.value)
+    for run_id in range(args.messages):
+        database.xadd(stream.value, EmulationTask(data=EmulationData(emulation_run_id=run_id)).message)
+    consumer = consumer_class(
+        settings=BaseRedisSettings(read_count=args.read_count),
+        stream_name=stream,
+        database=database,
+        metric_container=get_common_metric_container(),
+    )
+    database.commands = 0
+    consumed = 0
+    while consumed < args.messages:
+        consumed += len(consumer.consume(count=args.read_count))
+    return database.commands / consumed
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--url", default="redis://localhost:6379")
+    arg_parser.add_argument("--db", type=int, default=15)
+    arg_parser.add_argument("--messages", type=int, default=1000)
+    arg_parser.add_argument("--read-count", type=int, default=1)
+    args = arg_parser.parse_args()
+
+    database = _CountingDatabase.from_url(args.url, db=args.db)
+    for name, consumer_class in (("recreated handles", _RecreatingConsumer), ("cached handles", RedisConsumer)):
+        print(f"{name}: {_measure(consumer_class, database, args):.2f} Redis commands per consumed message")
+
+
+if __name__ == "__main__":
+    main()
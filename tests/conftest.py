@@ -18,6 +18,8 @@ from _pytest.python import Metafunc
 from prometheus_client import CollectorRegistry
 from pytest_mock import MockerFixture
 from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 
 from overhave import (
     OverhaveAdminSettings,
@@ -70,6 +72,10 @@ def db_metadata(db_settings: OverhaveDBSettings) -> Iterator[db.SAMetadata]:
     sau.create_database(engine.url)
 
     metadata.set_engine(engine)
+    # TestClient runs every request in its own event loop, so asyncio connections could not be pooled
+    metadata.set_async_engine(
+        create_async_engine(db_settings.async_db_url, echo=db_settings.db_echo, poolclass=NullPool)
+    )
     yield metadata
     sau.drop_database(engine.url)
 
@@ -82,3 +82,50 @@ class TestFeatureAPI:
         assert response.json()
         features = LIST_FEATURE_MODEL_ADAPTER.validate_python(response.json())
         assert features == [test_feature_with_tag]
+
+    @pytest.mark.parametrize("test_severity", [allure.severity_level.NORMAL], indirect=True)
+    def test_get_features_by_tag_id_pages(
+        self,
+        test_api_client: TestClient,
+        test_tag: TagModel,
+        test_features_with_tag: list[FeatureModel],
+        test_api_bearer_auth: BearerAuth,
+    ) -> None:
+        first_page = test_api_client.get(f"/feature/?tag_id={test_tag.id}&limit=1", auth=test_api_bearer_auth)
+        assert first_page.status_code == 200
+        first_features = LIST_FEATURE_MODEL_ADAPTER.validate_python(first_page.json())
+        assert first_features == test_features_with_tag[:1]
+        second_page = test_api_client.get(
+            f"/feature/?tag_id={test_tag.id}&limit=1&after_id={first_features[-1].id}", auth=test_api_bearer_auth
+        )
+        assert second_page.status_code == 200
+        assert LIST_FEATURE_MODEL_ADAPTER.validate_python(second_page.json()) == test_features_with_tag[1:]
+
+    @pytest.mark.parametrize("test_severity", [allure.severity_level.NORMAL], indirect=True)
+    def test_get_features_by_tag_id_with_fields(
+        self,
+        test_api_client: TestClient,
+        test_tag: TagModel,
+        test_features_with_tag: list[FeatureModel],
+        test_api_bearer_auth: BearerAuth,
+    ) -> None:
+        response = test_api_client.get(f"/feature/?tag_id={test_tag.id}&fields=name", auth=test_api_bearer_auth)
+        assert response.status_code == 200
+        assert response.json() == [{"id": feature.id, "name": feature.name} for feature in test_features_with_tag]
+
+    def test_get_features_by_tag_id_with_unknown_fields(
+        self, test_api_client: TestClient, test_tag: TagModel, test_api_bearer_auth: BearerAuth
+    ) -> None:
+        response = test_api_client.get(f"/feature/?tag_id={test_tag.id}&fields=unknown", auth=test_api_bearer_auth)
+        assert response.status_code == 400
+
+    def test_features_schema_allows_projection(
+        self, test_api_client: TestClient, test_api_bearer_auth: BearerAuth
+    ) -> None:
+        response = test_api_client.get("/openapi.json", auth=test_api_bearer_auth)
+        assert response.status_code == 200
+        schema = response.json()["paths"]["/feature/"]["get"]["responses"]["200"]["content"]["application/json"]
+        assert schema["schema"]["anyOf"] == [
+            {"type": "array", "items": {"$ref": "#/components/schemas/FeatureModel"}},
+            {"type": "array", "items": {"type": "object"}},
+        ]
@@ -67,6 +67,38 @@ class TestTestRunAPI:
             test_run = TestRunModel.model_validate(response_test_run.json())
             assert test_run.status == TestRunStatus.STARTED
 
+    def test_create_test_runs_bulk_handler_empty_request(
+        self,
+        test_api_client: TestClient,
+        test_api_bearer_auth: BearerAuth,
+    ) -> None:
+        response = test_api_client.post("/test_run/create/bulk", json={}, auth=test_api_bearer_auth)
+        assert response.status_code == 400
+        validate_content_null(response, False)
+
+    @pytest.mark.parametrize("test_severity", [allure.severity_level.NORMAL], indirect=True)
+    def test_create_test_runs_bulk_handler(
+        self,
+        test_api_client: TestClient,
+        test_api_bearer_auth: BearerAuth,
+        test_tag: TagModel,
+        test_feature_with_tag: FeatureModel,
+        test_scenario: ScenarioModel,
+        flask_urlfor_handler_mock: mock.MagicMock,
+    ) -> None:
+        response = test_api_client.post(
+            "/test_run/create/bulk",
+            json={"feature_ids": [test_feature_with_tag.id], "tag_values": [test_tag.value]},
+            auth=test_api_bearer_auth,
+        )
+        assert response.status_code == 200
+        test_run_ids = cast(list[int], response.json())
+        assert len(test_run_ids) == 1
+        response_test_run = test_api_client.get(f"/test_run/?test_run_id={test_run_ids[0]}", auth=test_api_bearer_auth)
+        test_run = TestRunModel.model_validate(response_test_run.json())
+        assert test_run.scenario_id == test_scenario.id
+        assert test_run.status == TestRunStatus.STARTED
+
     def test_get_test_run_handler_not_found(
         self,
         test_api_client: TestClient,
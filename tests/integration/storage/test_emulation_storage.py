@@ -36,7 +36,7 @@ class TestEmulationStorage:
         test_emulation_storage: EmulationStorage,
         test_emulation_run: EmulationRunModel,
     ) -> None:
-        with count_queries(7):
+        with count_queries(4):
             requested_emulation_run = test_emulation_storage.get_requested_emulation_run(test_emulation_run.id)
         assert requested_emulation_run.status == EmulationStatus.REQUESTED
         assert requested_emulation_run.emulation_id == test_emulation_run.emulation_id
@@ -94,7 +94,7 @@ class TestEmulationStorage:
         test_emulation_run: EmulationRunModel,
         faker: Faker,
     ) -> None:
-        with count_queries(4):
+        with count_queries(1):
             filtered_runs = test_emulation_storage.get_emulation_runs_by_test_user_id(
                 test_user_id=service_system_user.id
             )
@@ -46,7 +46,7 @@ class TestFeatureStorage:
     def test_feature_model_by_id(
         self, test_feature_storage: FeatureStorage, test_feature_type: FeatureTypeModel, test_feature: FeatureModel
     ) -> None:
-        with count_queries(3):
+        with count_queries(2):
             with db.create_session() as session:
                 feature_model = test_feature_storage.feature_model_by_id(session=session, feature_id=test_feature.id)
         assert feature_model is not None
@@ -109,7 +109,7 @@ class TestFeatureStorage:
         assert updated_feature.id == new_feature_model.id
         _check_base_feature_attrs(test_model=updated_feature, validation_model=new_feature_model)
         _check_base_feature_type_attrs(test_model=updated_feature.feature_type, validation_model=test_feature_type)
-        with count_queries(3):
+        with count_queries(2):
             test_feature_storage.get_features_by_tag(new_tag_model.id)
 
     def test_get_feature_by_tag(
@@ -119,7 +119,7 @@ class TestFeatureStorage:
         test_feature_with_tag: FeatureModel,
         faker: Faker,
     ) -> None:
-        with count_queries(3):
+        with count_queries(2):
             found_features = test_feature_storage.get_features_by_tag(test_tag.id)
         assert len(found_features) == 1
         assert found_features[0] == test_feature_with_tag
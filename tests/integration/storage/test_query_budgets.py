@@ -0,0 +1,155 @@
+import asyncio
+import operator
+from typing import cast
+
+import allure
+import pytest
+from faker import Faker
+
+from overhave import db
+from overhave.storage import (
+    AsyncEmulationStorage,
+    AsyncFeatureStorage,
+    AsyncTestUserStorage,
+    EmulationStorage,
+    FeatureModel,
+    FeatureStorage,
+    FeatureTypeModel,
+    SystemUserModel,
+    TagModel,
+    TestUserModel,
+    TestUserSpecification,
+    TestUserStorage,
+)
+from overhave.utils import get_current_time
+from tests.db_utils import count_queries, create_test_session
+
+# Every storage read method must fit in its statement budget regardless of count of returned rows,
+# so relationships, which are validated by converters, have to be loaded eagerly.
+_ROWS_COUNT = 5
+
+
+@pytest.fixture()
+def tagged_features(
+    service_system_user: SystemUserModel, test_feature_type: FeatureTypeModel, test_tag: TagModel, faker: Faker
+) -> list[FeatureModel]:
+    features = []
+    with create_test_session() as session:
+        tag = session.query(db.Tags).filter(db.Tags.id == test_tag.id).one()
+        for _ in range(_ROWS_COUNT):
+            feature = db.Feature(
+                name=faker.word(),
+                author=service_system_user.login,
+                type_id=test_feature_type.id,
+                task=[faker.word()[:11]],
+                file_path=f"{faker.word()}/{faker.word()}",
+                severity=allure.severity_level.NORMAL,
+                last_edited_at=get_current_time(),
+                last_edited_by=service_system_user.login,
+            )
+            feature.feature_tags.append(tag)
+            session.add(feature)
+            session.flush()
+            features.append(FeatureModel.model_validate(feature))
+    return features
+
+
+@pytest.fixture()
+def test_users(
+    service_system_user: SystemUserModel,
+    test_feature_type: FeatureTypeModel,
+    test_specification: TestUserSpecification,
+    faker: Faker,
+) -> list[TestUserModel]:
+    users = []
+    with create_test_session() as session:
+        for _ in range(_ROWS_COUNT):
+            test_user = db.TestUser(
+                feature_type_id=test_feature_type.id,
+                key=cast(str, faker.unique.word()),
+                name=cast(str, faker.word()),
+                created_by=service_system_user.login,
+                specification=test_specification,
+                allow_update=False,
+            )
+            session.add(test_user)
+            session.flush()
+            users.append(TestUserModel.model_validate(test_user))
+    return users
+
+
+@pytest.fixture()
+def emulation_runs_test_user(service_system_user: SystemUserModel, test_testuser: TestUserModel, faker: Faker) -> int:
+    with create_test_session() as session:
+        for _ in range(_ROWS_COUNT):
+            emulation = db.Emulation(
+                name=cast(str, faker.unique.word()),
+                command=cast(str, faker.word()),
+                test_user_id=test_testuser.id,
+                created_by=service_system_user.login,
+            )
+            session.add(emulation)
+            session.flush()
+            session.add(
+                db.EmulationRun(
+                    emulation_id=emulation.id,
+                    initiated_by=service_system_user.login,
+                    status=db.EmulationStatus.CREATED,
+                )
+            )
+    return test_testuser.id
+
+
+@pytest.mark.parametrize("test_user_role", [db.Role.user], indirect=True)
+@pytest.mark.usefixtures("database")
+class TestQueryBudgets:
+    """Integration tests for statements budgets of storages read methods."""
+
+    def test_get_features_by_tag(self, test_tag: TagModel, tagged_features: list[FeatureModel]) -> None:
+        with count_queries(2, operator.le):
+            features = FeatureStorage.get_features_by_tag(tag_id=test_tag.id)
+        assert len(features) == _ROWS_COUNT
+        assert all(feature.feature_tags == [test_tag] for feature in features)
+
+    def test_get_feature_models(self, tagged_features: list[FeatureModel]) -> None:
+        with count_queries(2, operator.le):
+            features = FeatureStorage.get_feature_models(feature.id for feature in tagged_features)
+        assert sorted(features, key=lambda feature: feature.id) == tagged_features
+
+    def test_async_get_features_by_tag(self, test_tag: TagModel, tagged_features: list[FeatureModel]) -> None:
+        with count_queries(2, operator.le):
+            features = asyncio.run(AsyncFeatureStorage.get_features_by_tag(tag_id=test_tag.id))
+        assert sorted(features, key=lambda feature: feature.id) == tagged_features
+
+    def test_get_test_users_by_feature_type(
+        self, test_feature_type: FeatureTypeModel, test_users: list[TestUserModel]
+    ) -> None:
+        with count_queries(1, operator.le):
+            with db.create_session() as session:
+                users = TestUserStorage.get_test_users_by_feature_type_name(
+                    session=session, feature_type_id=test_feature_type.id, allow_update=False
+                )
+        assert sorted(users, key=lambda user: user.id) == test_users
+
+    def test_async_get_test_users_by_feature_type(
+        self, test_feature_type: FeatureTypeModel, test_users: list[TestUserModel]
+    ) -> None:
+        with count_queries(2, operator.le):
+            users = asyncio.run(
+                AsyncTestUserStorage.get_test_users_by_feature_type_name(
+                    feature_type_name=test_feature_type.name, allow_update=False
+                )
+            )
+        assert sorted(users, key=lambda user: user.id) == test_users
+
+    def test_get_emulation_runs_by_test_user_id(self, emulation_runs_test_user: int) -> None:
+        with count_queries(1, operator.le):
+            emulation_runs = EmulationStorage.get_emulation_runs_by_test_user_id(emulation_runs_test_user)
+        assert len(emulation_runs) == _ROWS_COUNT
+
+    def test_async_get_emulation_runs_by_test_user_id(self, emulation_runs_test_user: int) -> None:
+        with count_queries(1, operator.le):
+            emulation_runs = asyncio.run(
+                AsyncEmulationStorage.get_emulation_runs_by_test_user_id(emulation_runs_test_user)
+            )
+        assert len(emulation_runs) == _ROWS_COUNT
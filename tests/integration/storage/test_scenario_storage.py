@@ -61,3 +61,20 @@ class TestScenarioStorage:
             created_model = session.get(db.Scenario, new_model.id)
             assert created_model is not None
             _check_base_scenario_type_model(test_model=created_model, validation_model=new_model)
+
+    def test_get_scenario_ids(
+        self,
+        test_scenario_storage: ScenarioStorage,
+        test_feature_with_tag: FeatureModel,
+        test_scenario: ScenarioModel,
+        faker: Faker,
+    ) -> None:
+        tag_value = test_feature_with_tag.feature_tags[0].value
+        with count_queries(1):
+            assert test_scenario_storage.get_scenario_ids(tag_values=[tag_value, faker.word()]) == {
+                test_feature_with_tag.id: test_scenario.id
+            }
+        with count_queries(1):
+            assert test_scenario_storage.get_scenario_ids(feature_ids=[test_feature_with_tag.id]) == {
+                test_feature_with_tag.id: test_scenario.id
+            }
@@ -4,7 +4,7 @@ from faker import Faker
 
 from overhave import db
 from overhave.db import TestReportStatus, TestRunStatus
-from overhave.storage import FeatureModel, ScenarioModel, TestRunModel, TestRunStorage
+from overhave.storage import FeatureModel, ScenarioModel, ScenarioNotFoundError, TestRunModel, TestRunStorage
 from tests.db_utils import count_queries, create_test_session
 
 
@@ -20,6 +20,26 @@ class TestTestRunStorage:
             test_run = test_run_storage.create_testrun(test_scenario.id, test_feature.author)
         assert isinstance(test_run, int)
 
+    def test_create_test_runs_bulk(
+        self, test_run_storage: TestRunStorage, test_scenario: ScenarioModel, test_feature: FeatureModel
+    ) -> None:
+        with count_queries(2):
+            test_run_ids = test_run_storage.create_testruns_bulk([test_scenario.id] * 3, test_feature.author)
+        assert len(set(test_run_ids)) == 3
+        with create_test_session() as session:
+            for test_run_id in test_run_ids:
+                test_run = session.get(db.TestRun, test_run_id)
+                assert test_run is not None
+                assert test_run.scenario_id == test_scenario.id
+                assert test_run.name == test_feature.name
+                assert test_run.status == TestRunStatus.STARTED
+
+    def test_create_test_runs_bulk_not_existing_scenario(
+        self, test_run_storage: TestRunStorage, test_scenario: ScenarioModel, test_feature: FeatureModel
+    ) -> None:
+        with pytest.raises(ScenarioNotFoundError):
+            test_run_storage.create_testruns_bulk([test_scenario.id, test_scenario.id + 1], test_feature.author)
+
     @pytest.mark.parametrize(
         "run_status",
         [
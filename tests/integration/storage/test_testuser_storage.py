@@ -18,14 +18,14 @@ class TestTestUserStorage:
 
     @pytest.mark.parametrize("test_user_role", [db.Role.user], indirect=True)
     def test_get_test_user_by_id(self, test_user_storage: TestUserStorage, test_testuser: TestUserModel) -> None:
-        with count_queries(2):
+        with count_queries(1):
             test_user = test_user_storage.get_testuser_model_by_id(test_testuser.id)
         assert test_user is not None
         assert test_user == test_testuser
 
     @pytest.mark.parametrize("test_user_role", [db.Role.user], indirect=True)
     def test_get_user_by_key(self, test_user_storage: TestUserStorage, test_testuser: TestUserModel) -> None:
-        with count_queries(2):
+        with count_queries(1):
             test_user = test_user_storage.get_testuser_model_by_key(test_testuser.key)
         assert test_user is not None
         assert test_user == test_testuser
@@ -44,7 +44,7 @@ class TestTestUserStorage:
 
     @pytest.mark.parametrize("test_user_role", [db.Role.user], indirect=True)
     def test_get_user_list(self, test_user_storage: TestUserStorage, test_testuser: TestUserModel) -> None:
-        with count_queries(2):
+        with count_queries(1):
             with db.create_session() as session:
                 test_users = test_user_storage.get_test_users_by_feature_type_name(
                     session=session,
@@ -1,3 +1,5 @@
+import operator
+
 import pytest
 import sqlalchemy.exc
 
@@ -66,6 +68,26 @@ class TestOverhaveSynchronizer:
             features = session.query(db.Feature).all()
             assert len(features) == 3
 
+    @pytest.mark.parametrize("test_demo_language", [OverhaveDemoAppLanguage.RU], indirect=True)
+    @pytest.mark.parametrize("create_db_features", [True])
+    @pytest.mark.parametrize("test_system_user_login", ["user"], indirect=True)
+    @pytest.mark.parametrize("batch_size", [2, 10])
+    def test_synchronize_create_ru_by_batches(
+        self,
+        test_resolved_synchronizer: OverhaveSynchronizer,
+        test_db_user: SystemUserModel,
+        test_db_feature_types: list[FeatureTypeModel],
+        create_db_features: bool,
+        batch_size: int,
+    ) -> None:
+        with count_queries(18, comparator=operator.le):
+            test_resolved_synchronizer.synchronize(create_db_features=create_db_features, batch_size=batch_size)
+        with create_test_session() as session:
+            features = session.query(db.Feature).all()
+            assert len(features) == 3
+            scenarios = session.query(db.Scenario).filter(db.Scenario.feature_id.in_([x.id for x in features])).all()
+            assert len(scenarios) == len(features)
+
     @pytest.mark.parametrize("test_demo_language", [OverhaveDemoAppLanguage.RU], indirect=True)
     @pytest.mark.parametrize("create_db_features", [True])
     @pytest.mark.parametrize("test_system_user_login", ["user"], indirect=True)
@@ -0,0 +1,125 @@
+from unittest import mock
+
+import pytest
+from faker import Faker
+from prometheus_client import CollectorRegistry
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from overhave import db
+from overhave.api.auth.cache import AuthorizedUserCache
+from overhave.metrics import BaseOverhaveMetricContainer
+from overhave.storage import SystemUserModel
+from overhave.transport import RedisChannel
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture()
+def redis_database() -> mock.MagicMock:
+    return mock.MagicMock()
+
+
+@pytest.fixture()
+def user_cache(
+    base_container: BaseOverhaveMetricContainer, clock: _Clock, redis_database: mock.MagicMock
+) -> AuthorizedUserCache:
+    cache = AuthorizedUserCache(max_size=2, ttl=60, metric_container=base_container, clock=clock)
+    cache.listen(redis_database)
+    return cache
+
+
+def _make_user(faker: Faker) -> SystemUserModel:
+    return SystemUserModel(id=faker.random_int(), login=faker.unique.word(), password=None, role=db.Role.user)
+
+
+def _get_requests_count(registry: CollectorRegistry, result: str) -> float | None:
+    return registry.get_sample_value("api_auth_user_cache_requests_total", {"result": result})
+
+
+class TestAuthorizedUserCache:
+    """Unit tests for :class:`AuthorizedUserCache`."""
+
+    def test_subscribed_to_system_users(self, user_cache: AuthorizedUserCache, redis_database: mock.MagicMock) -> None:
+        pubsub = redis_database.pubsub.return_value
+        assert RedisChannel.SYSTEM_USERS.value in pubsub.subscribe.call_args.kwargs
+        pubsub.run_in_thread.assert_called_once()
+
+    def test_get_cached_user(self, user_cache: AuthorizedUserCache, registry: CollectorRegistry, faker: Faker) -> None:
+        user = _make_user(faker)
+        assert user_cache.get(user.login) is None
+        user_cache.put(user, generation=user_cache.generation)
+        assert user_cache.get(user.login) == user
+        assert _get_requests_count(registry, "miss") == 1
+        assert _get_requests_count(registry, "hit") == 1
+
+    def test_user_expired(self, user_cache: AuthorizedUserCache, clock: _Clock, faker: Faker) -> None:
+        user = _make_user(faker)
+        user_cache.put(user, generation=user_cache.generation)
+        clock.now = 60
+        assert user_cache.get(user.login) is None
+        assert len(user_cache) == 0
+
+    def test_least_recently_used_evicted(self, user_cache: AuthorizedUserCache, faker: Faker) -> None:
+        first_user, second_user, third_user = (_make_user(faker) for _ in range(3))
+        user_cache.put(first_user, generation=user_cache.generation)
+        user_cache.put(second_user, generation=user_cache.generation)
+        assert user_cache.get(first_user.login) == first_user
+        user_cache.put(third_user, generation=user_cache.generation)
+        assert user_cache.get(second_user.login) is None
+        assert user_cache.get(first_user.login) == first_user
+        assert user_cache.get(third_user.login) == third_user
+
+    def test_cleared_on_system_user_change(
+        self, user_cache: AuthorizedUserCache, redis_database: mock.MagicMock, faker: Faker
+    ) -> None:
+        user = _make_user(faker)
+        user_cache.put(user, generation=user_cache.generation)
+        handler = redis_database.pubsub.return_value.subscribe.call_args.kwargs[RedisChannel.SYSTEM_USERS.value]
+        handler({"type": "message", "data": user.login.encode()})
+        assert user_cache.get(user.login) is None
+
+    def test_disabled_without_listening(
+        self, base_container: BaseOverhaveMetricContainer, clock: _Clock, faker: Faker
+    ) -> None:
+        user_cache = AuthorizedUserCache(max_size=2, ttl=60, metric_container=base_container, clock=clock)
+        user = _make_user(faker)
+        user_cache.put(user, generation=user_cache.generation)
+        assert user_cache.get(user.login) is None
+        assert len(user_cache) == 0
+
+    def test_user_loaded_before_clear_not_cached(self, user_cache: AuthorizedUserCache, faker: Faker) -> None:
+        user = _make_user(faker)
+        generation = user_cache.generation
+        user_cache.clear()
+        user_cache.put(user, generation=generation)
+        assert user_cache.get(user.login) is None
+        assert len(user_cache) == 0
+
+    @mock.patch("overhave.api.auth.cache.time.sleep")
+    def test_disabled_until_listening_restored(
+        self, sleep: mock.MagicMock, user_cache: AuthorizedUserCache, redis_database: mock.MagicMock, faker: Faker
+    ) -> None:
+        user = _make_user(faker)
+        user_cache.put(user, generation=user_cache.generation)
+        pubsub = redis_database.pubsub.return_value
+        pubsub.ping.side_effect = RedisConnectionError()
+        user_cache._on_listener_error(RedisConnectionError(), pubsub, mock.MagicMock())
+        assert len(user_cache) == 0
+        user_cache.put(user, generation=user_cache.generation)
+        assert user_cache.get(user.login) is None
+
+        pubsub.ping.side_effect = None
+        user_cache._on_listener_error(RedisConnectionError(), pubsub, mock.MagicMock())
+        user_cache.put(user, generation=user_cache.generation)
+        assert user_cache.get(user.login) == user
@@ -0,0 +1,58 @@
+from typing import Iterator
+
+import pytest
+import sqlalchemy as sa
+import sqlalchemy.engine as se
+from sqlalchemy.pool import NullPool, QueuePool
+
+from overhave.db.pool import get_metered_pool_class, observe_pool
+from overhave.metrics import BaseOverhaveMetricContainer
+
+_POOL_NAME = "test"
+
+
+@pytest.fixture()
+def metered_engine(base_container: BaseOverhaveMetricContainer) -> Iterator[se.Engine]:
+    engine = sa.create_engine(
+        "sqlite://",
+        poolclass=get_metered_pool_class(QueuePool, pool_name=_POOL_NAME, metric_container=base_container),
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.1,
+    )
+    observe_pool(engine, pool_name=_POOL_NAME, metric_container=base_container)
+    yield engine
+    engine.dispose()
+
+
+def _get_value(container: BaseOverhaveMetricContainer, name: str, **labels: str) -> float | None:
+    return container.registry.get_sample_value(name, {"pool": _POOL_NAME, **labels})
+
+
+class TestPoolMetrics:
+    """Unit tests for database pool metrics."""
+
+    def test_not_queue_pool_class(self, base_container: BaseOverhaveMetricContainer) -> None:
+        assert get_metered_pool_class(NullPool, pool_name=_POOL_NAME, metric_container=base_container) is NullPool
+
+    def test_checked_out_and_overflow(
+        self, base_container: BaseOverhaveMetricContainer, metered_engine: se.Engine
+    ) -> None:
+        with metered_engine.connect(), metered_engine.connect():
+            assert _get_value(base_container, "db_pool_checked_out_connections") == 2
+            assert _get_value(base_container, "db_pool_overflow_connections") == 1
+        assert _get_value(base_container, "db_pool_checked_out_connections") == 0
+        assert _get_value(base_container, "db_pool_checkout_wait_seconds_count") == 2
+
+    def test_checkout_timeout(self, base_container: BaseOverhaveMetricContainer, metered_engine: se.Engine) -> None:
+        with metered_engine.connect(), metered_engine.connect():
+            with pytest.raises(sa.exc.TimeoutError):
+                metered_engine.connect()
+        assert _get_value(base_container, "db_pool_checkout_wait_seconds_count") == 3
+        assert _get_value(base_container, "db_pool_checkout_wait_seconds_sum") >= 0.1  # type: ignore[operator]
+
+    def test_invalidation(self, base_container: BaseOverhaveMetricContainer, metered_engine: se.Engine) -> None:
+        with metered_engine.connect() as connection:
+            connection.invalidate()
+        assert _get_value(base_container, "db_pool_invalidated_connections_total", soft="False") == 1
+        assert _get_value(base_container, "db_pool_checked_out_connections") == 0
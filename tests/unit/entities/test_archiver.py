@@ -3,7 +3,7 @@ from pathlib import Path
 import pytest
 
 from overhave import OverhaveFileSettings
-from overhave.entities.archiver import ArchiveManager
+from overhave.entities.archiver import ArchiveManager, IncorrectExtensionError
 
 
 @pytest.mark.parametrize("extension", ["zip"])
@@ -31,3 +31,23 @@ class TestArchiverManager:
         archived = test_archive_manager.archive_path(path=test_filepath, extension=extension)
         unpacked = test_archive_manager.unpack_path(path=archived, extension=extension)
         assert unpacked == test_filepath
+
+    def test_iter_archive(
+        self,
+        extension: str,
+        test_archive_manager: ArchiveManager,
+        test_file_settings: OverhaveFileSettings,
+        test_filepath: Path,
+    ) -> None:
+        streamed = test_file_settings.tmp_dir / f"streamed.{extension}"
+        streamed.write_bytes(b"".join(test_archive_manager.iter_archive(path=test_filepath, extension=extension)))
+        unpacked = test_archive_manager.unpack_path(path=streamed, extension=extension)
+        assert {x.name: x.read_text() for x in unpacked.iterdir()} == {
+            x.name: x.read_text() for x in test_filepath.iterdir()
+        }
+        assert not list(test_file_settings.tmp_reports_dir.glob(f"*.{extension}"))
+
+
+def test_iter_archive_not_streamable_extension(test_archive_manager: ArchiveManager, test_filepath: Path) -> None:
+    with pytest.raises(IncorrectExtensionError):
+        next(test_archive_manager.iter_archive(path=test_filepath, extension="gztar"))
@@ -0,0 +1,129 @@
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from overhave import OverhaveFileSettings
+from overhave.entities import OverhaveReportManagerSettings, ReportCache
+from overhave.metrics import BaseOverhaveMetricContainer
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 10**6.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestReportCache:
+    """Unit tests for :class:`ReportCache`."""
+
+    @pytest.fixture()
+    def test_clock(self) -> _Clock:
+        return _Clock()
+
+    @pytest.fixture()
+    def test_metric_container(self) -> BaseOverhaveMetricContainer:
+        return BaseOverhaveMetricContainer(registry=CollectorRegistry())
+
+    @pytest.fixture()
+    def test_report_cache(
+        self,
+        test_file_settings: OverhaveFileSettings,
+        test_metric_container: BaseOverhaveMetricContainer,
+        test_clock: _Clock,
+    ) -> ReportCache:
+        return ReportCache(
+            settings=OverhaveReportManagerSettings(
+                reports_cache_max_bytes=250,
+                reports_cache_max_age=timedelta(hours=1),
+                reports_cache_eviction_interval=timedelta(minutes=1),
+            ),
+            file_settings=test_file_settings,
+            metric_container=test_metric_container,
+            clock=test_clock,
+        )
+
+    @staticmethod
+    def _add_report(cache: ReportCache, file_settings: OverhaveFileSettings, clock: _Clock, name: str) -> Path:
+        path = file_settings.tmp_reports_dir / name
+        (path / "data").mkdir(parents=True)
+        (path / "data" / "file").write_bytes(b"0" * 100)
+        cache.add(name)
+        clock.now += 120
+        return path
+
+    def test_lru_eviction_over_budget(
+        self, test_report_cache: ReportCache, test_file_settings: OverhaveFileSettings, test_clock: _Clock
+    ) -> None:
+        paths = [self._add_report(test_report_cache, test_file_settings, test_clock, x) for x in "abc"]
+        test_report_cache.touch("a")
+        test_clock.now += 120
+        assert test_report_cache.size == 300
+        assert test_report_cache.evict() == ["b"]
+        assert test_report_cache.size == 200
+        assert [x.exists() for x in paths] == [True, False, True]
+        assert sorted(x.name for x in test_file_settings.tmp_reports_dir.iterdir()) == ["a", "c"]
+
+    def test_recently_accessed_not_evicted(
+        self, test_report_cache: ReportCache, test_file_settings: OverhaveFileSettings, test_clock: _Clock
+    ) -> None:
+        for name in "abc":
+            self._add_report(test_report_cache, test_file_settings, test_clock, name)
+        for name in "abc":
+            test_report_cache.touch(name)
+        assert test_report_cache.evict() == []
+        assert test_report_cache.size == 300
+
+    def test_expired_evicted_under_budget(
+        self, test_report_cache: ReportCache, test_file_settings: OverhaveFileSettings, test_clock: _Clock
+    ) -> None:
+        self._add_report(test_report_cache, test_file_settings, test_clock, "a")
+        test_clock.now += timedelta(hours=1).total_seconds()
+        self._add_report(test_report_cache, test_file_settings, test_clock, "b")
+        assert test_report_cache.evict() == ["a"]
+        assert test_report_cache.size == 100
+
+    def test_scan_existing_reports(
+        self, test_report_cache: ReportCache, test_file_settings: OverhaveFileSettings
+    ) -> None:
+        for name in ("report", "not_uploaded_report"):
+            (test_file_settings.tmp_reports_dir / name).mkdir()
+            (test_file_settings.tmp_reports_dir / name / "index.html").write_bytes(b"0" * 10)
+        (test_file_settings.tmp_reports_dir / ".evicted-report").mkdir()
+        saved_reports = mock.MagicMock(return_value={"report"})
+        test_report_cache.scan(saved_reports)
+        assert sorted(saved_reports.call_args.args[0]) == ["not_uploaded_report", "report"]
+        assert test_report_cache.size == 10
+        assert not (test_file_settings.tmp_reports_dir / ".evicted-report").exists()
+
+    def test_not_uploaded_reports_not_evicted(
+        self, test_report_cache: ReportCache, test_file_settings: OverhaveFileSettings, test_clock: _Clock
+    ) -> None:
+        report = test_file_settings.tmp_reports_dir / "not_uploaded_report"
+        report.mkdir()
+        (report / "index.html").write_bytes(b"0" * 1000)
+        test_report_cache.scan(lambda reports: set())
+        test_clock.now += timedelta(days=1).total_seconds()
+        assert test_report_cache.evict() == []
+        assert report.exists()
+
+    def test_metrics(
+        self,
+        test_report_cache: ReportCache,
+        test_file_settings: OverhaveFileSettings,
+        test_metric_container: BaseOverhaveMetricContainer,
+        test_clock: _Clock,
+    ) -> None:
+        self._add_report(test_report_cache, test_file_settings, test_clock, "a")
+        test_report_cache.add("a", count=True)
+        test_report_cache.touch("a", count=True)
+        test_report_cache.touch("a")
+        test_report_cache.touch("unknown", count=True)
+        registry = test_metric_container.registry
+        assert registry.get_sample_value("reports_cache_requests_total", {"result": "hit"}) == 1
+        assert registry.get_sample_value("reports_cache_requests_total", {"result": "miss"}) == 1
+        assert registry.get_sample_value("reports_cache_bytes") == 100
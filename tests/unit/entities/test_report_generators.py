@@ -0,0 +1,78 @@
+import json
+from pathlib import Path
+
+import py
+import pytest
+from faker import Faker
+
+from overhave.entities import (
+    AllureCmdlineReportGenerator,
+    HtmlSummaryReportGenerator,
+    OverhaveReportManagerSettings,
+)
+
+
+@pytest.fixture()
+def test_results_dir(tmpdir: py.path.local, faker: Faker) -> Path:
+    results_dir = Path(tmpdir) / "results"
+    results_dir.mkdir()
+    (results_dir / "attachment-1.txt").write_text(faker.word())
+    passed = {
+        "uuid": "passed-uuid",
+        "name": "test_passed",
+        "status": "passed",
+        "start": 1000,
+        "stop": 1500,
+        "steps": [
+            {"name": "first step", "status": "passed", "attachments": [{"name": "log", "source": "attachment-1.txt"}]}
+        ],
+        "labels": [{"name": "feature", "value": "Some feature"}],
+    }
+    failed = {
+        "uuid": "failed-uuid",
+        "name": "test_failed",
+        "status": "failed",
+        "start": 2000,
+        "stop": 4500,
+        "statusDetails": {"message": "AssertionError: oops"},
+    }
+    container = {"uuid": "container-uuid", "children": ["failed-uuid"], "befores": [{"name": "db_fixture"}]}
+    (results_dir / "passed-result.json").write_text(json.dumps(passed))
+    (results_dir / "failed-result.json").write_text(json.dumps(failed))
+    (results_dir / "container-container.json").write_text(json.dumps(container))
+    return results_dir
+
+
+class TestReportGenerators:
+    """Unit tests for :class:`IReportGenerator` implementations."""
+
+    def test_html_summary(self, tmpdir: py.path.local, test_results_dir: Path) -> None:
+        report_dir = Path(tmpdir) / "report"
+        assert HtmlSummaryReportGenerator().generate(results_dir=test_results_dir, report_dir=report_dir)
+        index = (report_dir / "index.html").read_text()
+        for expected in (
+            "test_passed",
+            "test_failed",
+            "first step",
+            "db_fixture",
+            "AssertionError: oops",
+            "feature: Some feature",
+            "attachments/attachment-1.txt",
+            "2.50s",
+            "500ms",
+        ):
+            assert expected in index
+        assert index.index("test_passed") < index.index("test_failed")
+        assert (report_dir / "attachments" / "attachment-1.txt").read_text() == (
+            test_results_dir / "attachment-1.txt"
+        ).read_text()
+
+    def test_html_summary_invalid_results(self, tmpdir: py.path.local, test_results_dir: Path) -> None:
+        (test_results_dir / "broken-result.json").write_text("{")
+        assert not HtmlSummaryReportGenerator().generate(
+            results_dir=test_results_dir, report_dir=Path(tmpdir) / "report"
+        )
+
+    def test_allure_cmdline_not_existing(self, tmpdir: py.path.local, test_results_dir: Path) -> None:
+        generator = AllureCmdlineReportGenerator(OverhaveReportManagerSettings(allure_cmdline="not-existing-allure"))
+        assert not generator.generate(results_dir=test_results_dir, report_dir=Path(tmpdir) / "report")
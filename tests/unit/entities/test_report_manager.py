@@ -0,0 +1,146 @@
+import shutil
+from pathlib import Path
+from typing import Iterable
+from unittest import mock
+
+import py
+import pytest
+
+from overhave import OverhaveFileSettings
+from overhave.db import TestReportStatus
+from overhave.entities import OverhaveReportManagerSettings, ReportManager, WorkspaceManager
+from overhave.entities.archiver import ArchiveManager
+from overhave.transport import OverhaveS3Bucket, ReportData, S3ObjectReader
+
+
+class TestReportManager:
+    """Unit tests for :class:`ReportManager`."""
+
+    @pytest.fixture()
+    def mocked_report_generator(self) -> mock.MagicMock:
+        def _generate(results_dir: Path, report_dir: Path) -> bool:
+            report_dir.mkdir(parents=True)
+            (report_dir / "index.html").write_text(results_dir.name)
+            return True
+
+        return mock.MagicMock(generate=mock.MagicMock(side_effect=_generate))
+
+    @pytest.fixture()
+    def mocked_s3_manager(self) -> mock.MagicMock:
+        s3_manager = mock.MagicMock(enabled=True)
+        objects: dict[str, bytes] = {}
+
+        def _upload_stream(chunks: Iterable[bytes], key: str, bucket: OverhaveS3Bucket) -> int:
+            objects[key] = b"".join(chunks)
+            return len(objects[key])
+
+        def _open_object(bucket: str, key: str) -> S3ObjectReader | None:
+            if key not in objects:
+                return None
+            return S3ObjectReader(
+                size=len(objects[key]),
+                get_range=lambda start, end: objects[key][start:][: end - start + 1],
+                block_size=1024,
+            )
+
+        s3_manager.upload_stream.side_effect = _upload_stream
+        s3_manager.open_object.side_effect = _open_object
+        return s3_manager
+
+    @pytest.fixture()
+    def test_report_manager(
+        self,
+        test_file_settings: OverhaveFileSettings,
+        mocked_report_generator: mock.MagicMock,
+        mocked_s3_manager: mock.MagicMock,
+    ) -> ReportManager:
+        return ReportManager(
+            settings=OverhaveReportManagerSettings(serve_from_s3=True),
+            file_settings=test_file_settings,
+            test_run_storage=mock.MagicMock(),
+            archive_manager=ArchiveManager(file_settings=test_file_settings),
+            s3_manager=mocked_s3_manager,
+            report_generator=mocked_report_generator,
+            report_cache=mock.MagicMock(),
+            workspace_manager=WorkspaceManager(file_settings=test_file_settings),
+            metric_container=mock.MagicMock(),
+        )
+
+    def test_create_allure_reports_coalesced(
+        self, tmpdir: py.path.local, test_report_manager: ReportManager, mocked_report_generator: mock.MagicMock
+    ) -> None:
+        requests = [
+            ReportData(test_run_id=1, results_dir=Path(tmpdir) / "first", feature_type="feature_type"),
+            ReportData(test_run_id=2, results_dir=Path(tmpdir) / "second", feature_type="feature_type"),
+            ReportData(test_run_id=1, results_dir=Path(tmpdir) / "third", feature_type="feature_type"),
+        ]
+        test_report_manager.create_allure_reports(requests)
+        assert [x.kwargs["results_dir"] for x in mocked_report_generator.generate.call_args_list] == [
+            Path(tmpdir) / "third",
+            Path(tmpdir) / "second",
+        ]
+
+    def test_workspace_released_after_report(
+        self, test_file_settings: OverhaveFileSettings, test_report_manager: ReportManager
+    ) -> None:
+        workspace = WorkspaceManager(file_settings=test_file_settings).create("run_1")
+        test_report_manager.create_allure_report(
+            test_run_id=1, results_dir=WorkspaceManager.results_dir(workspace), workspace=workspace
+        )
+        assert not workspace.exists()
+
+    def test_report_kept_on_upload_error(
+        self,
+        test_file_settings: OverhaveFileSettings,
+        test_report_manager: ReportManager,
+        mocked_s3_manager: mock.MagicMock,
+    ) -> None:
+        mocked_s3_manager.upload_stream.side_effect = RuntimeError("Upload failed")
+        workspace = WorkspaceManager(file_settings=test_file_settings).create("run_1")
+        with pytest.raises(RuntimeError):
+            test_report_manager.create_allure_report(
+                test_run_id=1, results_dir=WorkspaceManager.results_dir(workspace), workspace=workspace
+            )
+        assert not workspace.exists()
+        (report_dir,) = test_file_settings.tmp_reports_dir.iterdir()
+        assert (report_dir / "index.html").exists()
+
+    def test_report_streamed_to_s3(
+        self,
+        tmpdir: py.path.local,
+        test_file_settings: OverhaveFileSettings,
+        test_report_manager: ReportManager,
+        mocked_s3_manager: mock.MagicMock,
+    ) -> None:
+        test_report_manager.create_allure_report(test_run_id=1, results_dir=Path(tmpdir) / "results")
+        mocked_s3_manager.upload_stream.assert_called_once()
+        mocked_s3_manager.upload_file.assert_not_called()
+        (report_dir,) = test_file_settings.tmp_reports_dir.iterdir()
+        assert mocked_s3_manager.upload_stream.call_args.kwargs["key"] == f"{report_dir.name}.zip"
+        assert mocked_s3_manager.upload_stream.call_args.kwargs["bucket"] is OverhaveS3Bucket.REPORTS
+        test_report_manager._test_run_storage.set_report.assert_called_with(  # type: ignore
+            run_id=1, status=TestReportStatus.SAVED
+        )
+        assert test_report_manager._metric_container.observe_s3_upload.call_args.kwargs["size"] > 0  # type: ignore
+
+    def test_report_served_from_s3(
+        self,
+        tmpdir: py.path.local,
+        test_file_settings: OverhaveFileSettings,
+        test_report_manager: ReportManager,
+    ) -> None:
+        test_report_manager.create_allure_report(test_run_id=1, results_dir=Path(tmpdir) / "results")
+        (report_dir,) = test_file_settings.tmp_reports_dir.iterdir()
+        shutil.rmtree(report_dir)
+        test_report_manager._test_run_storage.get_testrun_model.return_value = mock.MagicMock(  # type: ignore
+            report_status=TestReportStatus.SAVED
+        )
+        resolution = test_report_manager.get_report_precense_resolution(
+            report=f"{report_dir.name}/index.html", run_id=1
+        )
+        assert resolution.exists
+        assert test_report_manager.serves_from_s3
+        assert test_report_manager.get_s3_report_file(f"{report_dir.name}/index.html") == b"results"
+        assert test_report_manager.get_s3_report_file(f"{report_dir.name}/unknown.html") is None
+        assert test_report_manager.get_s3_report_file("unknown/index.html") is None
+        assert not report_dir.exists()
@@ -0,0 +1,76 @@
+import os
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from overhave import OverhaveFileSettings
+from overhave.entities import WorkspaceManager, WorkspaceRetention
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 10**6.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestWorkspaceManager:
+    """Unit tests for :class:`WorkspaceManager`."""
+
+    @pytest.fixture()
+    def test_clock(self) -> _Clock:
+        return _Clock()
+
+    @pytest.fixture()
+    def test_workspace_manager(self, test_file_settings: OverhaveFileSettings, test_clock: _Clock) -> WorkspaceManager:
+        test_file_settings.workspace_max_age = timedelta(hours=1)
+        return WorkspaceManager(file_settings=test_file_settings, clock=test_clock)
+
+    @staticmethod
+    def _set_mtime(path: Path, mtime: float) -> None:
+        os.utime(path, (mtime, mtime))
+
+    def test_create_and_release(self, test_workspace_manager: WorkspaceManager) -> None:
+        workspace = test_workspace_manager.create("run_1")
+        assert workspace.name.startswith("run_1_")
+        assert WorkspaceManager.results_dir(workspace).is_dir()
+        test_workspace_manager.release(workspace)
+        assert not workspace.exists()
+
+    def test_release_with_keep_retention(
+        self, test_file_settings: OverhaveFileSettings, test_workspace_manager: WorkspaceManager
+    ) -> None:
+        test_file_settings.workspace_retention = WorkspaceRetention.KEEP
+        workspace = test_workspace_manager.create("run_1")
+        test_workspace_manager.release(workspace)
+        assert workspace.is_dir()
+
+    def test_adopt_results(self, tmp_path: Path, test_workspace_manager: WorkspaceManager) -> None:
+        results_dir = tmp_path / "split"
+        results_dir.mkdir()
+        (results_dir / "1-result.json").write_text("{}")
+        workspace = test_workspace_manager.adopt_results("run_1", results_dir)
+        assert not results_dir.exists()
+        assert (WorkspaceManager.results_dir(workspace) / "1-result.json").read_text() == "{}"
+
+    def test_sweep_removes_old_workspaces(self, test_workspace_manager: WorkspaceManager, test_clock: _Clock) -> None:
+        old_workspace = test_workspace_manager.create("run_1")
+        new_workspace = test_workspace_manager.create("run_2")
+        self._set_mtime(old_workspace, test_clock.now - timedelta(hours=2).total_seconds())
+        self._set_mtime(new_workspace, test_clock.now)
+        assert test_workspace_manager.sweep() == [old_workspace]
+        assert not old_workspace.exists()
+        assert new_workspace.is_dir()
+
+    def test_sweep_on_create_after_interval(self, test_workspace_manager: WorkspaceManager, test_clock: _Clock) -> None:
+        test_workspace_manager.create("run_1")
+        orphan = test_workspace_manager.create("run_2")
+        self._set_mtime(orphan, test_clock.now - timedelta(hours=2).total_seconds())
+        test_workspace_manager.create("run_3")
+        assert orphan.exists()
+        test_clock.now += timedelta(minutes=15).total_seconds()
+        self._set_mtime(orphan, test_clock.now - timedelta(hours=2).total_seconds())
+        test_workspace_manager.create("run_4")
+        assert not orphan.exists()
@@ -1,8 +1,9 @@
 import pytest
-from prometheus_client import Counter
+from prometheus_client.metrics import MetricWrapperBase
 from prometheus_client.samples import Sample
 
 from overhave.db import DraftStatus, EmulationStatus, TestRunStatus
+from overhave.metrics import UNKNOWN_FEATURE_TYPE, PipelineStage
 from overhave.metrics.client.container import (
     BaseOverhaveMetricContainer,
     EmulationRunOverhaveMetricContainer,
@@ -12,7 +13,7 @@ from overhave.metrics.client.container import (
 from overhave.transport import RedisStream
 
 
-def get_sample_from_counter(counter: Counter) -> Sample:
+def get_sample_from_counter(counter: MetricWrapperBase) -> Sample:
     return list(counter.collect())[0].samples[0]
 
 
@@ -91,3 +92,28 @@ class TestMetrics:
         assert sample.value == 2
         assert sample.labels["status"] == emulation_status.value
         assert sample.labels["port"] == str(port)
+
+    @pytest.mark.parametrize("stage", PipelineStage)
+    def test_track_pipeline_stage(self, base_container: BaseOverhaveMetricContainer, stage: PipelineStage) -> None:
+        with base_container.track_pipeline_stage(stage) as tracker:
+            assert base_container.pipeline_stages_in_progress.labels(stage=stage.value)._value.get() == 1
+            tracker.feature_type = "feature_type"
+        assert base_container.pipeline_stages_in_progress.labels(stage=stage.value)._value.get() == 0
+        sample = get_sample_from_counter(base_container.pipeline_stage_duration_seconds)
+        assert sample.labels == {"stage": stage.value, "feature_type": "feature_type", "le": "0.01"}
+        assert sample.value == 1
+
+    def test_track_failed_pipeline_stage(self, base_container: BaseOverhaveMetricContainer) -> None:
+        with pytest.raises(RuntimeError):
+            with base_container.track_pipeline_stage(PipelineStage.PYTEST):
+                raise RuntimeError
+        assert base_container.pipeline_stages_in_progress.labels(stage=PipelineStage.PYTEST.value)._value.get() == 0
+        sample = get_sample_from_counter(base_container.pipeline_stage_duration_seconds)
+        assert sample.labels["feature_type"] == UNKNOWN_FEATURE_TYPE
+        assert sample.value == 1
+
+    def test_observe_redis_task_queue_wait(self, base_container: BaseOverhaveMetricContainer) -> None:
+        base_container.observe_redis_task_queue_wait(task_type=RedisStream.TEST.value, seconds=-1)
+        sample = get_sample_from_counter(base_container.redis_task_queue_wait_seconds)
+        assert sample.labels == {"task_type": RedisStream.TEST.value, "le": "0.01"}
+        assert sample.value == 1
@@ -0,0 +1,60 @@
+from pathlib import Path
+from typing import Iterator, cast
+from unittest import mock
+
+import py
+import pytest
+from pytest_bdd.parser import Feature, Scenario
+
+from overhave.pytest_plugin import clear_feature_info_cache, get_feature_info_cache_info, get_feature_info_from_item
+from overhave.pytest_plugin.helpers import set_feature_info_for_item
+from overhave.scenario import FeatureInfo, ScenarioParser
+
+
+@pytest.fixture()
+def test_feature_file(tmpdir: py.path.local) -> Path:
+    feature_file = Path(tmpdir) / "feature.feature"
+    feature_file.write_text("Feature: test")
+    return feature_file
+
+
+@pytest.fixture()
+def mocked_scenario_parser() -> ScenarioParser:
+    parser = mock.create_autospec(ScenarioParser)
+    parser.parse.side_effect = lambda text: FeatureInfo(name=text)
+    return cast(ScenarioParser, parser)
+
+
+@pytest.fixture()
+def clean_feature_info_cache() -> Iterator[None]:
+    clear_feature_info_cache()
+    yield
+    clear_feature_info_cache()
+
+
+def _set_feature_info(feature_file: Path, scenario_parser: ScenarioParser) -> FeatureInfo:
+    scenario = mock.create_autospec(Scenario)
+    scenario.feature = mock.create_autospec(Feature)
+    scenario.feature.filename = feature_file.as_posix()
+    item = mock.MagicMock()
+    item._obj.__scenario__ = scenario
+    set_feature_info_for_item(item=item, scenario_parser=scenario_parser)
+    return get_feature_info_from_item(item)
+
+
+@pytest.mark.usefixtures("clean_feature_info_cache")
+class TestFeatureInfoCache:
+    """Unit tests for cache of parsed feature files."""
+
+    def test_items_share_feature_info(self, test_feature_file: Path, mocked_scenario_parser: ScenarioParser) -> None:
+        infos = [_set_feature_info(test_feature_file, mocked_scenario_parser) for _ in range(5)]
+        assert all(info is infos[0] for info in infos)
+        mocked_scenario_parser.parse.assert_called_once_with("Feature: test")  # type: ignore
+        cache_info = get_feature_info_cache_info()
+        assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (4, 1, 1)
+
+    def test_changed_file_parsed_again(self, test_feature_file: Path, mocked_scenario_parser: ScenarioParser) -> None:
+        assert _set_feature_info(test_feature_file, mocked_scenario_parser).name == "Feature: test"
+        test_feature_file.write_text("Feature: changed")
+        assert _set_feature_info(test_feature_file, mocked_scenario_parser).name == "Feature: changed"
+        assert get_feature_info_cache_info().misses == 2
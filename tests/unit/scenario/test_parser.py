@@ -0,0 +1,52 @@
+import pytest
+
+from overhave import OverhaveLanguageSettings, OverhaveScenarioParserSettings
+from overhave.scenario import FeatureNameParsingError, ScenarioParser
+
+
+@pytest.fixture()
+def test_parser_settings() -> OverhaveScenarioParserSettings:
+    return OverhaveScenarioParserSettings(parser_strict_mode=False)
+
+
+@pytest.mark.parametrize("tasks_keyword", ["Tasks"])
+@pytest.mark.parametrize("language_settings", [OverhaveLanguageSettings()])
+class TestScenarioParser:
+    """Unit tests for :class:`ScenarioParser`."""
+
+    @pytest.mark.parametrize(
+        ("feature_txt", "scenarios"),
+        [
+            ("Feature: test", ""),
+            ("Feature: test\n\nScenario: test\n  Given step", "Scenario: test\n  Given step"),
+            ("\n Feature: test\n\n\nScenario: test\n  Given step", "Scenario: test\n  Given step"),
+            ("Feature: test\n\n \nScenario: test\n\n  Given step", "Scenario: test\n\n  Given step"),
+            ("Feature: test\n\nScenario: test\n\n\n\n  Given step", "Scenario: test\n\n\n\n  Given step"),
+            (
+                "Feature: test\n\nScenario: test\n  Given step with__underscores",
+                "Scenario: test\n  Given step with  underscores",
+            ),
+        ],
+    )
+    def test_parse_scenarios(self, test_scenario_parser: ScenarioParser, feature_txt: str, scenarios: str) -> None:
+        feature_info = test_scenario_parser.parse(feature_txt)
+        assert feature_info.name == "test"
+        assert feature_info.scenarios == scenarios
+
+    @pytest.mark.parametrize(
+        "feature_txt",
+        [
+            "Feature: test\nTasks: TASK-1, TASK-2\n\nScenario: test",
+            "\n ID: 1\nFeature: test\nTasks: TASK-1, TASK-2\n\nFeature: other\nTasks: TASK-3",
+        ],
+    )
+    def test_parse_header(self, test_scenario_parser: ScenarioParser, feature_txt: str) -> None:
+        feature_info = test_scenario_parser.parse(feature_txt)
+        assert feature_info.name == "test"
+        assert feature_info.id in (None, 1)
+        assert feature_info.tasks == ["TASK-1", "TASK-2"]
+
+    @pytest.mark.parametrize("feature_txt", ["", "\n\nFeature: test", "Scenario: test\n  Given step"])
+    def test_parse_without_name(self, test_scenario_parser: ScenarioParser, feature_txt: str) -> None:
+        with pytest.raises(FeatureNameParsingError):
+            test_scenario_parser.parse(feature_txt)
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import py
+import pytest
+
+from overhave import OverhaveLanguageSettings, OverhaveScenarioCompilerSettings
+from overhave.extra import RUSSIAN_PREFIXES
+from overhave.scenario import (
+    NullableFeatureIdError,
+    ScenarioCompiler,
+    ScenarioParser,
+    parse_feature_files,
+)
+from overhave.storage import TestExecutorContext
+
+
+@pytest.fixture()
+def test_feature_paths(
+    tmpdir: py.path.local,
+    test_scenario_compiler: ScenarioCompiler,
+    test_executor_ctx: TestExecutorContext,
+    test_compilation_settings: OverhaveScenarioCompilerSettings,
+) -> list[Path]:
+    paths = []
+    for feature_id in range(1, 6):
+        test_executor_ctx.feature.id = feature_id
+        path = Path(tmpdir) / f"feature_{feature_id}.feature"
+        path.write_text(test_scenario_compiler.compile(context=test_executor_ctx))
+        paths.append(path)
+    feature_without_id = Path(tmpdir) / "feature_without_id.feature"
+    feature_without_id.write_text(
+        "\n".join(
+            line
+            for line in paths[0].read_text().split("\n")
+            if not line.startswith(test_compilation_settings.id_prefix)
+        )
+    )
+    paths.append(feature_without_id)
+    return paths
+
+
+@pytest.mark.parametrize("feature_tags", [["tag1", "tag2"]])
+@pytest.mark.parametrize("tasks_keyword", [None, "Tasks"])
+@pytest.mark.parametrize(
+    "language_settings",
+    [OverhaveLanguageSettings(), OverhaveLanguageSettings(step_prefixes=RUSSIAN_PREFIXES)],
+)
+class TestParseFeatureFiles:
+    """Unit tests for :meth:`parse_feature_files`."""
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_parse_feature_files(
+        self, test_scenario_parser: ScenarioParser, test_feature_paths: list[Path], workers: int
+    ) -> None:
+        parsed_features = list(
+            parse_feature_files(parser=test_scenario_parser, paths=test_feature_paths, workers=workers)
+        )
+        assert [x.path for x in parsed_features] == test_feature_paths
+        assert [x.info.id for x in parsed_features[:-1] if x.info is not None] == [1, 2, 3, 4, 5]
+        assert isinstance(parsed_features[-1].error, NullableFeatureIdError)
+        assert parsed_features[-1].info is None
+
+    def test_parse_feature_files_sequential_equals_parallel(
+        self, test_scenario_parser: ScenarioParser, test_feature_paths: list[Path]
+    ) -> None:
+        sequential = list(parse_feature_files(parser=test_scenario_parser, paths=test_feature_paths, workers=1))
+        parallel = list(parse_feature_files(parser=test_scenario_parser, paths=test_feature_paths, workers=2))
+        assert [(x.path, x.text, x.info) for x in sequential] == [(x.path, x.text, x.info) for x in parallel]
@@ -0,0 +1,41 @@
+from pathlib import Path
+from unittest import mock
+
+import py
+import pytest
+from faker import Faker
+
+from overhave import OverhaveFileSettings
+from overhave.synchronization import OverhaveSynchronizer
+
+
+@pytest.fixture()
+def test_file_settings(tmpdir: py.path.local) -> OverhaveFileSettings:
+    settings = OverhaveFileSettings(work_dir=Path(tmpdir), root_dir=Path(tmpdir), tmp_dir=Path(tmpdir / "tmp"))
+    settings.features_dir.mkdir()
+    return settings
+
+
+@pytest.fixture()
+def test_feature_files(test_file_settings: OverhaveFileSettings, faker: Faker) -> list[Path]:
+    feature_type_dir = test_file_settings.features_dir / "feature_type"
+    feature_type_dir.mkdir()
+    feature_files = []
+    for index in range(3):
+        feature_file = feature_type_dir / f"feature_{index}.feature"
+        feature_file.write_text(faker.text())
+        feature_files.append(feature_file)
+    return feature_files
+
+
+@pytest.fixture()
+def test_synchronizer(test_file_settings: OverhaveFileSettings) -> OverhaveSynchronizer:
+    synchronizer = OverhaveSynchronizer(
+        file_settings=test_file_settings,
+        scenario_parser=mock.MagicMock(),
+        feature_extractor=mock.MagicMock(),
+        git_initializer=mock.MagicMock(),
+        storage_manager=mock.MagicMock(),
+    )
+    synchronizer._synchronize_feature = mock.MagicMock(return_value=1)  # type: ignore[method-assign]
+    return synchronizer
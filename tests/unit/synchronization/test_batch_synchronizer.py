@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+import pytz
+from faker import Faker
+
+from overhave.scenario import NullableFeatureIdError, ParsedFeature, StrictFeatureInfo
+from overhave.storage import FeatureTypeName
+from overhave.synchronization import FeatureUpdateTask, OverhaveSynchronizer
+
+
+def _get_strict_info(feature_id: int, faker: Faker) -> StrictFeatureInfo:
+    return StrictFeatureInfo(
+        id=feature_id,
+        name=faker.word(),
+        type=FeatureTypeName("feature_type"),
+        author=faker.word(),
+        last_edited_by=faker.word(),
+        last_edited_at=datetime.now(),
+        scenarios=faker.text(),
+    )
+
+
+def _get_not_released_storage_manager() -> mock.MagicMock:
+    not_released_model = mock.MagicMock(id=1, released=False, last_edited_at=datetime(2000, 1, 1, tzinfo=pytz.UTC))
+    last_change_time = datetime.now(tz=pytz.UTC) + timedelta(days=1)
+    storage_manager = mock.MagicMock()
+    storage_manager.get_feature.return_value = not_released_model
+    storage_manager.get_features.return_value = {not_released_model.id: not_released_model}
+    storage_manager.get_last_change_time.return_value = last_change_time
+    storage_manager.get_last_change_times.return_value = {not_released_model.id: last_change_time}
+    storage_manager.write_features.return_value = []
+    return storage_manager
+
+
+class TestBatchSynchronizer:
+    """Unit tests for :class:`OverhaveSynchronizer` batch mode."""
+
+    def test_synchronize_batch(
+        self, test_synchronizer: OverhaveSynchronizer, test_feature_files: list[Path], faker: Faker
+    ) -> None:
+        outdated_model = mock.MagicMock(id=1, released=True, last_edited_at=datetime(2000, 1, 1, tzinfo=pytz.UTC))
+        storage_manager = mock.MagicMock()
+        storage_manager.get_features.return_value = {outdated_model.id: outdated_model}
+        storage_manager.get_last_change_times.return_value = {outdated_model.id: outdated_model.last_edited_at}
+        storage_manager.write_features.return_value = []
+        test_synchronizer._storage_manager = storage_manager
+        outdated_info = _get_strict_info(outdated_model.id, faker)
+        parsed_features = [
+            ParsedFeature(path=test_feature_files[0], text=faker.text(), info=outdated_info),
+            ParsedFeature(path=test_feature_files[1], text=faker.text(), info=_get_strict_info(2, faker)),
+            ParsedFeature(path=test_feature_files[2], text=faker.text(), error=NullableFeatureIdError()),
+        ]
+
+        result = list(
+            test_synchronizer._synchronize_features(
+                parsed_features=parsed_features, create_db_features=False, batch_size=10
+            )
+        )
+
+        assert result == list(zip(parsed_features, [outdated_model.id, None, None]))
+        storage_manager.get_feature.assert_not_called()
+        storage_manager.write_features.assert_called_once_with(
+            creation_tasks=[], update_tasks=[FeatureUpdateTask(model=outdated_model, info=outdated_info)]
+        )
+
+    def test_synchronize_by_batches(
+        self, test_synchronizer: OverhaveSynchronizer, test_feature_files: list[Path], faker: Faker
+    ) -> None:
+        storage_manager = mock.MagicMock()
+        storage_manager.get_features.return_value = {}
+        storage_manager.write_features.return_value = []
+        test_synchronizer._storage_manager = storage_manager
+        parsed_features = [
+            ParsedFeature(path=path, text=faker.text(), info=_get_strict_info(index, faker))
+            for index, path in enumerate(test_feature_files)
+        ]
+        result = list(
+            test_synchronizer._synchronize_features(
+                parsed_features=parsed_features, create_db_features=False, batch_size=2
+            )
+        )
+        assert [x[0] for x in result] == parsed_features
+        assert storage_manager.write_features.call_count == 2
+
+    def test_not_released_feature_not_synchronized_in_batch(
+        self, test_synchronizer: OverhaveSynchronizer, test_feature_files: list[Path], faker: Faker
+    ) -> None:
+        storage_manager = _get_not_released_storage_manager()
+        test_synchronizer._storage_manager = storage_manager
+        parsed_feature = ParsedFeature(path=test_feature_files[0], text=faker.text(), info=_get_strict_info(1, faker))
+        result = list(
+            test_synchronizer._synchronize_features(
+                parsed_features=[parsed_feature], create_db_features=False, batch_size=10
+            )
+        )
+        assert result == [(parsed_feature, None)]
+        storage_manager.write_features.assert_called_once_with(creation_tasks=[], update_tasks=[])
+
+    def test_not_released_feature_not_synchronized(
+        self, test_synchronizer: OverhaveSynchronizer, test_feature_files: list[Path], faker: Faker
+    ) -> None:
+        storage_manager = _get_not_released_storage_manager()
+        test_synchronizer._storage_manager = storage_manager
+        parsed_feature = ParsedFeature(path=test_feature_files[0], text=faker.text(), info=_get_strict_info(1, faker))
+        feature_id = OverhaveSynchronizer._synchronize_feature(
+            test_synchronizer, parsed_feature=parsed_feature, create_db_features=False
+        )
+        assert feature_id is None
+        storage_manager.update_db_feature.assert_not_called()
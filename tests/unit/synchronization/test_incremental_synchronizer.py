@@ -0,0 +1,103 @@
+from pathlib import Path
+from unittest import mock
+
+from faker import Faker
+
+from overhave import OverhaveFileSettings
+from overhave.entities import GitDiffPaths
+from overhave.synchronization import OverhaveSynchronizer, SynchronizationManifest
+
+
+class TestIncrementalSynchronizer:
+    """Unit tests for :class:`OverhaveSynchronizer` incremental mode."""
+
+    def test_manifest_created(
+        self,
+        test_synchronizer: OverhaveSynchronizer,
+        test_file_settings: OverhaveFileSettings,
+        test_feature_files: list[Path],
+    ) -> None:
+        test_synchronizer.synchronize(incremental=True)
+        assert test_synchronizer._synchronize_feature.call_count == len(test_feature_files)  # type: ignore
+        manifest = SynchronizationManifest.load(test_file_settings.sync_manifest_path)
+        assert set(manifest.entries) == {
+            path.relative_to(test_file_settings.features_dir).as_posix() for path in test_feature_files
+        }
+        assert not manifest.pending
+
+    def test_unchanged_files_skipped(
+        self, test_synchronizer: OverhaveSynchronizer, test_feature_files: list[Path], faker: Faker
+    ) -> None:
+        test_synchronizer.synchronize(incremental=True)
+        test_synchronizer._synchronize_feature.reset_mock()  # type: ignore
+        test_synchronizer.synchronize(incremental=True)
+        test_synchronizer._synchronize_feature.assert_not_called()  # type: ignore
+
+        test_feature_files[0].write_text(test_feature_files[0].read_text() + faker.word())
+        test_synchronizer.synchronize(incremental=True)
+        test_synchronizer._synchronize_feature.assert_called_once()  # type: ignore
+
+    def test_touched_file_with_same_content_skipped(
+        self, test_synchronizer: OverhaveSynchronizer, test_feature_files: list[Path]
+    ) -> None:
+        test_synchronizer.synchronize(incremental=True)
+        test_synchronizer._synchronize_feature.reset_mock()  # type: ignore
+        test_feature_files[0].write_text(test_feature_files[0].read_text())
+        test_synchronizer.synchronize(incremental=True)
+        test_synchronizer._synchronize_feature.assert_not_called()  # type: ignore
+
+    def test_not_synchronized_file_pending(
+        self,
+        test_synchronizer: OverhaveSynchronizer,
+        test_file_settings: OverhaveFileSettings,
+        test_feature_files: list[Path],
+    ) -> None:
+        test_synchronizer._synchronize_feature.return_value = None  # type: ignore
+        test_synchronizer.synchronize(incremental=True)
+        manifest = SynchronizationManifest.load(test_file_settings.sync_manifest_path)
+        assert not manifest.entries
+        assert len(manifest.pending) == len(test_feature_files)
+
+        test_synchronizer._synchronize_feature.reset_mock()  # type: ignore
+        test_synchronizer.synchronize(incremental=True)
+        assert test_synchronizer._synchronize_feature.call_count == len(test_feature_files)  # type: ignore
+
+    def test_deleted_file_removed_from_manifest(
+        self,
+        test_synchronizer: OverhaveSynchronizer,
+        test_file_settings: OverhaveFileSettings,
+        test_feature_files: list[Path],
+    ) -> None:
+        test_synchronizer.synchronize(incremental=True)
+        test_feature_files[0].unlink()
+        test_synchronizer.synchronize(incremental=True)
+        manifest = SynchronizationManifest.load(test_file_settings.sync_manifest_path)
+        assert len(manifest.entries) == len(test_feature_files) - 1
+
+    def test_git_diff_used(
+        self,
+        test_synchronizer: OverhaveSynchronizer,
+        test_file_settings: OverhaveFileSettings,
+        test_feature_files: list[Path],
+        faker: Faker,
+    ) -> None:
+        git_initializer = mock.MagicMock()
+        git_initializer.head_commit = "first"
+        test_synchronizer._git_initializer = git_initializer
+        test_synchronizer.synchronize(pull_repository=True, incremental=True)
+        git_initializer.get_diff_paths.assert_not_called()
+        assert SynchronizationManifest.load(test_file_settings.sync_manifest_path).head == "first"
+
+        test_synchronizer._synchronize_feature.reset_mock()  # type: ignore
+        for feature_file in test_feature_files[:2]:
+            feature_file.write_text(faker.text())
+        git_initializer.head_commit = "second"
+        git_initializer.get_diff_paths.return_value = GitDiffPaths(
+            changed=[test_feature_files[1]], deleted=[test_feature_files[2]]
+        )
+        test_synchronizer.synchronize(pull_repository=True, incremental=True)
+        git_initializer.get_diff_paths.assert_called_once_with(from_commit="first", to_commit="second")
+        test_synchronizer._synchronize_feature.assert_called_once()  # type: ignore
+        manifest = SynchronizationManifest.load(test_file_settings.sync_manifest_path)
+        assert manifest.head == "second"
+        assert len(manifest.entries) == len(test_feature_files) - 1
@@ -0,0 +1,61 @@
+import json
+from pathlib import Path
+
+import py
+from faker import Faker
+import pytest
+
+from overhave import OverhaveTestSettings
+from overhave.test_execution import PytestRunner
+from overhave.test_execution.batch import BatchOutcomeRecorder, execute_pytest_job, split_allure_results
+
+_PASSED_TEST = "import allure\n\ndef test_passed():\n    allure.attach('passed', name='text')\n"
+_FAILED_TEST = "def test_failed():\n    assert False\n"
+
+
+@pytest.fixture()
+def test_batch_runs(tmpdir: py.path.local, faker: Faker) -> dict[int, Path]:
+    first_run_id, second_run_id = faker.unique.random_int(min=10**6, max=10**7), faker.unique.random_int(
+        min=10**6, max=10**7
+    )
+    batch_dir = Path(tmpdir) / "batch"
+    batch_dir.mkdir()
+    runs: dict[int, Path] = {}
+    for test_run_id, content in ((first_run_id, _PASSED_TEST), (second_run_id, _FAILED_TEST)):
+        fixture_file = batch_dir / f"test_run_{test_run_id}.py"
+        fixture_file.write_text(content)
+        runs[test_run_id] = fixture_file
+    return runs
+
+
+class TestBatchExecution:
+    """Unit tests for execution of several test runs in one pytest session."""
+
+    def test_batch_outcomes_and_results(self, tmpdir: py.path.local, test_batch_runs: dict[int, Path]) -> None:
+        module_to_run = {file.stem: test_run_id for test_run_id, file in test_batch_runs.items()}
+        results_dir = Path(tmpdir) / "results"
+        job = PytestRunner(OverhaveTestSettings()).get_batch_job(
+            fixture_files=[file.as_posix() for file in test_batch_runs.values()],
+            alluredir=results_dir.as_posix(),
+            module_to_run=module_to_run,
+        )
+        result = execute_pytest_job(job)
+        assert result.return_code == 1
+        passed_run_id, failed_run_id = test_batch_runs
+        assert result.succeeded_runs == {passed_run_id}
+
+        run_results_dirs = split_allure_results(results_dir=results_dir, module_to_run=module_to_run)
+        assert set(run_results_dirs) == set(test_batch_runs)
+        for test_run_id, expected_status in ((passed_run_id, "passed"), (failed_run_id, "failed")):
+            results = [json.loads(x.read_text()) for x in run_results_dirs[test_run_id].glob("*-result.json")]
+            assert [result["status"] for result in results] == [expected_status]
+        attachments = {
+            test_run_id: [x.read_text() for x in run_results_dir.glob("*-attachment*")]
+            for test_run_id, run_results_dir in run_results_dirs.items()
+        }
+        assert "passed" in attachments[passed_run_id]
+        assert "passed" not in attachments[failed_run_id]
+
+    def test_not_executed_run_is_not_succeeded(self) -> None:
+        recorder = BatchOutcomeRecorder(module_to_run={"test_run_1": 1})
+        assert not recorder.is_succeeded(1)
@@ -0,0 +1,136 @@
+from pathlib import Path
+from typing import Iterator
+from unittest import mock
+
+import pytest
+
+from overhave.db import TestRunStatus
+from overhave.test_execution.executor import TestExecutor
+from overhave.test_execution.worker_pool import PytestWorkerError
+
+_MISSING_RUN_ID = 2
+
+
+def _compile_context(test_run_id: int) -> mock.MagicMock:
+    if test_run_id == _MISSING_RUN_ID:
+        raise RuntimeError("Test run not found!")
+    return mock.MagicMock()
+
+
+def _get_statuses(test_run_storage: mock.MagicMock) -> dict[int, TestRunStatus]:
+    return {x.kwargs["run_id"]: x.kwargs["status"] for x in test_run_storage.set_run_status.call_args_list}
+
+
+@pytest.fixture()
+def test_run_storage() -> mock.MagicMock:
+    return mock.MagicMock()
+
+
+@pytest.fixture()
+def workspace_manager() -> mock.MagicMock:
+    manager = mock.MagicMock()
+    manager.create.return_value = Path("batch")
+    return manager
+
+
+@pytest.fixture()
+def worker_pool() -> mock.MagicMock:
+    pool = mock.MagicMock()
+    pool.run_jobs.side_effect = lambda jobs: [(index, PytestWorkerError("Worker died")) for index, _ in jobs]
+    return pool
+
+
+@pytest.fixture()
+def test_executor(
+    test_run_storage: mock.MagicMock, workspace_manager: mock.MagicMock, worker_pool: mock.MagicMock
+) -> Iterator[TestExecutor]:
+    executor = TestExecutor(
+        file_settings=mock.MagicMock(),
+        test_settings=mock.MagicMock(),
+        feature_storage=mock.MagicMock(),
+        scenario_storage=mock.MagicMock(),
+        test_run_storage=test_run_storage,
+        file_manager=mock.MagicMock(),
+        test_runner=mock.MagicMock(),
+        report_manager=mock.MagicMock(),
+        workspace_manager=workspace_manager,
+        metric_container=mock.MagicMock(),
+    )
+    with mock.patch.object(executor, "_compile_context", side_effect=_compile_context):
+        yield executor
+
+
+class TestTestExecutor:
+    """Unit tests for :class:`TestExecutor` with not existing test runs."""
+
+    @mock.patch("overhave.test_execution.executor.execute_pytest_job", side_effect=RuntimeError("Pytest failed"))
+    def test_missing_run_excluded_from_batch(
+        self,
+        execute_pytest_job: mock.MagicMock,
+        test_executor: TestExecutor,
+        test_run_storage: mock.MagicMock,
+        workspace_manager: mock.MagicMock,
+    ) -> None:
+        test_executor.execute_tests([1, _MISSING_RUN_ID, 3])
+        execute_pytest_job.assert_called_once()
+        assert _get_statuses(test_run_storage) == {
+            1: TestRunStatus.INTERNAL_ERROR,
+            _MISSING_RUN_ID: TestRunStatus.INTERNAL_ERROR,
+            3: TestRunStatus.INTERNAL_ERROR,
+        }
+        traceback_by_run = {
+            x.kwargs["run_id"]: x.kwargs["traceback"]
+            for x in test_run_storage.set_run_status.call_args_list
+            if "traceback" in x.kwargs
+        }
+        assert traceback_by_run == {1: "Pytest failed", _MISSING_RUN_ID: "Test run not found!", 3: "Pytest failed"}
+        workspace_manager.release.assert_called_once_with(Path("batch"))
+
+    @mock.patch("overhave.test_execution.executor.execute_pytest_job")
+    def test_batch_without_runs_not_executed(
+        self,
+        execute_pytest_job: mock.MagicMock,
+        test_executor: TestExecutor,
+        test_run_storage: mock.MagicMock,
+        workspace_manager: mock.MagicMock,
+    ) -> None:
+        test_executor.execute_tests([_MISSING_RUN_ID])
+        execute_pytest_job.assert_not_called()
+        workspace_manager.create.assert_not_called()
+        assert _get_statuses(test_run_storage) == {_MISSING_RUN_ID: TestRunStatus.INTERNAL_ERROR}
+
+    def test_missing_run_not_submitted_to_worker_pool(
+        self,
+        test_executor: TestExecutor,
+        test_run_storage: mock.MagicMock,
+        workspace_manager: mock.MagicMock,
+        worker_pool: mock.MagicMock,
+    ) -> None:
+        test_executor._execute_in_worker_pool(worker_pool=worker_pool, batches=[[1], [_MISSING_RUN_ID], [3]])
+        assert worker_pool.run_jobs.call_count == 1
+        assert workspace_manager.create.call_count == 2
+        assert workspace_manager.release.call_count == 2
+        assert set(_get_statuses(test_run_storage).values()) == {TestRunStatus.INTERNAL_ERROR}
+
+    def test_workspace_creation_error(
+        self,
+        test_executor: TestExecutor,
+        test_run_storage: mock.MagicMock,
+        workspace_manager: mock.MagicMock,
+        worker_pool: mock.MagicMock,
+    ) -> None:
+        workspace_manager.create.side_effect = [Path("batch"), OSError("No space left on device")]
+        test_executor._execute_in_worker_pool(worker_pool=worker_pool, batches=[[1], [3]])
+        workspace_manager.release.assert_called_once_with(Path("batch"))
+        assert _get_statuses(test_run_storage) == {1: TestRunStatus.INTERNAL_ERROR, 3: TestRunStatus.INTERNAL_ERROR}
+
+    def test_prepared_batches_released_on_error(
+        self, test_executor: TestExecutor, test_run_storage: mock.MagicMock, workspace_manager: mock.MagicMock
+    ) -> None:
+        worker_pool = mock.MagicMock()
+        test_run_storage.set_run_status.side_effect = [None, *[ConnectionError("Database is unavailable")] * 2, None]
+        with pytest.raises(ConnectionError):
+            test_executor._execute_in_worker_pool(worker_pool=worker_pool, batches=[[1], [3]])
+        worker_pool.run_jobs.assert_not_called()
+        workspace_manager.release.assert_called_once_with(Path("batch"))
+        assert _get_statuses(test_run_storage)[1] is TestRunStatus.INTERNAL_ERROR
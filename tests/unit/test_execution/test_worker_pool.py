@@ -0,0 +1,89 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+import py
+import pytest
+
+from overhave import OverhaveTestSettings
+from overhave.test_execution import PytestRunner, PytestWorkerError, PytestWorkerPool
+from overhave.test_execution.batch import PytestJob
+
+_TESTS = {
+    "passed": "def test_passed():\n    assert True\n",
+    "failed": "def test_failed():\n    assert False\n",
+    "died": "import os\n\ndef test_died():\n    os._exit(1)\n",
+}
+
+
+@pytest.fixture()
+def test_settings() -> OverhaveTestSettings:
+    return OverhaveTestSettings(worker_pool_size=2, worker_max_runs=1)
+
+
+@pytest.fixture()
+def test_worker_pool(test_settings: OverhaveTestSettings) -> Iterator[PytestWorkerPool]:
+    worker_pool = PytestWorkerPool(settings=test_settings, warm_up=lambda: None)
+    yield worker_pool
+    worker_pool.shutdown()
+
+
+@pytest.fixture()
+def test_jobs(tmpdir: py.path.local, test_settings: OverhaveTestSettings) -> dict[str, PytestJob]:
+    jobs = {}
+    for test_run_id, (name, content) in enumerate(_TESTS.items(), start=1):
+        fixture_file = Path(tmpdir) / f"test_pool_run_{name}.py"
+        fixture_file.write_text(content)
+        jobs[name] = PytestRunner(test_settings).get_batch_job(
+            fixture_files=[fixture_file.as_posix()],
+            alluredir=(Path(tmpdir) / name).as_posix(),
+            module_to_run={fixture_file.stem: test_run_id},
+        )
+    return jobs
+
+
+class TestPytestWorkerPool:
+    """Unit tests for :class:`PytestWorkerPool`."""
+
+    def test_run_jobs(self, test_worker_pool: PytestWorkerPool, test_jobs: dict[str, PytestJob]) -> None:
+        results = dict(test_worker_pool.run_jobs((name, job) for name, job in test_jobs.items()))
+        assert set(results) == set(_TESTS)
+        assert results["passed"].succeeded_runs == {1}  # type: ignore[union-attr]
+        assert results["failed"].succeeded_runs == frozenset()  # type: ignore[union-attr]
+        assert results["failed"].return_code == 1  # type: ignore[union-attr]
+        assert isinstance(results["died"], PytestWorkerError)
+
+    def test_workers_recycled(self, test_worker_pool: PytestWorkerPool, test_jobs: dict[str, PytestJob]) -> None:
+        for _ in range(2):
+            results = dict(test_worker_pool.run_jobs([("passed", test_jobs["passed"])]))
+            assert results["passed"].succeeded_runs == {1}  # type: ignore[union-attr]
+        assert len(test_worker_pool._workers) == test_worker_pool.size
+
+    def test_pool_shared_by_threads(self, test_worker_pool: PytestWorkerPool, test_jobs: dict[str, PytestJob]) -> None:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(lambda: dict(test_worker_pool.run_jobs([("passed", test_jobs["passed"])])))
+                for _ in range(4)
+            ]
+            results = [future.result(timeout=60) for future in futures]
+        assert all(x["passed"].succeeded_runs == {1} for x in results)  # type: ignore[union-attr]
+        assert len(test_worker_pool._workers) == test_worker_pool.size
+
+    def test_workers_forked_by_spawner(
+        self, tmpdir: py.path.local, test_settings: OverhaveTestSettings, test_worker_pool: PytestWorkerPool
+    ) -> None:
+        ppid_file = Path(tmpdir) / "ppid"
+        fixture_file = Path(tmpdir) / "test_pool_run_ppid.py"
+        fixture_file.write_text(
+            f"import os\n\ndef test_ppid():\n    open({ppid_file.as_posix()!r}, 'w').write(str(os.getppid()))\n"
+        )
+        job = PytestRunner(test_settings).get_batch_job(
+            fixture_files=[fixture_file.as_posix()],
+            alluredir=(Path(tmpdir) / "ppid_results").as_posix(),
+            module_to_run={fixture_file.stem: 1},
+        )
+        test_worker_pool.start()
+        results = dict(test_worker_pool.run_jobs([("ppid", job)]))
+        assert results["ppid"].succeeded_runs == {1}  # type: ignore[union-attr]
+        assert int(ppid_file.read_text()) not in (os.getpid(), 1)
@@ -0,0 +1,162 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+import redis
+
+from overhave.transport import EmulationData, EmulationTask, RedisConsumer, RedisStream
+from overhave.transport.redis.reclaimer import RedisReclaimer
+from overhave.transport.redis.settings import BaseRedisSettings
+
+_MESSAGE = EmulationTask(data=EmulationData(emulation_run_id=1)).message
+
+
+def _get_pending(message_id: str, times_delivered: int) -> dict[str, str | int]:
+    return {
+        "message_id": message_id,
+        "consumer": "cg-emulation.c1",
+        "time_since_delivered": 600000,
+        "times_delivered": times_delivered,
+    }
+
+
+class TestReliableRedisConsumer:
+    """Unit tests for :class:`RedisConsumer` in reliable delivery mode."""
+
+    @pytest.fixture()
+    def test_settings(self) -> BaseRedisSettings:
+        return BaseRedisSettings(reliable_delivery=True, max_deliveries=3, claim_idle_timeout=timedelta(minutes=1))
+
+    @pytest.fixture()
+    def mocked_database(self) -> mock.MagicMock:
+        return mock.MagicMock()
+
+    @pytest.fixture()
+    def mocked_stream(self, mocked_database: mock.MagicMock) -> mock.MagicMock:
+        stream: mock.MagicMock = mocked_database.consumer_group.return_value.emulation
+        stream.pending.return_value = [_get_pending("1-0", 1), _get_pending("2-0", 3), _get_pending("3-0", 2)]
+        stream.claim.side_effect = lambda *ids, **_: [(x.encode(), _MESSAGE) for x in ids]
+        return stream
+
+    @pytest.fixture()
+    def test_consumer(self, test_settings: BaseRedisSettings, mocked_database: mock.MagicMock) -> RedisConsumer:
+        return RedisConsumer(
+            settings=test_settings,
+            stream_name=RedisStream.EMULATION,
+            database=mocked_database,
+            metric_container=mock.MagicMock(),
+        )
+
+    def test_messages_not_acknowledged_on_read(
+        self, test_consumer: RedisConsumer, mocked_stream: mock.MagicMock
+    ) -> None:
+        mocked_stream.read.return_value = [(b"1-0", _MESSAGE)]
+        with test_consumer:
+            assert [x.message_id for x in test_consumer.consume(count=1)] == ["1-0"]
+            mocked_stream.pending.assert_not_called()
+        mocked_stream.ack.assert_not_called()
+
+    def test_consumer_name_unique(self, test_consumer: RedisConsumer, mocked_database: mock.MagicMock) -> None:
+        test_consumer.consume(count=1)
+        consumer_name = mocked_database.consumer_group.call_args.kwargs["consumer"]
+        assert consumer_name.startswith("cg-emulation.")
+        assert consumer_name != "cg-emulation.c1"
+
+    def test_reclaim(
+        self, test_consumer: RedisConsumer, mocked_database: mock.MagicMock, mocked_stream: mock.MagicMock
+    ) -> None:
+        messages = test_consumer.reclaim(count=10)
+        assert [x.message_id for x in messages] == ["1-0", "3-0"]
+        mocked_stream.pending.assert_called_once_with(count=10, idle=60000)
+        mocked_database.xadd.assert_called_once_with("emulation-dead-letter", {**_MESSAGE, b"message_id": b"2-0"})
+        mocked_stream.ack.assert_called_once_with(b"2-0")
+
+    def test_not_claimed_messages_not_moved_to_dead_letter(
+        self, test_consumer: RedisConsumer, mocked_database: mock.MagicMock, mocked_stream: mock.MagicMock
+    ) -> None:
+        mocked_stream.pending.return_value = [_get_pending("2-0", 3), _get_pending("4-0", 3)]
+        mocked_stream.claim.side_effect = lambda *ids, **_: [(b"4-0", None)]
+        assert not test_consumer.reclaim(count=10)
+        mocked_database.xadd.assert_not_called()
+        mocked_stream.ack.assert_not_called()
+
+    def test_consumer_deleted_on_exit(
+        self, test_consumer: RedisConsumer, mocked_database: mock.MagicMock, mocked_stream: mock.MagicMock
+    ) -> None:
+        mocked_stream.pending.return_value = []
+        with test_consumer:
+            test_consumer.consume(count=1)
+        consumer_name = mocked_database.consumer_group.call_args.kwargs["consumer"]
+        mocked_stream.pending.assert_called_once_with(count=1, consumer=consumer_name)
+        mocked_database.xgroup_delconsumer.assert_called_once_with("emulation", "cg-emulation", consumer_name)
+
+    def test_consumer_with_pending_messages_kept_on_exit(
+        self, test_consumer: RedisConsumer, mocked_database: mock.MagicMock, mocked_stream: mock.MagicMock
+    ) -> None:
+        with test_consumer:
+            test_consumer.consume(count=1)
+        mocked_database.xgroup_delconsumer.assert_not_called()
+
+    def test_consumer_kept_on_error(
+        self, test_consumer: RedisConsumer, mocked_database: mock.MagicMock, mocked_stream: mock.MagicMock
+    ) -> None:
+        mocked_stream.pending.return_value = []
+        with pytest.raises(RuntimeError), test_consumer:
+            raise RuntimeError
+        mocked_database.xgroup_delconsumer.assert_not_called()
+
+    def test_reclaimer_tick(
+        self, test_consumer: RedisConsumer, mocked_database: mock.MagicMock, mocked_stream: mock.MagicMock
+    ) -> None:
+        reclaimer = RedisReclaimer(test_consumer)
+        reclaimer.track(["5-0"])
+        reclaimer.tick()
+        assert mocked_database.xclaim.call_args.args[3:] == (0, ["5-0"])
+        assert [x.message_id for x in reclaimer.take(1)] == ["1-0"]
+        reclaimer.tick()
+        mocked_stream.pending.assert_called_once()
+        assert [x.message_id for x in reclaimer.take(10)] == ["3-0"]
+        assert set(mocked_database.xclaim.call_args.args[4]) == {"1-0", "3-0", "5-0"}
+
+
+class TestRedisConsumerHandles:
+    """Unit tests for :class:`RedisConsumer` consumer group and stream handles."""
+
+    @pytest.fixture()
+    def mocked_database(self) -> mock.MagicMock:
+        database = mock.MagicMock()
+        database.consumer_group.return_value.emulation.read.return_value = [(b"1-0", _MESSAGE)]
+        return database
+
+    @pytest.fixture()
+    def test_consumer(self, mocked_database: mock.MagicMock) -> RedisConsumer:
+        return RedisConsumer(
+            settings=BaseRedisSettings(),
+            stream_name=RedisStream.EMULATION,
+            database=mocked_database,
+            metric_container=mock.MagicMock(),
+        )
+
+    def test_consumer_group_created_once(self, test_consumer: RedisConsumer, mocked_database: mock.MagicMock) -> None:
+        for _ in range(3):
+            assert test_consumer.consume(count=1)
+        mocked_database.consumer_group.assert_called_once()
+        mocked_database.consumer_group.return_value.create.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "error", [redis.exceptions.ConnectionError("Connection lost"), redis.exceptions.ResponseError("NOGROUP")]
+    )
+    def test_consumer_group_recreated(
+        self, test_consumer: RedisConsumer, mocked_database: mock.MagicMock, error: Exception
+    ) -> None:
+        stream = mocked_database.consumer_group.return_value.emulation
+        stream.read.side_effect = [error, [(b"1-0", _MESSAGE)]]
+        assert [x.message_id for x in test_consumer.consume(count=1)] == ["1-0"]
+        assert mocked_database.consumer_group.return_value.create.call_count == 2
+
+    def test_unexpected_error_raised(self, test_consumer: RedisConsumer, mocked_database: mock.MagicMock) -> None:
+        stream = mocked_database.consumer_group.return_value.emulation
+        stream.read.side_effect = redis.exceptions.ResponseError("WRONGTYPE")
+        with pytest.raises(redis.exceptions.ResponseError):
+            test_consumer.consume(count=1)
+        mocked_database.consumer_group.return_value.create.assert_called_once()
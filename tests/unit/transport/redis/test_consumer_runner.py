@@ -0,0 +1,166 @@
+import threading
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Sequence
+from unittest import mock
+
+import pytest
+
+from overhave.transport import (
+    EmulationData,
+    EmulationTask,
+    RedisConsumerRunner,
+    ReportData,
+    ReportTask,
+    TestRunData,
+    TestRunTask,
+)
+from overhave.transport.redis.objects import RedisUnreadData
+from overhave.transport.redis.settings import BaseRedisSettings
+
+
+def _get_unread_data(task: TestRunTask | EmulationTask | ReportTask, index: int = 1) -> RedisUnreadData:
+    return RedisUnreadData(message_id=f"{index}-0".encode(), message=task.message)
+
+
+class TestRedisConsumerRunner:
+    """Unit tests for :class:`RedisConsumerRunner`."""
+
+    @pytest.fixture()
+    def test_tasks(self) -> list[TestRunTask | EmulationTask]:
+        return [
+            TestRunTask(data=TestRunData(test_run_id=1)),
+            EmulationTask(data=EmulationData(emulation_run_id=1)),
+            TestRunTask(data=TestRunData(test_run_id=2)),
+        ]
+
+    @pytest.fixture()
+    def mocked_consumer(self, test_tasks: list[TestRunTask | EmulationTask]) -> mock.MagicMock:
+        consumer = mock.MagicMock()
+        consumer.settings = BaseRedisSettings()
+        consumer.__iter__.return_value = iter([[_get_unread_data(task) for task in test_tasks]])
+        return consumer
+
+    def test_process_tasks_one_by_one(
+        self, mocked_consumer: mock.MagicMock, test_tasks: list[TestRunTask | EmulationTask]
+    ) -> None:
+        mapping = {TestRunTask: mock.MagicMock(), EmulationTask: mock.MagicMock()}
+        RedisConsumerRunner(consumer=mocked_consumer, mapping=mapping).run()  # type: ignore
+        assert mapping[TestRunTask].call_args_list == [mock.call(test_tasks[0]), mock.call(test_tasks[2])]
+        mapping[EmulationTask].assert_called_once_with(test_tasks[1])
+
+    def test_process_tasks_by_batch(
+        self, mocked_consumer: mock.MagicMock, test_tasks: list[TestRunTask | EmulationTask]
+    ) -> None:
+        mapping = {TestRunTask: mock.MagicMock(), EmulationTask: mock.MagicMock()}
+        batch_mapping = {TestRunTask: mock.MagicMock()}
+        RedisConsumerRunner(
+            consumer=mocked_consumer, mapping=mapping, batch_mapping=batch_mapping  # type: ignore
+        ).run()
+        batch_mapping[TestRunTask].assert_called_once_with([test_tasks[0], test_tasks[2]])
+        mapping[TestRunTask].assert_not_called()
+        mapping[EmulationTask].assert_called_once_with(test_tasks[1])
+
+    def test_report_task_not_parsed_as_test_run_task(self, mocked_consumer: mock.MagicMock) -> None:
+        tasks: list[TestRunTask | EmulationTask | ReportTask] = [
+            ReportTask(data=ReportData(test_run_id=1, results_dir=Path("results"), feature_type="feature_type")),
+            TestRunTask(data=TestRunData(test_run_id=1)),
+        ]
+        mocked_consumer.__iter__.return_value = iter([[_get_unread_data(task) for task in tasks]])
+        mapping = {ReportTask: mock.MagicMock(), TestRunTask: mock.MagicMock()}
+        RedisConsumerRunner(consumer=mocked_consumer, mapping=mapping).run()  # type: ignore
+        mapping[ReportTask].assert_called_once_with(tasks[0])
+        mapping[TestRunTask].assert_called_once_with(tasks[1])
+
+
+class TestConcurrentRedisConsumerRunner:
+    """Unit tests for :class:`RedisConsumerRunner` with concurrent tasks processing."""
+
+    @pytest.fixture()
+    def test_tasks(self) -> list[TestRunTask]:
+        return [TestRunTask(data=TestRunData(test_run_id=x)) for x in range(1, 5)]
+
+    @pytest.fixture()
+    def test_settings(self) -> BaseRedisSettings:
+        return BaseRedisSettings(max_in_flight=2, read_count=4, block_timeout=timedelta(milliseconds=10))
+
+    @pytest.fixture()
+    def mocked_consumer(self, test_settings: BaseRedisSettings, test_tasks: list[TestRunTask]) -> mock.MagicMock:
+        consumer = mock.MagicMock()
+        consumer.settings = test_settings
+        messages = [_get_unread_data(task, index) for index, task in enumerate(test_tasks, start=1)]
+
+        def _consume(count: int) -> Sequence[RedisUnreadData]:
+            consumed = messages[:count]
+            del messages[:count]
+            return consumed
+
+        consumer.consume.side_effect = _consume
+        return consumer
+
+    @staticmethod
+    def _get_runner(consumer: mock.MagicMock, handler: mock.MagicMock, **kwargs: Any) -> RedisConsumerRunner:
+        runner = RedisConsumerRunner(consumer=consumer, mapping={TestRunTask: handler}, **kwargs)
+
+        def _ack(*message_ids: str) -> None:
+            if consumer.ack.call_count == 4:
+                runner.stop()
+
+        consumer.ack.side_effect = _ack
+        return runner
+
+    def test_tasks_processed_concurrently(self, mocked_consumer: mock.MagicMock, test_tasks: list[TestRunTask]) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+        handler = mock.MagicMock(side_effect=lambda _: barrier.wait())
+        self._get_runner(mocked_consumer, handler).run()
+        assert sorted(x.args[0].data.test_run_id for x in handler.call_args_list) == [1, 2, 3, 4]
+        assert not barrier.broken
+        assert sorted(x.args for x in mocked_consumer.ack.call_args_list) == [("1-0",), ("2-0",), ("3-0",), ("4-0",)]
+        assert all(x.kwargs["count"] <= 2 for x in mocked_consumer.consume.call_args_list)
+
+    def test_failed_task_acknowledged(self, mocked_consumer: mock.MagicMock, test_tasks: list[TestRunTask]) -> None:
+        handler = mock.MagicMock(side_effect=ValueError("Something wrong"))
+        self._get_runner(mocked_consumer, handler).run()
+        assert handler.call_count == len(test_tasks)
+        assert mocked_consumer.ack.call_count == len(test_tasks)
+
+    def test_in_flight_tasks_drained_on_stop(self, mocked_consumer: mock.MagicMock) -> None:
+        started = threading.Event()
+        release = threading.Event()
+        handled: list[TestRunTask] = []
+
+        def _handle(task: TestRunTask) -> None:
+            started.set()
+            release.wait(5)
+            handled.append(task)
+
+        runner = RedisConsumerRunner(consumer=mocked_consumer, mapping={TestRunTask: _handle})  # type: ignore
+        thread = threading.Thread(target=runner.run)
+        thread.start()
+        assert started.wait(5)
+        runner.stop()
+        release.set()
+        thread.join(5)
+        assert not thread.is_alive()
+        assert sorted(x.data.test_run_id for x in handled) == [1, 2]
+        assert mocked_consumer.consume.call_count == 1
+        assert mocked_consumer.ack.call_count == len(handled)
+
+    def test_failed_task_not_acknowledged_in_reliable_mode(
+        self, mocked_consumer: mock.MagicMock, test_settings: BaseRedisSettings, test_tasks: list[TestRunTask]
+    ) -> None:
+        mocked_consumer.settings = test_settings.model_copy(update={"max_in_flight": 1, "reliable_delivery": True})
+        handler = mock.MagicMock(side_effect=lambda task: task.data.test_run_id % 2 or 1 / 0)
+        runner = RedisConsumerRunner(consumer=mocked_consumer, mapping={TestRunTask: handler})
+        messages = [_get_unread_data(task, index) for index, task in enumerate(test_tasks, start=1)]
+
+        def _consume(count: int) -> list[RedisUnreadData]:
+            if mocked_consumer.consume.call_count > 1:
+                runner.stop()
+                return []
+            return messages[:count]
+
+        mocked_consumer.consume.side_effect = _consume
+        runner.run()
+        assert handler.call_count == len(test_tasks)
+        assert sorted(x.args for x in mocked_consumer.ack.call_args_list) == [("1-0",), ("3-0",)]
@@ -0,0 +1,65 @@
+from unittest import mock
+
+import pytest
+import redis
+
+from overhave.transport import EmulationData, EmulationTask, RedisProducer, RedisStream, TestRunData, TestRunTask
+from overhave.transport.redis.settings import BaseRedisSettings
+
+
+class TestRedisProducer:
+    """Unit tests for :class:`RedisProducer`."""
+
+    @pytest.fixture()
+    def test_tasks(self) -> list[TestRunTask | EmulationTask]:
+        return [
+            TestRunTask(data=TestRunData(test_run_id=1)),
+            EmulationTask(data=EmulationData(emulation_run_id=1)),
+            TestRunTask(data=TestRunData(test_run_id=2)),
+        ]
+
+    @pytest.fixture()
+    def mocked_database(self) -> mock.MagicMock:
+        return mock.MagicMock()
+
+    @pytest.fixture()
+    def mocked_pipeline(self, mocked_database: mock.MagicMock) -> mock.MagicMock:
+        pipeline: mock.MagicMock = mocked_database.pipeline.return_value.__enter__.return_value
+        return pipeline
+
+    @pytest.fixture()
+    def test_producer(self, mocked_database: mock.MagicMock) -> RedisProducer:
+        return RedisProducer(
+            settings=BaseRedisSettings(stream_max_len=1000),
+            mapping={TestRunTask: RedisStream.TEST, EmulationTask: RedisStream.EMULATION},
+            database=mocked_database,
+            metric_container=mock.MagicMock(),
+        )
+
+    def test_add_tasks(
+        self,
+        test_producer: RedisProducer,
+        mocked_pipeline: mock.MagicMock,
+        test_tasks: list[TestRunTask | EmulationTask],
+    ) -> None:
+        mocked_pipeline.execute.return_value = [b"1-0", redis.exceptions.ResponseError("OOM"), b"2-0"]
+        assert test_producer.add_tasks(test_tasks) == [True, False, True]
+        assert mocked_pipeline.xadd.call_args_list == [
+            mock.call("test", test_tasks[0].message, maxlen=1000),
+            mock.call("emulation", test_tasks[1].message, maxlen=1000),
+            mock.call("test", test_tasks[2].message, maxlen=1000),
+        ]
+        mocked_pipeline.execute.assert_called_once_with(raise_on_error=False)
+
+    def test_add_tasks_connection_error(
+        self,
+        test_producer: RedisProducer,
+        mocked_pipeline: mock.MagicMock,
+        test_tasks: list[TestRunTask | EmulationTask],
+    ) -> None:
+        mocked_pipeline.execute.side_effect = redis.exceptions.ConnectionError
+        assert test_producer.add_tasks(test_tasks) == [False, False, False]
+
+    def test_add_no_tasks(self, test_producer: RedisProducer, mocked_database: mock.MagicMock) -> None:
+        assert test_producer.add_tasks([]) == []
+        mocked_database.pipeline.assert_not_called()
@@ -94,7 +94,7 @@ def test_deletion_result() -> dict[str, Any]:
 def mocked_boto3_client(test_object_dict: dict[str, Any], test_deletion_result: dict[str, Any]) -> mock.MagicMock:
     mocked_client = mock.MagicMock()
     mocked_client.list_buckets.return_value = {"Buckets": []}
-    mocked_client.list_objects.return_value = {"Contents": [test_object_dict]}
+    mocked_client.get_paginator.return_value.paginate.return_value = [{"Contents": [test_object_dict], "KeyCount": 1}]
     mocked_client.delete_objects.return_value = test_deletion_result
     return mocked_client
 
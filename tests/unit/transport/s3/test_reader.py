@@ -0,0 +1,47 @@
+import io
+import zipfile
+
+import pytest
+from faker import Faker
+
+from overhave.transport import S3ObjectReader
+
+
+class TestS3ObjectReader:
+    """Unit tests for :class:`S3ObjectReader`."""
+
+    @pytest.fixture()
+    def test_files(self, faker: Faker) -> dict[str, bytes]:
+        return {f"dir/{faker.unique.word()}.txt": faker.binary(length=faker.random_int(1, 10**5)) for _ in range(5)}
+
+    @pytest.fixture()
+    def test_archive(self, test_files: dict[str, bytes]) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, content in test_files.items():
+                archive.writestr(name, content)
+        return buffer.getvalue()
+
+    def test_zip_members_read_by_ranges(self, test_archive: bytes, test_files: dict[str, bytes]) -> None:
+        ranges: list[tuple[int, int]] = []
+
+        def _get_range(start: int, end: int) -> bytes:
+            ranges.append((start, end))
+            return test_archive[start:][: end - start + 1]
+
+        reader = S3ObjectReader(size=len(test_archive), get_range=_get_range, block_size=1024)
+        archive = zipfile.ZipFile(reader)
+        name, content = next(iter(test_files.items()))
+        assert archive.read(name) == content
+        assert all(end < len(test_archive) for _, end in ranges)
+        assert sum(end - start + 1 for start, end in ranges) < len(test_archive)
+
+    def test_read_after_seek(self, test_archive: bytes) -> None:
+        reader = S3ObjectReader(
+            size=len(test_archive), get_range=lambda start, end: test_archive[start:][: end - start + 1], block_size=16
+        )
+        reader.seek(-10, io.SEEK_END)
+        assert reader.read() == test_archive[-10:]
+        reader.seek(5)
+        assert reader.read(100) == test_archive[5:105]
+        assert reader.read(0) == b""
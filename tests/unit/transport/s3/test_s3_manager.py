@@ -1,5 +1,6 @@
+import io
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from unittest import mock
 
 import botocore.exceptions
@@ -13,7 +14,7 @@ from overhave.transport.s3.manager import (
     InvalidCredentialsError,
     InvalidEndpointError,
 )
-from overhave.transport.s3.models import ObjectModel
+from overhave.transport.s3.models import DeletionSummary, ObjectModel
 
 
 @pytest.mark.parametrize("test_s3_autocreate_buckets", [False, True], indirect=True)
@@ -87,9 +88,27 @@ class TestInitializedS3Manager:
         bucket: OverhaveS3Bucket,
     ) -> None:
         objects = test_initialized_s3_manager.get_bucket_objects(bucket.value)
-        mocked_boto3_client.list_objects.assert_called_once_with(Bucket=bucket.value)
+        mocked_boto3_client.get_paginator.assert_called_once_with("list_objects_v2")
+        mocked_boto3_client.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket=bucket.value, FetchOwner=True, PaginationConfig={"PageSize": 1000}
+        )
         assert objects == [ObjectModel.model_validate(test_object_dict)]
 
+    def test_iter_bucket_objects_paginated(
+        self,
+        test_object_dict: dict[str, Any],
+        mocked_boto3_client: mock.MagicMock,
+        test_initialized_s3_manager: S3Manager,
+        bucket: OverhaveS3Bucket,
+    ) -> None:
+        pages = [
+            {"Contents": [{**test_object_dict, "Key": f"{page}-{i}.zip"} for i in range(3)], "KeyCount": 3}
+            for page in range(2)
+        ]
+        mocked_boto3_client.get_paginator.return_value.paginate.return_value = [*pages, {"KeyCount": 0}]
+        names = [obj.name for obj in test_initialized_s3_manager.iter_bucket_objects(bucket.value)]
+        assert names == [f"{page}-{i}.zip" for page in range(2) for i in range(3)]
+
     def test_upload_file(
         self,
         mocked_boto3_client: mock.MagicMock,
@@ -114,6 +133,127 @@ class TestInitializedS3Manager:
         assert not test_initialized_s3_manager.upload_file(tmp_path, bucket=bucket)
         assert "Could not upload file to s3 cloud!" in caplog.text
 
+    def test_upload_stream(
+        self,
+        mocked_boto3_client: mock.MagicMock,
+        test_s3_manager_settings: OverhaveS3ManagerSettings,
+        test_initialized_s3_manager: S3Manager,
+        bucket: OverhaveS3Bucket,
+        test_filename: str,
+    ) -> None:
+        mocked_boto3_client.create_multipart_upload.return_value = {"UploadId": "upload"}
+        mocked_boto3_client.upload_part.side_effect = lambda **kwargs: {"ETag": str(kwargs["PartNumber"])}
+        chunk_size = test_s3_manager_settings.multipart_chunk_size
+        chunks = [b"a" * (chunk_size // 2)] * 5
+        assert test_initialized_s3_manager.upload_stream(chunks, key=test_filename, bucket=bucket) == sum(
+            len(x) for x in chunks
+        )
+        assert [len(x.kwargs["Body"]) for x in mocked_boto3_client.upload_part.call_args_list] == [
+            chunk_size,
+            chunk_size,
+            chunk_size // 2,
+        ]
+        mocked_boto3_client.complete_multipart_upload.assert_called_once_with(
+            Bucket=bucket.value,
+            Key=test_filename,
+            UploadId="upload",
+            MultipartUpload={"Parts": [{"ETag": str(x), "PartNumber": x} for x in range(1, 4)]},
+        )
+        mocked_boto3_client.abort_multipart_upload.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            botocore.exceptions.ClientError(mock.MagicMock(), mock.MagicMock()),
+            botocore.exceptions.EndpointConnectionError(endpoint_url="http://localhost"),
+            botocore.exceptions.NoCredentialsError(),
+        ],
+    )
+    def test_error_when_upload_stream(
+        self,
+        mocked_boto3_client: mock.MagicMock,
+        test_initialized_s3_manager: S3Manager,
+        bucket: OverhaveS3Bucket,
+        test_filename: str,
+        caplog: LogCaptureFixture,
+        error: Exception,
+    ) -> None:
+        mocked_boto3_client.create_multipart_upload.return_value = {"UploadId": "upload"}
+        mocked_boto3_client.upload_part.side_effect = error
+        assert test_initialized_s3_manager.upload_stream([b"data"], key=test_filename, bucket=bucket) is None
+        assert "Could not upload stream to s3 cloud!" in caplog.text
+        mocked_boto3_client.complete_multipart_upload.assert_not_called()
+        mocked_boto3_client.abort_multipart_upload.assert_called_once_with(
+            Bucket=bucket.value, Key=test_filename, UploadId="upload"
+        )
+
+    def test_upload_stream_aborted_on_chunks_error(
+        self,
+        mocked_boto3_client: mock.MagicMock,
+        test_initialized_s3_manager: S3Manager,
+        bucket: OverhaveS3Bucket,
+        test_filename: str,
+    ) -> None:
+        mocked_boto3_client.create_multipart_upload.return_value = {"UploadId": "upload"}
+
+        def _chunks() -> Iterator[bytes]:
+            yield b"data"
+            raise ValueError("Broken archive")
+
+        with pytest.raises(ValueError):
+            test_initialized_s3_manager.upload_stream(_chunks(), key=test_filename, bucket=bucket)
+        mocked_boto3_client.complete_multipart_upload.assert_not_called()
+        mocked_boto3_client.abort_multipart_upload.assert_called_once_with(
+            Bucket=bucket.value, Key=test_filename, UploadId="upload"
+        )
+
+    def test_open_object(
+        self,
+        mocked_boto3_client: mock.MagicMock,
+        test_initialized_s3_manager: S3Manager,
+        bucket: OverhaveS3Bucket,
+        test_filename: str,
+    ) -> None:
+        content = b"0123456789"
+        mocked_boto3_client.head_object.return_value = {"ContentLength": len(content)}
+
+        def _get_object(**kwargs: str) -> dict[str, io.BytesIO]:
+            start, end = (int(position) for position in kwargs["Range"].removeprefix("bytes=").split("-"))
+            return {"Body": io.BytesIO(content[start:][: end - start + 1])}
+
+        mocked_boto3_client.get_object.side_effect = _get_object
+        reader = test_initialized_s3_manager.open_object(bucket=bucket.value, key=test_filename)
+        assert reader is not None
+        reader.seek(3)
+        assert reader.read(4) == b"3456"
+        mocked_boto3_client.get_object.assert_called_once_with(
+            Bucket=bucket.value, Key=test_filename, Range="bytes=3-9"
+        )
+
+    def test_open_not_existing_object(
+        self,
+        mocked_boto3_client: mock.MagicMock,
+        test_initialized_s3_manager: S3Manager,
+        bucket: OverhaveS3Bucket,
+        test_filename: str,
+    ) -> None:
+        mocked_boto3_client.head_object.side_effect = botocore.exceptions.ClientError(
+            mock.MagicMock(), mock.MagicMock()
+        )
+        assert test_initialized_s3_manager.open_object(bucket=bucket.value, key=test_filename) is None
+
+    def test_open_object_with_connection_error(
+        self,
+        mocked_boto3_client: mock.MagicMock,
+        test_initialized_s3_manager: S3Manager,
+        bucket: OverhaveS3Bucket,
+        test_filename: str,
+    ) -> None:
+        mocked_boto3_client.head_object.side_effect = botocore.exceptions.EndpointConnectionError(
+            endpoint_url="http://localhost"
+        )
+        assert test_initialized_s3_manager.open_object(bucket=bucket.value, key=test_filename) is None
+
     def test_delete_files(
         self,
         test_object_dict: dict[str, Any],
@@ -128,6 +268,21 @@ class TestInitializedS3Manager:
             Bucket=bucket, Delete={"Objects": [{"Key": obj.name} for obj in objects]}
         )
 
+    def test_delete_files_by_batches(
+        self,
+        test_object_dict: dict[str, Any],
+        mocked_boto3_client: mock.MagicMock,
+        test_initialized_s3_manager: S3Manager,
+        bucket: OverhaveS3Bucket,
+    ) -> None:
+        mocked_boto3_client.delete_objects.side_effect = lambda **kwargs: {"Deleted": kwargs["Delete"]["Objects"]}
+        objects = [ObjectModel.model_validate({**test_object_dict, "Key": f"{i}.zip"}) for i in range(1500)]
+        result = test_initialized_s3_manager.delete_bucket_objects(bucket=bucket.value, objects=objects)
+        assert mocked_boto3_client.delete_objects.call_count == 2
+        assert result.deleted is not None
+        assert [obj.name for obj in result.deleted] == [obj.name for obj in objects]
+        assert result.errors == []
+
     def test_delete_files_empty_error(
         self,
         mocked_boto3_client: mock.MagicMock,
@@ -139,6 +294,36 @@ class TestInitializedS3Manager:
             test_initialized_s3_manager.delete_bucket_objects(bucket=bucket.value, objects=[])
         mocked_boto3_client.delete_objects.assert_not_called()
 
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_delete_objects_in_batches(
+        self,
+        test_object_dict: dict[str, Any],
+        mocked_boto3_client: mock.MagicMock,
+        test_initialized_s3_manager: S3Manager,
+        bucket: OverhaveS3Bucket,
+        concurrency: int,
+    ) -> None:
+        def _delete_objects(**kwargs: Any) -> dict[str, Any]:
+            keys = [x["Key"] for x in kwargs["Delete"]["Objects"]]
+            return {
+                "Deleted": [{"Key": key} for key in keys if key != "0.zip"],
+                "Errors": [{"Key": key, "Code": "AccessDenied", "Message": "Denied"} for key in keys if key == "0.zip"],
+            }
+
+        mocked_boto3_client.delete_objects.side_effect = _delete_objects
+        objects = (ObjectModel.model_validate({**test_object_dict, "Key": f"{i}.zip", "Size": 2}) for i in range(2500))
+        summary = test_initialized_s3_manager.delete_objects_in_batches(
+            bucket=bucket.value, objects=objects, concurrency=concurrency
+        )
+        assert sorted(
+            len(x.kwargs["Delete"]["Objects"]) for x in mocked_boto3_client.delete_objects.call_args_list
+        ) == [
+            500,
+            1000,
+            1000,
+        ]
+        assert summary == DeletionSummary(deleted=2499, errors=1, size=4998)
+
     @pytest.mark.parametrize("force", [False, True])
     def test_delete_bucket(
         self,
@@ -150,10 +335,10 @@ class TestInitializedS3Manager:
     ) -> None:
         test_initialized_s3_manager.delete_bucket(bucket.value, force=force)
         if force:
-            mocked_boto3_client.list_objects.assert_called_once_with(Bucket=bucket.value)
+            mocked_boto3_client.get_paginator.assert_called_once_with("list_objects_v2")
             mocked_boto3_client.delete_objects.assert_called_once()
         else:
-            mocked_boto3_client.list_objects.assert_not_called()
+            mocked_boto3_client.get_paginator.assert_not_called()
             mocked_boto3_client.delete_objects.assert_not_called()
         mocked_boto3_client.delete_bucket.assert_called_once_with(Bucket=bucket.value)
 